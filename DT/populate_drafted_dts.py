@@ -2,13 +2,19 @@
 Populate DT drafted CSVs (2024, 2025, 2026) from defensive_stats source.
 Fetches sacks, TFL, QB Hurry stats from defensive_stats_2016_to_2025.
 Standardizes format to match edges drafted files: float notation, 3 trailing commas.
+Stats are read from a draftkit CareerIndex built once from the pivot (draftkit/college_stats.py), so each
+drafted class is joined in one lookup instead of masking the whole pivot per player.
 Run from project root: python DT/populate_drafted_dts.py
 """
-import pandas as pd
 import os
+import sys
+import pandas as pd
 
 # Paths (script may run from project root or DT/)
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from draftkit.college_stats import OUTPUT_COLS, CareerIndex, pivot_defensive_stats
 DT_DIR = os.path.join(PROJECT_ROOT, 'DT')
 DEFENSIVE_STATS_PATH = os.path.join(PROJECT_ROOT, 'data', 'processed', 'defensive_stats_2016_to_2025.csv')
 
@@ -37,43 +43,29 @@ SCHOOL_ALIAS = {
 
 def load_defensive_stats():
     """Load and pivot defensive stats for SACKS, TFL, QB HUR."""
-    df = pd.read_csv(DEFENSIVE_STATS_PATH)
-    stats_to_keep = ['SACKS', 'TFL', 'QB HUR']
-    filtered = df[df['StatType'].isin(stats_to_keep)].copy()
-    filtered['Stat'] = pd.to_numeric(filtered['Stat'], errors='coerce').fillna(0)
-
-    pivot = filtered.pivot_table(
-        index=['Season', 'Player', 'Team'],
-        columns='StatType',
-        values='Stat',
-        aggfunc='sum'
-    ).reset_index()
-    if 'QB HUR' in pivot.columns:
-        pivot = pivot.rename(columns={'QB HUR': 'QB_HUR'})
-    pivot['Team_norm'] = pivot['Team'].map(lambda x: SCHOOL_ALIAS.get(x, x))
-    return pivot
-
-
-def lookup_stats(stats_pivot, player: str, school: str, draft_year: int):
-    """Look up cumulative and final-season stats for a player."""
-    final_season = draft_year - 1
-    school_norm = SCHOOL_ALIAS.get(school, school)
-    player_match = PLAYER_ALIAS.get(player, player)
+    return pivot_defensive_stats(pd.read_csv(DEFENSIVE_STATS_PATH), SCHOOL_ALIAS)
+
+
+def load_career_index():
+    """Career index over the pivoted defensive stats, keyed by (Player, Team_norm)."""
+    return CareerIndex(load_defensive_stats())
 
-    mask = (stats_pivot['Player'] == player_match) & (stats_pivot['Team_norm'] == school_norm)
-    rows = stats_pivot.loc[mask]
-    if rows.empty:
+
+def lookup_stats(index: CareerIndex, player: str, school: str, draft_year: int):
+    """Look up cumulative and final-season stats for a player."""
+    found = index.lookup_one(PLAYER_ALIAS.get(player, player), SCHOOL_ALIAS.get(school, school), draft_year - 1)
+    if found is None:
         return None, None, None, None, None, None
+    return tuple(found[c] for c in OUTPUT_COLS)
+
 
-    cum = rows[rows['Season'] <= final_season]
-    fin = rows[rows['Season'] == final_season]
-    sacks_cum = cum['SACKS'].sum() if 'SACKS' in cum.columns else 0
-    tfl_cum = cum['TFL'].sum() if 'TFL' in cum.columns else 0
-    qbh_cum = cum['QB_HUR'].sum() if 'QB_HUR' in cum.columns else 0
-    sacks_fin = fin['SACKS'].sum() if 'SACKS' in fin.columns else 0
-    tfl_fin = fin['TFL'].sum() if 'TFL' in fin.columns else 0
-    qbh_fin = fin['QB_HUR'].sum() if 'QB_HUR' in fin.columns else 0
-    return sacks_cum, tfl_cum, qbh_cum, sacks_fin, tfl_fin, qbh_fin
+def lookup_class(index: CareerIndex, df: pd.DataFrame) -> pd.DataFrame:
+    """lookup_stats for every row of a drafted class at once (NaN where the player has no stats)."""
+    players = df['Player'].map(lambda p: PLAYER_ALIAS.get(p, p))
+    schools = df['School'].map(lambda s: SCHOOL_ALIAS.get(s, s))
+    found = index.lookup(players, schools, pd.to_numeric(df['Year'], errors='coerce') - 1)
+    found.index = df.index
+    return found
 
 
 def _fmt(val):
@@ -103,7 +95,7 @@ def format_row(row_dict):
     return ','.join(parts)
 
 
-def process_drafted_csv(path: str, stats_pivot: pd.DataFrame) -> str:
+def process_drafted_csv(path: str, index: CareerIndex) -> str:
     """Load drafted CSV, enrich with stats, return formatted CSV content."""
     cols = ['Round', 'Pick', 'Player', 'Pos', 'School', 'Year', 'Height', 'Weight',
             '40yd', 'Vertical', 'Bench', 'Broad Jump', '3Cone', 'Shuttle',
@@ -113,27 +105,19 @@ def process_drafted_csv(path: str, stats_pivot: pd.DataFrame) -> str:
         df = pd.read_csv(path, usecols=lambda c: c in cols or c in ['speed_score', 'explosive_score', 'agility_score'])
     except Exception:
         df = pd.read_csv(path, header=0, names=cols + ['speed_score', 'explosive_score', 'agility_score'])
+    df = df[df['Year'].notna()]
+    stats = lookup_class(index, df)
+    matched = stats.notna().any(axis=1)
     rows = []
 
-    for _, r in df.iterrows():
-        player = r['Player']
-        school = r['School']
-        year_val = r['Year']
-        if pd.isna(year_val):
-            continue
-        year = int(year_val)
-
-        sacks_cum, tfl_cum, qbh_cum, sacks_fin, tfl_fin, qbh_fin = lookup_stats(
-            stats_pivot, player, school, year
-        )
-
+    for i, r in df.iterrows():
         row = {
             'Round': r['Round'],
             'Pick': r['Pick'],
-            'Player': player,
+            'Player': r['Player'],
             'Pos': r['Pos'],
-            'School': school,
-            'Year': year,
+            'School': r['School'],
+            'Year': int(r['Year']),
             'Height': r.get('Height', ''),
             'Weight': r.get('Weight', ''),
             '40yd': r.get('40yd', ''),
@@ -142,13 +126,10 @@ def process_drafted_csv(path: str, stats_pivot: pd.DataFrame) -> str:
             'Broad Jump': r.get('Broad Jump', ''),
             '3Cone': r.get('3Cone', ''),
             'Shuttle': r.get('Shuttle', ''),
-            'Sacks_cumulative': sacks_cum if sacks_cum is not None else r.get('Sacks_cumulative', ''),
-            'TFL_cumulative': tfl_cum if tfl_cum is not None else r.get('TFL_cumulative', ''),
-            'QB_Hurry_cumulative': qbh_cum if qbh_cum is not None else r.get('QB_Hurry_cumulative', ''),
-            'Sacks_final_season': sacks_fin if sacks_fin is not None else r.get('Sacks_final_season', ''),
-            'TFL_final_season': tfl_fin if tfl_fin is not None else r.get('TFL_final_season', ''),
-            'QB_Hurry_final_season': qbh_fin if qbh_fin is not None else r.get('QB_Hurry_final_season', ''),
         }
+        # Players without stats keep whatever the file already had
+        for c in OUTPUT_COLS:
+            row[c] = stats.at[i, c] if matched[i] else r.get(c, '')
         rows.append(format_row(row))
 
     header = 'Round,Pick,Player,Pos,School,Year,Height,Weight,40yd,Vertical,Bench,Broad Jump,3Cone,Shuttle,Sacks_cumulative,TFL_cumulative,QB_Hurry_cumulative,Sacks_final_season,TFL_final_season,QB_Hurry_final_season,speed_score,explosive_score,agility_score'
@@ -156,13 +137,13 @@ def process_drafted_csv(path: str, stats_pivot: pd.DataFrame) -> str:
 
 
 def main():
-    stats_pivot = load_defensive_stats()
+    index = load_career_index()
     for year in [2024, 2025, 2026]:
         path = os.path.join(DT_DIR, f'dt_drafted_{year}.csv')
         if not os.path.exists(path):
             print(f'Skipping {path} (not found)')
             continue
-        content = process_drafted_csv(path, stats_pivot)
+        content = process_drafted_csv(path, index)
         with open(path, 'w') as f:
             f.write(content)
         print(f'Updated {path}')
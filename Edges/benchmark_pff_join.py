@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: row-wise PFF lookup (old add_pff_data) vs keyed join (draftkit.pff_join.keyed_pff_join).
+- PFF comes from draftkit.sources.build_pff(POSITIONS['edges']) and names / schools from draftkit.normalize,
+  so both sides are keyed exactly as the shipped Edges pipeline keys them.
+- Prospects: combine DE/EDGE 2015-2023 + edges_drafted_2024/2025/2026.csv.
+- Checks both give identical values, then prints timings and speedup.
+Run from Edges/ directory: python benchmark_pff_join.py
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from draftkit.normalize import normalize_combine_schools, normalize_player_names, normalize_pff_schools  # noqa: E402
+from draftkit.paths import position_dir  # noqa: E402
+from draftkit.pff_join import build_pff_index, keyed_pff_join  # noqa: E402
+from draftkit.positions import POSITIONS, TESTING_YEARS, TRAINING_YEARS  # noqa: E402
+from draftkit.sources import PFF_KEYS, build_pff, load_combine  # noqa: E402
+
+CFG = POSITIONS['edges']
+
+
+def load_prospects():
+    train = load_combine(CFG['combine_positions'], TRAINING_YEARS)
+    drafted = [pd.read_csv(os.path.join(position_dir(CFG), f'{CFG["drafted_prefix"]}_drafted_{y}.csv'))
+               for y in TESTING_YEARS]
+    return pd.concat([train[['Player', 'School', 'Year']]] + [d[['Player', 'School', 'Year']] for d in drafted],
+                     ignore_index=True)
+
+
+def rowwise_join(prospects, pff_n, value_cols):
+    """The old lookup_pff_stats: one boolean mask over the PFF frame per prospect."""
+    nicknames = CFG['pff_nicknames']
+
+    def lookup(row):
+        player = row['Player_normalized']
+        player_to_search = nicknames.get(player, player)
+        final_season = int(row['Year']) - 1
+        mask = ((pff_n['Player_normalized'] == player_to_search) &
+                (pff_n['School_normalized'] == row['School_normalized']) &
+                (pff_n['Year'] == final_season))
+        if not mask.any() and player_to_search != player:
+            mask = ((pff_n['Player_normalized'] == player) &
+                    (pff_n['School_normalized'] == row['School_normalized']) &
+                    (pff_n['Year'] == final_season))
+        match = pff_n.loc[mask]
+        if match.empty:
+            return pd.Series({c: None for c in value_cols})
+        r = match.iloc[0]
+        return pd.Series({c: r[c] for c in value_cols})
+    return prospects.apply(lookup, axis=1)
+
+
+def keyed_join(prospects, pff_n, value_cols):
+    pff_index = build_pff_index(pff_n, value_cols)
+    return keyed_pff_join(prospects['Player_normalized'], prospects['School_normalized'],
+                          prospects['Year'].astype(int) - 1, pff_index, CFG['pff_nicknames'])
+
+
+def main():
+    pff = build_pff(CFG)
+    if pff.empty:
+        print('No PFF files under data/raw/pff; nothing to benchmark.')
+        sys.exit(1)
+    value_cols = [c for c in pff.columns if c not in PFF_KEYS]
+    pff['Player_normalized'] = normalize_player_names(pff['Player'], CFG['strip_iv'])
+    pff['School_normalized'] = normalize_pff_schools(pff['School'])
+    prospects = load_prospects()
+    prospects['Player_normalized'] = normalize_player_names(prospects['Player'], CFG['strip_iv'])
+    prospects['School_normalized'] = normalize_combine_schools(prospects['School'])
+    print(f'PFF rows (2014-2025, deduped): {len(pff)}; prospects: {len(prospects)}')
+
+    t0 = time.perf_counter()
+    old = rowwise_join(prospects, pff, value_cols)
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    new = keyed_join(prospects, pff, value_cols)
+    t_new = time.perf_counter() - t0
+
+    old = old.reset_index(drop=True).astype(float)
+    new = new[value_cols].astype(float)
+    pd.testing.assert_frame_equal(old, new, check_names=False)
+    matched = new['pass_rush_win_rate'].notna().sum()
+    print(f'Identical output ({matched}/{len(new)} prospects matched)')
+    print(f'Row-wise lookup: {t_old:.3f}s')
+    print(f'Keyed join:      {t_new:.3f}s')
+    print(f'Speedup:         {t_old / t_new:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,15 +2,20 @@
 Verify PFF and RAS coverage for LB pipeline.
 - Loads lb_training.csv, lb_testing.csv, lb_drafted_2026.csv.
 - Reports counts: total, with RAS, with PFF pass rush, run defense, coverage.
-- Lists every player missing RAS or PFF and suggests overrides by searching raw PFF/RAS.
+- Lists every player missing RAS or PFF and suggests overrides from raw PFF/RAS, most confident first
+  (draftkit/candidates.py blocks candidates by year + school and year + last name, then ranks them).
 Run from LB/ directory. Run data_cleaning.py first.
 """
 import os
 import re
+import sys
 import pandas as pd
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+
+from draftkit.candidates import CandidateIndex, reason
 DATA_RAW = os.path.join(PROJECT_ROOT, 'data', 'raw')
 DATA_PROCESSED = os.path.join(PROJECT_ROOT, 'data', 'processed')
 
@@ -108,42 +113,24 @@ def find_missing_and_suggest_ras(all_lb, ras_lb):
         'Mississippi St.': 'Mississippi State', 'West Virginia': 'West Virginia',
     }
     ras_n['College_n'] = ras_n['College'].apply(lambda x: ras_school.get(str(x).strip(), str(x).strip()) if pd.notna(x) else x)
+    index = CandidateIndex(ras_n, ras_n['Name_n'], ras_n['College_n'], ras_n['Year'])
     suggestions = []
-    for _, row in missing.iterrows():
-        player_n = normalize_player_name(row['Player'])
-        school_n = normalize_combine_school(row['School'])
-        year = int(row['Year'])
-        # Exact match
-        m = (ras_n['Name_n'] == player_n) & (ras_n['College_n'] == school_n) & (ras_n['Year'] == year)
-        if m.any():
+    for row in missing.itertuples(index=False):
+        player_n = normalize_player_name(row.Player)
+        school_n = normalize_combine_school(row.School)
+        year = int(row.Year)
+        if index.has_exact(player_n, school_n, year):
             continue
-        # Same year + same college (different name spelling)
-        m2 = (ras_n['College_n'] == school_n) & (ras_n['Year'] == year)
-        cand = ras_n.loc[m2]
-        if not cand.empty:
-            # Prefer last name match
-            combine_last = player_n.split()[-1] if player_n else ''
-            for _, c in cand.iterrows():
-                if combine_last and combine_last in c['Name_n']:
-                    suggestions.append((row['Player'], row['School'], year, c['Name'], c['College'], 'RAS name/college'))
-                    break
-            else:
-                suggestions.append((row['Player'], row['School'], year, cand.iloc[0]['Name'], cand.iloc[0]['College'], 'RAS same school+year'))
-        else:
-            # Same year only
-            m3 = ras_n['Year'] == year
-            cand2 = ras_n.loc[m3]
-            combine_last = player_n.split()[-1] if player_n else ''
-            for _, c in cand2.iterrows():
-                if combine_last and combine_last in c['Name_n']:
-                    suggestions.append((row['Player'], row['School'], year, c['Name'], c['College'], 'RAS same year+last name'))
-                    break
+        for score, same_school, has_last, c in index.suggest(player_n, school_n, year, limit=1):
+            suggestions.append((row.Player, row.School, year, c['Name'], c['College'], f'RAS {reason(same_school, has_last)}', score))
+    # Most confident first
+    suggestions.sort(key=lambda s: -s[6])
     for r in missing.itertuples(index=False):
         print(f"  {r.Player} | {r.School} | {r.Year} | {r.source}")
     if suggestions:
         print("\n  Suggested RAS overrides (check and add to data_cleaning ras_name_alias / ras_school):")
         for s in suggestions[:30]:
-            print(f"    # {s[0]} ({s[2]}): RAS has '{s[3]}' @ {s[4]}")
+            print(f"    # {s[0]} ({s[2]}): RAS has '{s[3]}' @ {s[4]} -> {s[5]}, score {s[6]:.2f}")
 
 
 def find_missing_and_suggest_pff(all_lb, pff_pr, pff_rd, pff_cov):
@@ -159,25 +146,17 @@ def find_missing_and_suggest_pff(all_lb, pff_pr, pff_rd, pff_cov):
     # Build one PFF lookup: pass rush has Player, School, Year (normalized)
     pff_pr['School_n'] = pff_pr['School'].apply(normalize_pff_school)
     pff_pr['Player_n'] = pff_pr['Player'].apply(normalize_player_name)
+    index = CandidateIndex(pff_pr, pff_pr['Player_n'], pff_pr['School_n'], pff_pr['Year'])
     suggestions = []
-    for _, row in missing_any.iterrows():
-        player_n = normalize_player_name(row['Player'])
-        school_n = normalize_combine_school(row['School'])
-        final_season = int(row['Year']) - 1
-        mask = (pff_pr['Player_n'] == player_n) & (pff_pr['School_n'] == school_n) & (pff_pr['Year'] == final_season)
-        if mask.any():
+    for row in missing_any.itertuples(index=False):
+        player_n = normalize_player_name(row.Player)
+        school_n = normalize_combine_school(row.School)
+        final_season = int(row.Year) - 1
+        if index.has_exact(player_n, school_n, final_season):
             continue
-        # Same school + year in PFF?
-        m2 = (pff_pr['School_n'] == school_n) & (pff_pr['Year'] == final_season)
-        cand = pff_pr.loc[m2]
-        combine_last = player_n.split()[-1] if player_n else ''
-        for _, c in cand.iterrows():
-            if combine_last and combine_last in c['Player_n']:
-                suggestions.append((row['Player'], row['School'], int(row['Year']), c['Player'], c['School'], 'PFF same school+year+last'))
-                break
-        else:
-            if not cand.empty:
-                suggestions.append((row['Player'], row['School'], int(row['Year']), cand.iloc[0]['Player'], cand.iloc[0]['School'], 'PFF same school+year'))
+        for score, same_school, has_last, c in index.suggest(player_n, school_n, final_season, limit=1):
+            suggestions.append((row.Player, row.School, int(row.Year), c['Player'], c['School'], f'PFF {reason(same_school, has_last)}', score))
+    suggestions.sort(key=lambda s: -s[6])
     for r in missing_any.itertuples(index=False):
         print(f"  {r.Player} | {r.School} | {r.Year} | {r.source}")
     if suggestions:
@@ -188,7 +167,7 @@ def find_missing_and_suggest_pff(all_lb, pff_pr, pff_rd, pff_cov):
             if key in seen:
                 continue
             seen.add(key)
-            print(f"    # {s[0]} ({s[2]}): PFF has '{s[3]}' @ {s[4]} -> {s[5]}")
+            print(f"    # {s[0]} ({s[2]}): PFF has '{s[3]}' @ {s[4]} -> {s[5]}, score {s[6]:.2f}")
 
 
 def main():
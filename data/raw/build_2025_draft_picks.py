@@ -1,9 +1,9 @@
-"""One-off: build data/raw/2025_draft_picks.csv from PFR 2025 draft table (Rnd,Pick,Tm,Player,Pos,School)."""
+"""One-off: build data/raw/2025_draft_picks.csv from PFR 2025 draft table (Rnd,Pick,Tm,Player,Pos,School,pfr_id)."""
 import csv
 import os
 
 # PFR table rows: Rnd,Pick,Tm,Player,Pos,Age,To,...,College/Univ,College Stats,id
-# We take indices 0,1,2,3,4 and -3 (School)
+# We take indices 0,1,2,3,4, -3 (School) and -1 (PFR player id, e.g. WardCa00)
 RAW_TABLE = """1,1,TEN,Cam Ward,QB,23,2025,0,0,0,7,7,17,323,540,3169,15,7,39,159,2,0,0,0,,,,Miami (FL),College Stats,WardCa00
 1,2,JAX,Travis Hunter,WR,22,2025,0,0,0,5,5,7,0,0,0,0,0,1,0,0,28,298,1,11,,,Colorado,College Stats,HuntTr00
 1,3,NYG,Abdul Carter,DE,21,2025,0,0,0,4,4,17,0,0,0,0,0,0,0,0,0,0,0,25,,4.0,Penn St.,College Stats,CartAb00
@@ -269,12 +269,12 @@ def parse_row(line: str) -> list:
         return []
     rnd, pick, tm, player, pos = parts[0], parts[1], parts[2], parts[3], parts[4]
     school = parts[-3] if len(parts) >= 3 else ""
-    return [rnd, pick, tm, player, pos, school]
+    return [rnd, pick, tm, player, pos, school, parts[-1]]
 
 def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     out_path = os.path.join(script_dir, "2025_draft_picks.csv")
-    rows = [["Rnd", "Pick", "Tm", "Player", "Pos", "School"]]
+    rows = [["Rnd", "Pick", "Tm", "Player", "Pos", "School", "pfr_id"]]
     for line in RAW_TABLE.strip().split("\n"):
         row = parse_row(line)
         if row:
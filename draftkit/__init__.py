@@ -0,0 +1,31 @@
+"""
+draftkit: shared data-cleaning pipeline for the Edges, DT, LB, CB and S position folders.
+- positions.py holds each position's config; pipeline.build_position / run_all / run_parallel build the outputs.
+- Raw sources (combine, RAS, PFF, arm length) are loaded once per process (sources.py).
+- mockdraftable.py scrapes the arm-length files: python -m draftkit.mockdraftable [edges ...]
+- incremental.py rebuilds only changed (position, draft year) partitions: python -m draftkit --incremental
+- benchmark.py times each cleaning stage on real and scaled inputs: python -m draftkit.benchmark
+- pbp.py streams nflverse play-by-play into per-season defensive totals: python -m draftkit.pbp 2024
+- college_stats.py indexes college defensive stats by (Player, Team) for the drafted-class scripts.
+- registry.py gives each prospect a stable id and stores its PFF/RAS/MockDraftable/PFR keys: python -m draftkit.registry
+- features.py builds speed/explosive/P4 features and contains_* flags with training-pool stats (FeatureBuilder).
+- imputer.py is the KNN imputer the round models use, over a neighbor index fitted once on the training pool.
+- round_model.py saves the fitted round regressions and scores CSVs with them: python -m draftkit.round_model
+- comps.py finds each prospect's nearest historical comps with a persisted KD-tree index: python -m draftkit.comps cb
+- draft_classifier.py fits the drafted/undrafted models of the analysis notebooks together: python -m draftkit.draft_classifier
+- draft_sim.py simulates the 2026 draft from the round models' predictions: python -m draftkit.draft_sim
+- round_search.py cross-validates imputer k, ridge alpha and feature set in a process pool: python -m draftkit.round_search
+Run from the project root: python -m draftkit [edges dt lb cb s]
+"""
+from .enrich import add_arm_length, add_coverage_rates, add_pff_data, add_ras_data, prepare_pff_index
+from .normalize import (normalize_combine_school, normalize_combine_schools, normalize_player_name, normalize_player_names,
+                        normalize_pff_school, normalize_pff_schools, normalize_ras_school, normalize_ras_schools)
+from .pipeline import build_position, run_all, run_parallel
+from .positions import POSITIONS
+
+__all__ = [
+    'POSITIONS', 'build_position', 'run_all', 'run_parallel',
+    'add_pff_data', 'add_ras_data', 'add_arm_length', 'add_coverage_rates', 'prepare_pff_index',
+    'normalize_player_name', 'normalize_pff_school', 'normalize_combine_school', 'normalize_ras_school',
+    'normalize_player_names', 'normalize_pff_schools', 'normalize_combine_schools', 'normalize_ras_schools',
+]
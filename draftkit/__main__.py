@@ -0,0 +1,39 @@
+"""
+python -m draftkit [--incremental] [--jobs N] [position ...]: build the given positions (default: all).
+Positions are built in parallel worker processes (one per position, up to the CPU count; --jobs 1 runs them
+one after another). --incremental rebuilds only the draft years whose inputs changed since the last build
+(incremental.py) and always runs in this process.
+"""
+import argparse
+import sys
+import time
+
+from .incremental import build_incremental
+from .pipeline import run_parallel
+from .positions import POSITIONS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m draftkit', description='Build the position training/testing CSVs.')
+    parser.add_argument('positions', nargs='*', help=f'default: all ({", ".join(POSITIONS)})')
+    parser.add_argument('--incremental', action='store_true', help='rebuild only changed draft years')
+    parser.add_argument('-j', '--jobs', type=int, help='worker processes (default: one per position, up to the CPU count)')
+    args = parser.parse_args(argv)
+    names = [a.lower() for a in args.positions] or list(POSITIONS)
+    unknown = [n for n in names if n not in POSITIONS]
+    if unknown:
+        print(f'Unknown position(s): {", ".join(unknown)}. Choose from: {", ".join(POSITIONS)}')
+        return 2
+    if args.incremental:
+        t0 = time.perf_counter()
+        rebuilt = build_incremental(names)
+        for name, years in rebuilt.items():
+            print(f'{name}: rebuilt {years if years else "nothing"}')
+        print(f'Done in {time.perf_counter() - t0:.1f}s')
+        return 0
+    run_parallel(names, jobs=args.jobs)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+Benchmark harness for the cleaning pipeline: wall time and peak memory per stage, per position, per input scale.
+- Stages follow build_position: pff_load (parse the PFF season files), dedupe (build_pff), add_pff_data
+  (index + join, coverage rates), add_ras_data, add_arm_length, csv_write (training, testing, 2026).
+- Scale 1 is the real data/raw inputs. Scale N replicates the combine rows, draft classes, RAS, arm length and
+  PFF season files N times under renamed players ('X2 Jordan Davis', ...), so every copy still matches its own
+  PFF/RAS/arm rows and lookups see N times the keys. Scaled PFF files are written to a temp dir first.
+- Times are the best of --repeat runs; peak_mb comes from one extra run under tracemalloc (it slows the code,
+  so it is kept out of the timed runs).
+- Results go to data/benchmarks/bench_<UTC time>.json; --compare OLD.json prints per-stage ratios against it.
+Run from the project root: python -m draftkit.benchmark [edges ...] [--scales 1 10 100] [--repeat 3]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from .enrich import add_arm_length, add_coverage_rates, add_pff_data, add_ras_data, prepare_pff_index
+from .paths import PROJECT_ROOT
+from .pipeline import load_prospects
+from .positions import POSITIONS, drafted_2026_cols, training_cols
+from .sources import (PFF_TABLES, _parse_pff_season, build_pff, load_arm_length, load_ras, pff_season_paths,
+                      ras_for_positions)
+
+BENCH_DIR = os.path.join(PROJECT_ROOT, 'data', 'benchmarks')
+STAGES = ['pff_load', 'dedupe', 'add_pff_data', 'add_ras_data', 'add_arm_length', 'csv_write']
+SCALES = [1, 10, 100]
+REPEAT = 3
+# --compare flags a stage when it got this much slower
+REGRESSION_RATIO = 1.25
+
+
+class _Clock:
+    """Context-manager factory: with clock('stage'): ... records seconds (and peak MiB when tracing memory)."""
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.seconds = {}
+        self.peak_mb = {}
+
+    @contextlib.contextmanager
+    def __call__(self, stage):
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        yield
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + time.perf_counter() - t0
+        if self.memory:
+            peak = (tracemalloc.get_traced_memory()[1] - base) / 2 ** 20
+            self.peak_mb[stage] = max(self.peak_mb.get(stage, 0.0), peak)
+
+
+def _pff_files(tables):
+    """{table: [(path, season), ...]} for the real season files."""
+    return {table: pff_season_paths(table) for table in tables}
+
+
+def real_inputs(name):
+    """The frames and files build_position reads for one position (scale 1); nothing is written."""
+    cfg = POSITIONS[name]
+    training, testing, prospects_2026 = load_prospects(cfg, write=False)
+    ras = load_ras()
+    return {
+        'training': training,
+        'testing': testing,
+        'drafted_2026': prospects_2026,
+        'ras': ras[ras['Pos'].isin(cfg['ras_positions'])],
+        'arm': load_arm_length(cfg['output_prefix']),
+        'pff_files': _pff_files(['pass_rush'] + list(cfg['pff_tables'])),
+    }
+
+
+def _replicate(df, col, scale):
+    """df repeated scale times; copy k > 1 has col renamed 'Xk <name>' (prefix, so suffixes like Jr. stay last)."""
+    if df is None or df.empty or scale == 1:
+        return df
+    copies = [df]
+    for k in range(2, scale + 1):
+        c = df.copy()
+        c[col] = f'X{k} ' + c[col].astype(str)
+        copies.append(c)
+    return pd.concat(copies, ignore_index=True)
+
+
+def scale_inputs(inputs, scale, workdir):
+    """inputs replicated scale times; scaled PFF season files are written under workdir (reused if present)."""
+    if scale == 1:
+        return inputs
+    scaled = {key: _replicate(inputs[key], 'Player', scale) for key in ('training', 'testing', 'drafted_2026', 'arm')}
+    scaled['ras'] = _replicate(inputs['ras'], 'Name', scale)
+    scaled['pff_files'] = {}
+    for table, files in inputs['pff_files'].items():
+        out = []
+        for path, season in files:
+            target = os.path.join(workdir, f'x{scale}', PFF_TABLES[table]['folder'], os.path.basename(path))
+            if not os.path.exists(target):
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                raw = pd.read_csv(path)
+                _replicate(raw, 'player', scale).to_csv(target, index=False)
+            out.append((target, season))
+        scaled['pff_files'][table] = out
+    return scaled
+
+
+def _run_stages(name, inputs, out_dir, clock):
+    """One pass of build_position's work on inputs, timed per stage; returns row counts."""
+    cfg = POSITIONS[name]
+    frames = {key: inputs[key] for key in ('training', 'testing', 'drafted_2026')}
+    with clock('pff_load'):
+        tables = {}
+        for table, files in inputs['pff_files'].items():
+            parts = [_parse_pff_season(table, path, season) for path, season in files]
+            parts = [p for p in parts if 'Player' in p.columns]
+            tables[table] = pd.concat(parts, ignore_index=True) if parts else None
+    with clock('dedupe'):
+        pff = build_pff(cfg, load_table=tables.get)
+    with clock('add_pff_data'):
+        pff_index = prepare_pff_index(pff, cfg)
+        for key, df in frames.items():
+            if not df.empty:
+                df = add_pff_data(df, pff_index, cfg)
+                frames[key] = add_coverage_rates(df) if 'coverage' in cfg['pff_tables'] else df
+    with clock('add_ras_data'):
+        ras_subset = ras_for_positions(cfg['ras_positions'], inputs['ras'])
+        frames = {key: add_ras_data(df, ras_subset, cfg) if not df.empty else df for key, df in frames.items()}
+    with clock('add_arm_length'):
+        frames = {key: add_arm_length(df, inputs['arm']) if not df.empty else df for key, df in frames.items()}
+    with clock('csv_write'):
+        for key, df in frames.items():
+            cols = drafted_2026_cols(cfg) if key == 'drafted_2026' else training_cols(cfg)
+            df[[c for c in cols if c in df.columns]].to_csv(os.path.join(out_dir, f'{name}_{key}.csv'), index=False)
+    return {'pff': len(pff), 'ras': len(ras_subset), **{key: len(df) for key, df in frames.items()}}
+
+
+def bench_position(name, inputs, repeat=REPEAT, memory=True):
+    """{'seconds': best time per stage, 'peak_mb': per stage (if memory), 'rows': ...} for one position and input set."""
+    with tempfile.TemporaryDirectory() as out_dir, contextlib.redirect_stdout(io.StringIO()):
+        runs = []
+        for _ in range(repeat):
+            clock = _Clock()
+            rows = _run_stages(name, inputs, out_dir, clock)
+            runs.append(clock.seconds)
+        result = {
+            'seconds': {stage: min(run[stage] for run in runs) for stage in STAGES},
+            'rows': rows,
+        }
+        if memory:
+            clock = _Clock(memory=True)
+            tracemalloc.start()
+            try:
+                _run_stages(name, inputs, out_dir, clock)
+            finally:
+                tracemalloc.stop()
+            result['peak_mb'] = {stage: round(clock.peak_mb[stage], 2) for stage in STAGES}
+    result['seconds'] = {stage: round(s, 4) for stage, s in result['seconds'].items()}
+    result['total_seconds'] = round(sum(result['seconds'].values()), 4)
+    return result
+
+
+def _environment():
+    try:
+        rev = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                             capture_output=True, text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        rev = None
+    return {
+        'git_rev': rev,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def run_benchmarks(names=None, scales=SCALES, repeat=REPEAT, memory=True, output_path=None):
+    """Benchmark each position at each scale; writes and returns the results document."""
+    names = names or list(POSITIONS)
+    started = datetime.now(timezone.utc)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in names:
+            with contextlib.redirect_stdout(io.StringIO()):
+                base = real_inputs(name)
+            for scale in scales:
+                inputs = scale_inputs(base, scale, workdir)
+                result = bench_position(name, inputs, repeat=repeat, memory=memory)
+                results.append({'position': name, 'scale': scale, **result})
+                print(f'{name} x{scale}: {result["total_seconds"]:.2f}s  '
+                      + '  '.join(f'{s} {t:.3f}' for s, t in result['seconds'].items()))
+    doc = {
+        'started': started.isoformat(timespec='seconds'),
+        'repeat': repeat,
+        'stages': STAGES,
+        'environment': _environment(),
+        'results': results,
+    }
+    output_path = output_path or os.path.join(BENCH_DIR, f'bench_{started.strftime("%Y%m%dT%H%M%SZ")}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(doc, f, indent=1)
+    print(f'Wrote {output_path}')
+    return doc
+
+
+def compare(old, new, threshold=REGRESSION_RATIO):
+    """Print new/old time ratios per (position, scale, stage); returns the entries slower than threshold."""
+    before = {(r['position'], r['scale']): r for r in old['results']}
+    slower = []
+    for r in new['results']:
+        prev = before.get((r['position'], r['scale']))
+        if prev is None:
+            continue
+        parts = []
+        for stage in STAGES:
+            a, b = prev['seconds'].get(stage), r['seconds'].get(stage)
+            if not a or b is None:
+                continue
+            ratio = b / a
+            flag = ' !' if ratio > threshold else ''
+            if flag:
+                slower.append((r['position'], r['scale'], stage, ratio))
+            parts.append(f'{stage} {ratio:.2f}x{flag}')
+        print(f'{r["position"]} x{r["scale"]}: ' + '  '.join(parts))
+    return slower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Time each cleaning stage on real and synthetic (scaled) inputs.')
+    parser.add_argument('positions', nargs='*', help=f'default: all ({", ".join(POSITIONS)})')
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES, help='input multipliers (1 = real data)')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help='timed runs per case (best is kept)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('-o', '--output', help='results JSON (default: data/benchmarks/bench_<time>.json)')
+    parser.add_argument('--compare', metavar='OLD_JSON', help='print ratios against an earlier results file')
+    args = parser.parse_args(argv)
+    names = [n.lower() for n in args.positions] or list(POSITIONS)
+    unknown = [n for n in names if n not in POSITIONS]
+    if unknown:
+        print(f'Unknown position(s): {", ".join(unknown)}. Choose from: {", ".join(POSITIONS)}')
+        return 2
+    if any(s < 1 for s in args.scales):
+        print('--scales must be positive integers')
+        return 2
+    doc = run_benchmarks(names, args.scales, max(args.repeat, 1), not args.no_memory, args.output)
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        if compare(old, doc):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
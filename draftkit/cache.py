@@ -0,0 +1,132 @@
+"""
+On-disk cache for frames parsed from raw files (data/cache/, not committed).
+- Each entry is keyed by its source files' size + mtime and, when those move, their content hash:
+  touching a file without changing it keeps the entry, editing it rebuilds just that entry.
+- Frames are stored as Feather (columnar, memory-mapped on read) only when pyarrow is installed. pyarrow
+  is optional and not installed with the project's dependencies, so by default entries are pickles: read
+  whole into memory, not mapped (FORMAT says which). Either way a warm run skips the CSV parse; the mapped
+  Feather reads need pip install pyarrow.
+- Data and meta are each written to a temp file in data/cache/ and moved into place with os.replace, data
+  first, so a run killed mid-write never leaves a truncated file behind a meta that matches it.
+- Set DRAFTKIT_NO_CACHE=1 to bypass the cache entirely.
+"""
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from .paths import CACHE_DIR
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow is optional
+    feather = None
+
+FORMAT = 'feather' if feather is not None else 'pickle'
+
+
+def file_hash(path):
+    """sha1 hex digest of a file's contents, read in 1 MiB chunks."""
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_stat(path):
+    """The size and mtime_ns the cache keys a source file on."""
+    st = os.stat(path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def _sources_match(saved, paths):
+    """True if every source is unchanged; refreshes saved mtimes in place when only the timestamp moved."""
+    if sorted(saved) != sorted(paths):
+        return False
+    for path in paths:
+        now = file_stat(path)
+        entry = saved[path]
+        if now['size'] != entry['size']:
+            return False
+        if now['mtime_ns'] != entry['mtime_ns']:
+            if file_hash(path) != entry['sha1']:
+                return False
+            entry['mtime_ns'] = now['mtime_ns']
+    return True
+
+
+def _replace(path, write):
+    """write(tmp) to a temp file next to path, then move it over path (removing the temp file on failure)."""
+    tmp = f'{path}.{os.getpid()}.tmp'
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _write(df, path):
+    if FORMAT == 'feather':
+        _replace(path, lambda tmp: feather.write_feather(df.reset_index(drop=True), tmp))
+    else:
+        _replace(path, df.to_pickle)
+
+
+def _write_meta(meta, path):
+    def write(tmp):
+        with open(tmp, 'w') as f:
+            json.dump(meta, f, indent=1)
+
+    _replace(path, write)
+
+
+def _read(path):
+    if FORMAT == 'feather':
+        return feather.read_table(path, memory_map=True).to_pandas()
+    return pd.read_pickle(path)
+
+
+def cached_frame(name, sources, build, version=''):
+    """
+    Return build() for the given source files, reusing data/cache/<name> while the sources are unchanged.
+    version: anything that changes what build() produces for the same files (e.g. the kept columns).
+    """
+    if os.environ.get('DRAFTKIT_NO_CACHE'):
+        return build()
+    sources = [os.path.abspath(p) for p in sources]
+    data_path = os.path.join(CACHE_DIR, f'{name}.{FORMAT}')
+    meta_path = os.path.join(CACHE_DIR, f'{name}.json')
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = None
+    if (meta is not None and meta.get('version') == version and meta.get('format') == FORMAT
+            and os.path.exists(data_path)):
+        saved = json.dumps(meta, sort_keys=True)
+        fresh = _sources_match(meta['sources'], sources)
+    else:
+        fresh = False
+    if fresh:
+        try:
+            df = _read(data_path)
+        except Exception as e:
+            print(f'Cache {name} unreadable ({e}); rebuilding.')
+        else:
+            if json.dumps(meta, sort_keys=True) != saved:
+                _write_meta(meta, meta_path)
+            return df
+
+    df = build()
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    _write(df, data_path)
+    meta = {
+        'version': version,
+        'format': FORMAT,
+        'sources': {p: {**file_stat(p), 'sha1': file_hash(p)} for p in sources},
+    }
+    _write_meta(meta, meta_path)
+    return df
@@ -0,0 +1,102 @@
+"""
+Candidate index for the verify_* scripts' override suggestions (unmatched player -> likely RAS / PFF row).
+- Rows are blocked by (year, school) and (year, name token), so a lookup only touches the rows sharing a
+  block with the player instead of scanning every row of the year. The last-name block takes every token of
+  the year that contains the last name, as the old `last in name` scans did (TRYON finds TRYONSHOYINKA).
+- Candidates are ranked by a score in [0, 1]: name similarity (difflib ratio on normalized names) plus
+  bonuses for the same school and for containing the player's last name. Best first.
+- Names and schools are passed in already normalized; each script keeps its own school tables.
+"""
+import difflib
+from collections import defaultdict
+
+import pandas as pd
+
+# Score weights; the total is divided by their sum so a perfect candidate scores 1.0
+NAME_WEIGHT = 1.0
+SCHOOL_WEIGHT = 0.5
+LAST_NAME_WEIGHT = 0.25
+_TOTAL_WEIGHT = NAME_WEIGHT + SCHOOL_WEIGHT + LAST_NAME_WEIGHT
+
+
+def last_name(name_n):
+    """Last token of a normalized name ('' for blank)."""
+    parts = str(name_n).split()
+    return parts[-1] if parts else ''
+
+
+class CandidateIndex:
+    """
+    Index over rows of a frame (e.g. ras.csv or PFF pass rush) by normalized name, school and year.
+    names / schools / years are aligned array-likes; the frame's rows are returned by suggest().
+    """
+
+    def __init__(self, frame, names, schools, years):
+        self.frame = frame.reset_index(drop=True)
+        self.names = [str(n) for n in names]
+        self.schools = [s if pd.notna(s) else None for s in schools]
+        self.years = [int(y) for y in years]
+        self.exact = set()
+        self.by_school = defaultdict(list)
+        self.by_token = defaultdict(list)
+        self.tokens_by_year = defaultdict(set)
+        self._containing = {}
+        for i, (name, school, year) in enumerate(zip(self.names, self.schools, self.years)):
+            self.exact.add((name, school, year))
+            if school is not None:
+                self.by_school[(year, school)].append(i)
+            for token in set(name.split()):
+                self.by_token[(year, token)].append(i)
+                self.tokens_by_year[year].add(token)
+
+    def has_exact(self, name_n, school_n, year):
+        return (name_n, school_n, int(year)) in self.exact
+
+    def school_rows(self, school_n, year):
+        """Row positions at this school in this year (in frame order)."""
+        return self.by_school.get((int(year), school_n), [])
+
+    def last_name_rows(self, last, year):
+        """Row positions in this year whose name contains last (any token containing it; memoized)."""
+        key = (int(year), last)
+        if key not in self._containing:
+            tokens = [t for t in self.tokens_by_year.get(key[0], ()) if last in t]
+            self._containing[key] = {i for t in tokens for i in self.by_token[(key[0], t)]}
+        return self._containing[key]
+
+    def score(self, i, name_n, school_n, last):
+        same_school = school_n is not None and self.schools[i] == school_n
+        has_last = bool(last) and last in self.names[i]
+        similarity = difflib.SequenceMatcher(None, name_n, self.names[i]).ratio()
+        return (NAME_WEIGHT * similarity + SCHOOL_WEIGHT * same_school + LAST_NAME_WEIGHT * has_last) / _TOTAL_WEIGHT, same_school, has_last
+
+    def suggest(self, name_n, school_n, year, limit=3, require_last_name=False):
+        """
+        Ranked candidates for one player: [(score, same_school, has_last_name, row)], best first.
+        Candidates share the player's (year, school) block or have a name token containing their last name.
+        require_last_name keeps only candidates whose name contains the player's last name.
+        """
+        year = int(year)
+        school_n = school_n if pd.notna(school_n) else None
+        last = last_name(name_n)
+        rows = set(self.school_rows(school_n, year)) if school_n is not None else set()
+        if last:
+            rows.update(self.last_name_rows(last, year))
+        ranked = []
+        for i in rows:
+            score, same_school, has_last = self.score(i, name_n, school_n, last)
+            if require_last_name and not has_last:
+                continue
+            ranked.append((score, same_school, has_last, i))
+        # Ties keep frame order, like the old first-hit scans
+        ranked.sort(key=lambda t: (-t[0], t[3]))
+        return [(round(s, 3), same_school, has_last, self.frame.iloc[i]) for s, same_school, has_last, i in ranked[:limit]]
+
+
+def reason(same_school, has_last):
+    """Short label for why a candidate was suggested."""
+    if same_school and has_last:
+        return 'same school+year+last name'
+    if same_school:
+        return 'same school+year'
+    return 'same year+last name'
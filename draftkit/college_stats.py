@@ -0,0 +1,104 @@
+"""
+Career index over college defensive stats (defensive_stats_2016_to_2025.csv) for drafted-class enrichment.
+- pivot_defensive_stats turns the long StatType/Stat rows into one row per (Season, Player, Team) with
+  SACKS, TFL and QB_HUR columns, plus Team_norm from the caller's school alias table.
+- CareerIndex is built once from that pivot: rows are sorted by (Player, Team_norm, Season), seasons that
+  alias to the same team are summed, and running totals are kept per stat. Cumulative-through-season is one
+  subtraction of running totals and the final season is one comparison, for any number of players at once.
+- lookup() joins a whole drafted class in one call; players with no (Player, Team_norm) rows get NaN,
+  players whose rows all come after the season get 0 (as the per-player masks did).
+"""
+import numpy as np
+import pandas as pd
+
+STAT_TYPES = {'SACKS': 'SACKS', 'TFL': 'TFL', 'QB HUR': 'QB_HUR'}
+STATS = list(STAT_TYPES.values())
+# Output column -> (stat, window)
+OUTPUT_COLS = {
+    'Sacks_cumulative': ('SACKS', 'cumulative'),
+    'TFL_cumulative': ('TFL', 'cumulative'),
+    'QB_Hurry_cumulative': ('QB_HUR', 'cumulative'),
+    'Sacks_final_season': ('SACKS', 'final'),
+    'TFL_final_season': ('TFL', 'final'),
+    'QB_Hurry_final_season': ('QB_HUR', 'final'),
+}
+# Season codes are group * _SEASON_SPAN + season, so one searchsorted covers every group
+_SEASON_SPAN = 10000
+
+
+def pivot_defensive_stats(df, school_alias=None):
+    """Wide (Season, Player, Team, SACKS, TFL, QB_HUR, Team_norm) frame from the long defensive_stats rows."""
+    school_alias = school_alias or {}
+    filtered = df[df['StatType'].isin(list(STAT_TYPES))].copy()
+    filtered['Stat'] = pd.to_numeric(filtered['Stat'], errors='coerce').fillna(0)
+    pivot = filtered.pivot_table(
+        index=['Season', 'Player', 'Team'],
+        columns='StatType',
+        values='Stat',
+        aggfunc='sum'
+    ).reset_index().rename_axis(columns=None)
+    pivot = pivot.rename(columns=STAT_TYPES)
+    pivot['Team_norm'] = pivot['Team'].map(lambda x: school_alias.get(x, x))
+    return pivot
+
+
+class CareerIndex:
+    """
+    Per-(Player, Team_norm) season arrays with running totals, built once from a pivot_defensive_stats frame.
+    Stats missing from the pivot count as 0.
+    """
+
+    def __init__(self, pivot, stats=STATS, team_col='Team_norm'):
+        self.stats = list(stats)
+        values = pivot[['Player', team_col, 'Season']].copy()
+        for stat in self.stats:
+            values[stat] = pd.to_numeric(pivot[stat], errors='coerce').fillna(0) if stat in pivot.columns else 0.0
+        values['Season'] = values['Season'].astype(np.int64)
+        seasons = values.groupby(['Player', team_col, 'Season'], sort=True)[self.stats].sum().reset_index()
+        group = seasons.groupby(['Player', team_col], sort=True).ngroup().to_numpy(dtype=np.int64)
+        self.starts = np.flatnonzero(np.diff(group, prepend=-1))
+        self.keys = pd.MultiIndex.from_frame(seasons.iloc[self.starts][['Player', team_col]])
+        self.seasons = seasons['Season'].to_numpy()
+        self.codes = group * _SEASON_SPAN + self.seasons
+        self.totals = seasons[self.stats].to_numpy(dtype=float)
+        # running[i] = sum of rows before i, so a range sum is running[stop] - running[start]
+        self.running = np.vstack([np.zeros((1, len(self.stats))), np.cumsum(self.totals, axis=0)])
+
+    def __len__(self):
+        return len(self.keys)
+
+    def lookup(self, players, teams, final_seasons):
+        """
+        Cumulative (seasons <= final) and final-season totals for aligned players / teams / final seasons.
+        Returns a frame with OUTPUT_COLS (positional index); rows without a (player, team) entry are NaN.
+        """
+        players = pd.Series(players, dtype=object).to_numpy()
+        teams = pd.Series(teams, dtype=object).to_numpy()
+        final = pd.to_numeric(pd.Series(final_seasons), errors='coerce').to_numpy(dtype=float)
+        gid = self.keys.get_indexer(pd.MultiIndex.from_arrays([players, teams]))
+        found = (gid >= 0) & ~np.isnan(final)
+        if not found.any():
+            return pd.DataFrame({col: np.full(len(players), np.nan) for col, (stat, _) in OUTPUT_COLS.items()
+                                 if stat in self.stats})
+        g = np.where(found, gid, 0)
+        season = np.where(found, final, 0).astype(np.int64)
+        start = self.starts[g]
+        # First row past the final season within the group
+        stop = np.maximum(np.searchsorted(self.codes, g * _SEASON_SPAN + season, side='right'), start)
+        cumulative = self.running[stop] - self.running[start]
+        last = np.maximum(stop - 1, 0)
+        in_final = (stop > start) & (self.seasons[last] == season)
+        final_season = np.where(in_final[:, None], self.totals[last], 0.0)
+        out = {}
+        for col, (stat, window) in OUTPUT_COLS.items():
+            if stat not in self.stats:
+                continue
+            j = self.stats.index(stat)
+            values = cumulative[:, j] if window == 'cumulative' else final_season[:, j]
+            out[col] = np.where(found, values, np.nan)
+        return pd.DataFrame(out)
+
+    def lookup_one(self, player, team, final_season):
+        """lookup() for one player: {output column: value}, or None when the player has no entry."""
+        row = self.lookup([player], [team], [final_season]).iloc[0]
+        return None if row.isna().all() else row.to_dict()
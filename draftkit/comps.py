@@ -0,0 +1,185 @@
+"""
+Historical comps: the nearest earlier prospects to each player of a class, on standardized combine + PFF profiles.
+- The pool is a position's training and testing CSVs (every class before the draft year, 2015-2025 for 2026).
+  Profiles are COMP_FEATURES plus the position's PFF rates from ROUND_FEATURES, built with FeatureBuilder
+  (Height in inches, ...), z-scored against the pool and completed with NeighborImputer so every pool row
+  sits in the tree.
+- CompIndex keeps one KD-tree (sklearn.neighbors.KDTree) per set of features a query has: the full
+  profile and the combine-only profile are built up front and pickled with the index to
+  data/models/<prefix>_comps.pkl; other masks are built on first use. The index is rebuilt when the pool CSVs
+  change.
+- query() groups a class by missing-feature mask and answers each group with one tree query, so a query only
+  compares the features it recorded. Distances are scaled as nan-Euclidean (by n_features / n_compared).
+- Returns k comps per player: Player, School, Year, Round (NaN when undrafted), distance and features compared.
+Run from the project root: python -m draftkit.comps cb [CB/cb_drafted_2026.csv] [-k 5] [-o comps.csv]
+"""
+import argparse
+import os
+import pickle
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .cache import file_hash
+from .features import FeatureBuilder
+from .imputer import NeighborImputer
+from .paths import DATA_PROCESSED, PROJECT_ROOT, position_dir
+from .positions import POSITIONS
+from .round_model import MODELS_DIR, SCHOOL_ALIAS_BY_POSITION, college_features
+
+COMP_FEATURES = ['Height', 'Weight', '40yd', 'Vertical', 'Broad Jump', 'RAS', 'arm_length_inches']
+YEAR = 2026
+K = 5
+# Bump when the profile or the index layout changes
+COMPS_VERSION = 1
+POOL_COLS = ['Player', 'School', 'Year', 'Drafted', 'Round', 'Pick']
+
+
+def comp_features(name):
+    """COMP_FEATURES then the position's PFF columns (the round model's features less the derived ones)."""
+    return COMP_FEATURES + college_features(name)
+
+
+def pool_paths(name):
+    prefix = POSITIONS[name]['output_prefix']
+    return [os.path.join(DATA_PROCESSED, f'{prefix}_{split}.csv') for split in ('training', 'testing')]
+
+
+def index_path(name):
+    return os.path.join(MODELS_DIR, f'{POSITIONS[name]["output_prefix"]}_comps.pkl')
+
+
+class CompIndex:
+    """Standardized, imputed pool profiles with a KD-tree per feature mask."""
+
+    def __init__(self, name, pool, year=YEAR, leaf_size=20):
+        self.name = name
+        self.year = year
+        self.leaf_size = leaf_size
+        self.features = comp_features(name)
+        self.builder = FeatureBuilder(self.features, SCHOOL_ALIAS_BY_POSITION[name])
+        pool = pool[pool['Year'] < year].reset_index(drop=True)
+        profiles = self.builder.fit_transform(pool)[self.features].apply(pd.to_numeric, errors='coerce')
+        self.mean = profiles.mean().to_numpy()
+        std = profiles.std().to_numpy()
+        self.std = np.where((std > 0) & np.isfinite(std), std, 1.0)
+        z = (profiles.to_numpy(dtype=float) - self.mean) / self.std
+        # Features nobody in the pool recorded stay out of every comparison
+        self.usable = ~np.isnan(z).all(axis=0)
+        self.matrix = np.zeros_like(z)
+        self.matrix[:, self.usable] = NeighborImputer(n_neighbors=10).fit_transform(z)
+        self.pool = pool.reindex(columns=POOL_COLS)
+        self.trees = {}
+        self.tree(self.usable)
+        self.tree(self.usable & np.isin(self.features, COMP_FEATURES))
+        self.sources = None
+
+    def __len__(self):
+        return len(self.pool)
+
+    def tree(self, mask):
+        """KD-tree over the pool's columns in mask (built once per mask)."""
+        from sklearn.neighbors import KDTree
+
+        key = np.packbits(mask).tobytes()
+        if key not in self.trees:
+            self.trees[key] = KDTree(self.matrix[:, mask], leaf_size=self.leaf_size)
+        return self.trees[key]
+
+    def profiles(self, df, year=None):
+        """Standardized query profiles (NaN where a feature is missing)."""
+        profiles = self.builder.transform(df, year=year)[self.features].apply(pd.to_numeric, errors='coerce')
+        return (profiles.to_numpy(dtype=float) - self.mean) / self.std
+
+    def query(self, df, k=K, year=None):
+        """k comps per df row, one row per (player, comp): query_row, comp_rank, pool columns, distance, compared."""
+        z = self.profiles(df, year=year)
+        present = ~np.isnan(z) & self.usable
+        k = min(k, len(self))
+        dist = np.full((len(z), k), np.nan)
+        idx = np.full((len(z), k), -1)
+        masks, group = np.unique(present, axis=0, return_inverse=True)
+        for g, mask in enumerate(masks):
+            if not mask.any():
+                continue
+            rows = np.flatnonzero(group.ravel() == g)
+            d, i = self.tree(mask).query(z[np.ix_(rows, np.flatnonzero(mask))], k=k)
+            dist[rows] = d * np.sqrt(self.usable.sum() / mask.sum())
+            idx[rows] = i
+        found = idx >= 0
+        comps = self.pool.iloc[idx[found]].reset_index(drop=True)
+        out = pd.DataFrame({'query_row': np.repeat(np.arange(len(z)), found.sum(axis=1)),
+                            'comp_rank': np.nonzero(found)[1] + 1})
+        out = pd.concat([out, comps], axis=1)
+        out['distance'] = dist[found]
+        out['compared'] = np.repeat(present.sum(axis=1), found.sum(axis=1))
+        return out
+
+
+def build_comp_index(name, year=YEAR, save=True):
+    """Build the position's index from its pool CSVs (and write it)."""
+    paths = [p for p in pool_paths(name) if os.path.exists(p)]
+    pool = pd.concat([pd.read_csv(p) for p in paths], ignore_index=True)
+    index = CompIndex(name, pool, year)
+    index.sources = {(COMPS_VERSION, year): {os.path.relpath(p, PROJECT_ROOT): file_hash(p) for p in paths}}
+    if save:
+        os.makedirs(MODELS_DIR, exist_ok=True)
+        tmp = f'{index_path(name)}.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, index_path(name))
+        print(f'Saved {os.path.relpath(index_path(name), PROJECT_ROOT)} ({len(index)} pool players)')
+    return index
+
+
+def load_comp_index(name, year=YEAR):
+    """The saved index, rebuilt when it is missing, older or built from different pool files."""
+    path = index_path(name)
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            index = pickle.load(f)
+        paths = [p for p in pool_paths(name) if os.path.exists(p)]
+        current = {os.path.relpath(p, PROJECT_ROOT): file_hash(p) for p in paths}
+        if getattr(index, 'sources', None) == {(COMPS_VERSION, year): current}:
+            return index
+    return build_comp_index(name, year)
+
+
+def find_comps(name, df, k=K, year=YEAR, index=None):
+    """df's players with their k comps (the prospect's Player and School prefixed 'prospect_')."""
+    index = index or load_comp_index(name, year)
+    comps = index.query(df, k=k, year=year)
+    prospects = df.reset_index(drop=True)[['Player', 'School']].add_prefix('prospect_')
+    return pd.concat([prospects.iloc[comps['query_row']].reset_index(drop=True), comps.drop(columns='query_row')], axis=1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Find the nearest historical comps for a class of prospects.')
+    parser.add_argument('position')
+    parser.add_argument('csv', nargs='?', help='default: <Pos>/<prefix>_drafted_2026.csv')
+    parser.add_argument('-k', type=int, default=K, help='comps per prospect (default: %(default)s)')
+    parser.add_argument('--year', type=int, default=YEAR, help='draft year of the class; the pool is every earlier class')
+    parser.add_argument('--rebuild', action='store_true', help='rebuild the index even if it is current')
+    parser.add_argument('-o', '--output', help='write every comp to this CSV')
+    args = parser.parse_args(argv)
+    name = args.position.lower()
+    if name not in POSITIONS:
+        print(f'Unknown position(s): {name}. Choose from: {", ".join(POSITIONS)}')
+        return 2
+    cfg = POSITIONS[name]
+    path = args.csv or os.path.join(position_dir(cfg), f'{cfg["drafted_prefix"]}_drafted_{args.year}.csv')
+    index = build_comp_index(name, args.year) if args.rebuild else load_comp_index(name, args.year)
+    comps = find_comps(name, pd.read_csv(path), k=args.k, year=args.year, index=index)
+    for player, rows in comps.groupby('prospect_Player', sort=False):
+        listed = '; '.join(f'{r.Player} ({r.Year}, {"R" + str(int(r.Round)) if pd.notna(r.Round) else "UDFA"})'
+                           for r in rows.itertuples())
+        print(f'{player}: {listed}')
+    if args.output:
+        comps.to_csv(args.output, index=False)
+        print(f'Wrote {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
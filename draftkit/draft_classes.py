@@ -0,0 +1,192 @@
+"""
+2024/2025/2026 draft classes for positions without <prefix>_drafted_2024/2025.csv (CB, S).
+- 2024 from data/raw/2024 Draft - Public - <POS>.csv (combine + pick -> round).
+- Sheet encodings (FIIE height, FFII broad, 3068 arm, pick -> round) are parsed column-wise (formats.py).
+- 2025 from data/raw/GabrielGTB 2025 NFL Combine - Master List.csv (parsed once for every position in sources.py;
+  rows whose Position is in cfg['master_list_positions']), Round/Pick from
+  2025_draft_picks.csv (PFR) then <prefix>_drafted_2025.csv; the result is written back to <prefix>_drafted_2025.csv
+  (write=False skips that, e.g. for the benchmark and the registry, which only read the classes).
+- 2026 prospects from <prefix>_drafted_2026.csv (PFF/RAS merged later by the pipeline).
+"""
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from .formats import broad_to_inches, column, ht_to_inches, numeric, pick_to_int, pick_to_round, sheet_arm_to_inches
+from .paths import DATA_RAW, position_dir
+from .sources import load_draft_picks_2025, load_master_list_2025, sheet_class
+
+CLASS_COLS = ['Year', 'Player', 'Pos', 'School', 'Height', 'Weight', '40yd', 'Vertical', 'Bench', 'Broad Jump',
+              '3Cone', 'Shuttle', 'Drafted', 'Round', 'Pick', 'RAS']
+
+
+_NAME_SUFFIX = re.compile(r'\s+Jr\.?$|\s+III$|\s+II$|\s+IV$', re.IGNORECASE)
+# Draft-pick (PFR) and master-list school spellings -> one spelling for the Round/Pick merge
+_PICK_SCHOOL_ALIASES = {
+    'Penn St.': 'Penn State', 'Ohio St.': 'Ohio State', 'Kansas St.': 'Kansas State',
+    'Boston Col.': 'Boston College', 'North Carolina St.': 'North Carolina State',
+    'Florida St.': 'Florida State', 'Washington St.': 'Washington State',
+    'Iowa St.': 'Iowa State', 'Ole Miss': 'Mississippi', 'Syracruse': 'Syracuse',
+}
+
+
+def norm_name(name):
+    """Player name without a Jr./II/III/IV suffix, for the Round/Pick merge."""
+    if pd.isna(name):
+        return ''
+    return _NAME_SUFFIX.sub('', str(name).strip()).strip()
+
+
+def norm_school(s):
+    """School with the draft-pick and master-list spellings folded together, for the Round/Pick merge."""
+    if pd.isna(s) or str(s).strip() == '':
+        return ''
+    x = str(s).strip()
+    return _PICK_SCHOOL_ALIASES.get(x, x)
+
+
+def load_2024_class(cfg):
+    """2024 class from the public draft sheet; column names differ between sheets (CB: ov/BJ/VJ/BP/3C, S: Pick Taken/...)."""
+    pos = cfg['sheet_position']
+    path = os.path.join(DATA_RAW, f'2024 Draft - Public - {pos}.csv')
+    if not os.path.exists(path):
+        print(f'{os.path.basename(path)} not found.')
+        return pd.DataFrame(columns=CLASS_COLS)
+    d24 = pd.read_csv(path)
+    # Drop subheader row if present (row with no Name)
+    d24 = d24[d24['Name'].notna() & (d24['Name'].astype(str).str.strip() != '')].copy()
+    pick_taken = column(d24, 'Pick Taken', 'ov', d24.columns[0])
+    class_2024 = pd.DataFrame({
+        'Year': 2024,
+        'Player': d24['Name'].to_numpy(),
+        'Pos': pos,
+        'School': d24['School'].to_numpy(),
+        'Height': ht_to_inches(column(d24, 'HT')),
+        'Weight': numeric(d24, 'WT'),
+        '40yd': numeric(d24, '40'),
+        'Vertical': numeric(d24, 'Vert', 'VJ'),
+        'Bench': numeric(d24, 'Bench', 'BP'),
+        'Broad Jump': broad_to_inches(column(d24, 'Broad', 'BJ')),
+        '3Cone': numeric(d24, '3Cone', '3C'),
+        'Shuttle': numeric(d24, 'SS'),
+        'Drafted': True,
+        'Round': pick_to_round(pick_taken),
+        'Pick': pick_to_int(pick_taken),
+        'RAS': numeric(d24, 'RAS'),
+        # CB sheet has Arm as decimal inches (31.625); S sheet uses 3068 format
+        'arm_length_inches': sheet_arm_to_inches(column(d24, 'Arm')),
+    }, index=range(len(d24)))
+    print(f'Loaded 2024 {pos}: {len(class_2024)} from {os.path.basename(path)}')
+    return class_2024
+
+
+def _round_pick_from_pfr(cfg):
+    """2025_draft_picks.csv rows for this position keyed by (Player_norm, School_norm); None if unavailable."""
+    draft_all = load_draft_picks_2025()
+    if draft_all is None:
+        return None
+    drafted = draft_all[draft_all['Pos'].astype(str).str.upper().isin(cfg['draft_pick_positions'])].copy()
+    if drafted.empty:
+        return None
+    drafted = drafted.rename(columns={'Rnd': 'Round'})
+    drafted['Player_norm'] = drafted['Player'].astype(str).map(norm_name)
+    drafted['School_norm'] = drafted['School'].astype(str).map(norm_school)
+    round_pick = drafted[['Player_norm', 'School_norm', 'Round', 'Pick']].drop_duplicates()
+    print(f'Loaded 2025 draft {cfg["sheet_position"]}: {len(round_pick)} from 2025_draft_picks.csv')
+    return round_pick
+
+
+def load_2025_class(cfg, write=True):
+    """2025 class from the GabrielGTB master list + Round/Pick; writes <prefix>_drafted_2025.csv unless write=False."""
+    pos = cfg['sheet_position']
+    class_2025 = sheet_class(load_master_list_2025(), cfg['master_list_positions'])
+    if class_2025 is None:
+        print('GabrielGTB 2025 NFL Combine - Master List.csv not found.')
+        return pd.DataFrame(columns=CLASS_COLS)
+    class_2025['Pos'] = pos
+    drafted_2025_path = os.path.join(position_dir(cfg), f'{cfg["drafted_prefix"]}_drafted_2025.csv')
+
+    # 2025 Round/Pick: prefer data/raw/2025_draft_picks.csv (PFR), then <prefix>_drafted_2025.csv
+    round_pick_2025 = _round_pick_from_pfr(cfg)
+    class_2025 = class_2025.drop(columns=['Round', 'Pick'], errors='ignore')
+    class_2025['Player_norm'] = class_2025['Player'].astype(str).map(norm_name)
+    class_2025['School_norm'] = class_2025['School'].astype(str).map(norm_school)
+    if round_pick_2025 is not None and not round_pick_2025.empty:
+        class_2025 = class_2025.merge(round_pick_2025, on=['Player_norm', 'School_norm'], how='left', suffixes=('', '_draft'))
+        class_2025 = class_2025.drop(columns=['Player_norm', 'School_norm'], errors='ignore')
+        # If any Round/Pick still missing, try <prefix>_drafted_2025.csv
+        missing = class_2025['Round'].isna()
+        if missing.any() and os.path.exists(drafted_2025_path):
+            draft25 = pd.read_csv(drafted_2025_path)
+            if 'Player' in draft25.columns and 'Round' in draft25.columns:
+                fill = draft25[['Player', 'Round', 'Pick']].drop_duplicates()
+                fill = fill.rename(columns={'Round': 'Round_fill', 'Pick': 'Pick_fill'})
+                class_2025 = class_2025.merge(fill, left_on='Player', right_on='Player', how='left')
+                class_2025['Round'] = class_2025['Round'].fillna(class_2025['Round_fill'])
+                class_2025['Pick'] = class_2025['Pick'].fillna(class_2025['Pick_fill'])
+                class_2025 = class_2025.drop(columns=['Round_fill', 'Pick_fill'], errors='ignore')
+    else:
+        class_2025 = class_2025.drop(columns=['Player_norm', 'School_norm'], errors='ignore')
+        if os.path.exists(drafted_2025_path):
+            draft25 = pd.read_csv(drafted_2025_path)
+            if 'Player' in draft25.columns and 'Round' in draft25.columns:
+                round_pick = draft25[['Player', 'Year', 'Round', 'Pick']].drop_duplicates()
+                class_2025['Year'] = 2025
+                class_2025 = class_2025.merge(round_pick, on=['Player', 'Year'], how='left')
+
+    if write and (not os.path.exists(drafted_2025_path) or class_2025['Round'].notna().any()):
+        out_cols = [c for c in ['Year', 'Player', 'Pos', 'School', 'Height', 'Weight', '40yd', 'Vertical', 'Bench',
+                                'Broad Jump', '3Cone', 'Shuttle', 'Round', 'Pick', 'RAS', 'arm_length_inches']
+                    if c in class_2025.columns]
+        class_2025[out_cols].to_csv(drafted_2025_path, index=False)
+    print(f'Loaded 2025 {pos}: {len(class_2025)} from GabrielGTB 2025 combine')
+    return class_2025
+
+
+def load_sheet_testing(cfg, write=True):
+    """2024 + 2025 drafted players (Round 1-7 only; undrafted and unknown rounds dropped)."""
+    class_2024 = load_2024_class(cfg)
+    class_2025 = load_2025_class(cfg, write=write)
+    if class_2024.empty and class_2025.empty:
+        testing = pd.DataFrame()
+    elif class_2024.empty:
+        testing = class_2025.copy()
+    elif class_2025.empty:
+        testing = class_2024.copy()
+    else:
+        testing = pd.concat([class_2024, class_2025], ignore_index=True)
+    if not testing.empty:
+        testing['Year'] = testing['Year'].astype(int)
+        testing['Drafted'] = True
+        testing = testing[testing['Round'].notna() & (testing['Round'] != 8)].copy()
+        if 'arm_length_inches' not in testing.columns:
+            testing['arm_length_inches'] = np.nan
+    return testing.drop(columns=cfg['cols_drop'], errors='ignore')
+
+
+def load_2026_prospects(cfg):
+    """<prefix>_drafted_2026.csv prospects (no combine yet: Round/Pick/RAS empty)."""
+    pos = cfg['sheet_position']
+    path = os.path.join(position_dir(cfg), f'{cfg["drafted_prefix"]}_drafted_2026.csv')
+    prospects = pd.read_csv(path) if os.path.exists(path) else None
+    if prospects is None or 'Player' not in prospects.columns or 'School' not in prospects.columns:
+        print(f'No usable {os.path.basename(path)}; using empty 2026.')
+        prospects = pd.DataFrame(columns=CLASS_COLS)
+        prospects['Year'] = 2026
+        prospects['Drafted'] = True
+        return prospects.drop(columns=cfg['cols_drop'], errors='ignore')
+    prospects = prospects.copy()
+    prospects['Year'] = 2026
+    prospects['Pos'] = pos
+    prospects['Drafted'] = True
+    prospects['Round'] = np.nan
+    prospects['Pick'] = np.nan
+    prospects['RAS'] = np.nan
+    for col in ['Height', 'Weight', 'Vertical', 'Bench', 'Broad Jump', '3Cone', 'Shuttle', 'arm_length_inches']:
+        if col not in prospects.columns:
+            prospects[col] = np.nan
+    prospects['40yd'] = pd.to_numeric(prospects.get('40yd', prospects.get('40', np.nan)), errors='coerce')
+    print(f'Loaded 2026 {pos}: {len(prospects)} from {os.path.basename(path)} (PFF/RAS will be merged)')
+    return prospects.drop(columns=cfg['cols_drop'], errors='ignore')
@@ -0,0 +1,286 @@
+"""
+Drafted / undrafted classifiers from <Pos>/<pos>_analysis.ipynb (DT first), trained together and saved to disk.
+- Feature sets per position (FEATURE_SETS): combine_only (the notebook's COMBINE_ONLY_FEATURES), with_college
+  (the round model's features: combine, RAS, arm length, PFF college production, p4), with_college_agility
+  (plus agility_score from 3Cone / Shuttle) and college_only (PFF production, p4, Height, Weight).
+- Each set's matrix is built once from <prefix>_training.csv (FeatureBuilder -> NeighborImputer(10) ->
+  StandardScaler) and shared by every model: LogisticRegression on the scaled matrix, RandomForest and (when
+  xgboost is installed) XGBoost on the imputed one, with the notebook's settings.
+- The (feature set, model) fits run in a process pool and are pickled together, with each set's
+  builder / imputer / scaler, to data/models/<prefix>_draft_classifier.pkl.
+- score_frame transforms a class once per feature set and adds prob_<model>_<set> for every fit plus
+  combined_prob_<model> = mean of the combine_only and with_college probabilities (the notebook's
+  combined_prob); combined_prob / drafted_pred are the logistic pair's.
+Run from the project root:
+  python -m draftkit.draft_classifier fit [dt edges ...] [--jobs N]   (evaluates on <prefix>_testing.csv)
+  python -m draftkit.draft_classifier score dt [DT/dt_drafted_2026.csv ...] [-o out.csv]
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .cache import file_hash
+from .features import FeatureBuilder
+from .imputer import NeighborImputer
+from .paths import DATA_PROCESSED, PROJECT_ROOT, position_dir
+from .positions import POSITIONS
+from .round_model import (MODELS_DIR, ROUND_FEATURES, SCHOOL_ALIAS_BY_POSITION, college_features, load_training,
+                          training_path_for)
+
+try:
+    import xgboost
+except ImportError:  # xgboost is optional; its models are skipped
+    xgboost = None
+
+# Bump when feature building or the model settings change
+CLASSIFIER_VERSION = 1
+N_NEIGHBORS = 10
+COMBINE_ONLY = ['Broad Jump', 'Vertical', '40yd', 'Height', 'Weight', 'speed_score', 'explosive_score', 'p4_conference']
+
+
+FEATURE_SETS = {
+    'combine_only': lambda name: COMBINE_ONLY,
+    'with_college': lambda name: ROUND_FEATURES[name],
+    'with_college_agility': lambda name: ROUND_FEATURES[name] + ['agility_score'],
+    'college_only': lambda name: college_features(name) + ['p4_conference', 'Height', 'Weight'],
+}
+# combined_prob_<model> averages these two sets, as the notebook's combined_prob does
+COMBINED = ('combine_only', 'with_college')
+
+
+def _logistic():
+    from sklearn.linear_model import LogisticRegression
+    return LogisticRegression(max_iter=1000, random_state=42)
+
+
+def _random_forest():
+    from sklearn.ensemble import RandomForestClassifier
+    return RandomForestClassifier(n_estimators=200, max_depth=8, random_state=42, class_weight='balanced')
+
+
+def _xgboost():
+    return xgboost.XGBClassifier(n_estimators=200, max_depth=4, learning_rate=0.1, random_state=42, eval_metric='logloss')
+
+
+# model -> (matrix it is fitted on, constructor)
+MODELS = {
+    'logistic': ('scaled', _logistic),
+    'rf': ('imputed', _random_forest),
+    'xgb': ('imputed', _xgboost),
+}
+
+
+def available_models():
+    return [m for m in MODELS if m != 'xgb' or xgboost is not None]
+
+
+def schema_hash(name, training_path=None):
+    """Hash of the feature sets, school aliases and model settings it was fitted with, and of the training CSV."""
+    training_path = training_path or training_path_for(name)
+    schema = {
+        'version': CLASSIFIER_VERSION,
+        'sets': {fs: FEATURE_SETS[fs](name) for fs in FEATURE_SETS},
+        'alias': sorted(SCHOOL_ALIAS_BY_POSITION[name].items()),
+        'models': available_models(),
+        'training_sha1': file_hash(training_path) if os.path.exists(training_path) else None,
+    }
+    return hashlib.sha1(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+def model_path(name):
+    return os.path.join(MODELS_DIR, f'{POSITIONS[name]["output_prefix"]}_draft_classifier.pkl')
+
+
+def drafted_target(df):
+    return df['Drafted'].astype(bool).astype(int).to_numpy()
+
+
+class FeatureMatrix:
+    """One feature set's builder, imputer and scaler, fitted on the training rows."""
+
+    def __init__(self, name, feature_set):
+        self.feature_set = feature_set
+        self.builder = FeatureBuilder(FEATURE_SETS[feature_set](name), SCHOOL_ALIAS_BY_POSITION[name])
+        self.imputer = NeighborImputer(n_neighbors=N_NEIGHBORS)
+        self.scaler = None
+
+    def fit_transform(self, df):
+        """{'imputed', 'scaled'} training matrices."""
+        from sklearn.preprocessing import StandardScaler
+
+        imputed = self.imputer.fit_transform(self.builder.fit_transform(df)[self.builder.columns])
+        self.scaler = StandardScaler()
+        return {'imputed': imputed, 'scaled': self.scaler.fit_transform(imputed)}
+
+    def transform(self, df, year=None):
+        imputed = self.imputer.transform(self.builder.transform(df, year=year)[self.builder.columns])
+        return {'imputed': imputed, 'scaled': self.scaler.transform(imputed)}
+
+
+def _fit_task(task):
+    """Pool task: fit one model on one feature set's shared matrix; returns (feature set, model, estimator, seconds)."""
+    feature_set, model, X, y = task
+    kind, make = MODELS[model]
+    t0 = time.perf_counter()
+    estimator = make().fit(X[kind], y)
+    return feature_set, model, estimator, time.perf_counter() - t0
+
+
+def fit_classifiers(name, training_path=None, save=True, jobs=None):
+    """Build each feature set once, fit every (feature set, model) in a process pool; returns the artifact dict."""
+    training_path = training_path or training_path_for(name)
+    df = load_training(name, training_path)
+    y = drafted_target(df)
+    matrices = {fs: FeatureMatrix(name, fs) for fs in FEATURE_SETS}
+    X = {fs: matrix.fit_transform(df) for fs, matrix in matrices.items()}
+    tasks = [(fs, m, X[fs], y) for fs in FEATURE_SETS for m in available_models()]
+    jobs = jobs or min(len(tasks), os.cpu_count() or 1)
+    if jobs == 1:
+        results = [_fit_task(task) for task in tasks]
+    else:
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        with ctx.Pool(jobs) as pool:
+            results = pool.map(_fit_task, tasks)
+    artifact = {
+        'position': name,
+        'schema_hash': schema_hash(name, training_path),
+        'matrices': matrices,
+        'models': {(fs, m): est for fs, m, est, _ in results},
+        'fit_seconds': {(fs, m): s for fs, m, _, s in results},
+        'training_rows': len(df),
+        'training_path': os.path.relpath(training_path, PROJECT_ROOT),
+    }
+    if save:
+        os.makedirs(MODELS_DIR, exist_ok=True)
+        tmp = f'{model_path(name)}.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, model_path(name))
+        print(f'Saved {os.path.relpath(model_path(name), PROJECT_ROOT)} ({len(results)} models, {len(df)} training rows)')
+    return artifact
+
+
+def load_classifiers(name):
+    """Saved artifact for a position; raises if it is missing or its schema or training CSV has changed."""
+    path = model_path(name)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f'No draft classifier for {name}; run: python -m draftkit.draft_classifier fit {name}')
+    with open(path, 'rb') as f:
+        artifact = pickle.load(f)
+    training_path = artifact.get('training_path')
+    if artifact.get('schema_hash') != schema_hash(name, training_path and os.path.join(PROJECT_ROOT, training_path)):
+        raise ValueError(f'{os.path.basename(path)} was fitted with a different schema or training CSV; '
+                         f'run: python -m draftkit.draft_classifier fit {name}')
+    return artifact
+
+
+def predict_probs(artifact, df, year=None):
+    """Frame (df's index) of prob_<model>_<set> for every fitted model, each set transformed once."""
+    probs = {}
+    for feature_set, matrix in artifact['matrices'].items():
+        X = matrix.transform(df, year=year)
+        for (fs, model), estimator in artifact['models'].items():
+            if fs == feature_set:
+                probs[f'prob_{model}_{fs}'] = estimator.predict_proba(X[MODELS[model][0]])[:, 1]
+    for model in dict.fromkeys(m for _, m in artifact['models']):
+        pair = [f'prob_{model}_{fs}' for fs in COMBINED]
+        if all(col in probs for col in pair):
+            probs[f'combined_prob_{model}'] = (probs[pair[0]] + probs[pair[1]]) / 2
+    return pd.DataFrame(probs, index=df.index)
+
+
+def score_frame(artifact, df, year=None):
+    """df with every model's drafted probability, the combined probabilities and drafted_pred appended."""
+    probs = predict_probs(artifact, df, year=year)
+    out = pd.concat([df, probs], axis=1)
+    out['combined_prob'] = probs['combined_prob_logistic']
+    out['drafted_pred'] = (out['combined_prob'] >= 0.5).astype(int)
+    return out
+
+
+def evaluate(artifact, df):
+    """Accuracy at 0.5 and ROC-AUC (NaN unless both classes are present) per probability column, against Drafted."""
+    from sklearn.metrics import roc_auc_score
+
+    y = drafted_target(df)
+    probs = predict_probs(artifact, df)
+    both = len(np.unique(y)) == 2
+    return pd.DataFrame({
+        'accuracy': [((probs[col] >= 0.5).astype(int) == y).mean() for col in probs.columns],
+        'roc_auc': [roc_auc_score(y, probs[col]) if both else np.nan for col in probs.columns],
+    }, index=probs.columns)
+
+
+def score_csv(name, path=None, output_path=None, year=None, artifact=None):
+    """Score a drafted_<year>-style CSV (default: the position's drafted_2026.csv) and write <stem>_drafted_probs.csv."""
+    cfg = POSITIONS[name]
+    path = path or os.path.join(position_dir(cfg), f'{cfg["drafted_prefix"]}_drafted_2026.csv')
+    artifact = artifact or load_classifiers(name)
+    scored = score_frame(artifact, pd.read_csv(path), year=year)
+    output_path = output_path or f'{os.path.splitext(path)[0]}_drafted_probs.csv'
+    scored.to_csv(output_path, index=False)
+    print(f'Scored {len(scored)} {name} rows -> {os.path.relpath(output_path, PROJECT_ROOT)}')
+    return scored
+
+
+def _check_names(names):
+    unknown = [n for n in names if n not in POSITIONS]
+    if unknown:
+        print(f'Unknown position(s): {", ".join(unknown)}. Choose from: {", ".join(POSITIONS)}')
+    return not unknown
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fit and apply the drafted / undrafted classifiers.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    fit = sub.add_parser('fit', help='fit and save every feature set x model for each position')
+    fit.add_argument('positions', nargs='*', help=f'default: all ({", ".join(POSITIONS)})')
+    fit.add_argument('--jobs', type=int, help='worker processes (default: CPU count)')
+    score = sub.add_parser('score', help='score drafted_<year>-style CSVs with the saved classifiers')
+    score.add_argument('position')
+    score.add_argument('csvs', nargs='*', help='default: <Pos>/<prefix>_drafted_2026.csv')
+    score.add_argument('-o', '--output', help='output path (one input CSV only); default <stem>_drafted_probs.csv')
+    score.add_argument('--year', type=int, help='draft year for every row (default: the Year column)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'fit':
+        if xgboost is None:
+            print('xgboost is not installed; fitting logistic and random-forest models only')
+        names = [n.lower() for n in args.positions] or list(POSITIONS)
+        if not _check_names(names):
+            return 2
+        for name in names:
+            t0 = time.perf_counter()
+            artifact = fit_classifiers(name, jobs=args.jobs)
+            print(f'{name}: fitted in {time.perf_counter() - t0:.1f}s')
+            testing = os.path.join(DATA_PROCESSED, f'{POSITIONS[name]["output_prefix"]}_testing.csv')
+            if os.path.exists(testing):
+                scores = evaluate(artifact, pd.read_csv(testing))
+                for col, row in scores.iterrows():
+                    auc = '' if np.isnan(row['roc_auc']) else f', ROC-AUC {row["roc_auc"]:.3f}'
+                    print(f'  {col}: testing accuracy {row["accuracy"]:.3f}{auc}')
+        return 0
+
+    name = args.position.lower()
+    if not _check_names([name]):
+        return 2
+    if args.output and len(args.csvs) > 1:
+        print('--output needs exactly one input CSV')
+        return 2
+    artifact = load_classifiers(name)
+    for path in args.csvs or [None]:
+        score_csv(name, path, output_path=args.output, year=args.year, artifact=artifact)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Monte Carlo simulation of the 2026 draft for the Edges, DT, LB, CB and S prospects.
+- Each prospect's draft value is Normal(predicted_round, residual_std of the position's round model), in
+  rounds; the round models are loaded from data/models (or fitted in memory when none is saved or it is stale).
+- A simulated draft draws every prospect's value at once, maps it to a pick through ROUND_LAST_PICK (value
+  r +/- 0.5 spans round r's picks; 7.5 or later is undrafted), then orders the class so no two prospects share
+  a pick: the k-th best value gets pick max(its own pick, previous pick + 1), one maximum.accumulate per batch.
+- Drafts are drawn BATCH_SIMS at a time as (sims x prospects) arrays and only per-prospect counts are kept;
+  each batch is a pool task with its own seed (SeedSequence.spawn), and --jobs only sizes the pool, so
+  results depend on --seed, not on --jobs.
+- Reports per prospect: P(round 1..7), P(undrafted), P(pick in each PICK_RANGES bucket), median and mean pick.
+Run from the project root: python -m draftkit.draft_sim [--sims 100000] [--jobs N] [--seed S] [-o out.csv]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .paths import position_dir
+from .positions import POSITIONS
+from .round_model import fit_round_model, load_round_model, score_frame
+
+YEAR = 2026
+N_SIMS = 100000
+BATCH_SIMS = 10000
+SEED = 2026
+# Last overall pick of rounds 1-7 (the 2025 draft's layout, compensatory picks included)
+ROUND_LAST_PICK = (32, 64, 102, 138, 176, 216, 257)
+UNDRAFTED = ROUND_LAST_PICK[-1] + 1
+# (first pick, last pick, label)
+PICK_RANGES = [(1, 10, 'top10'), (11, 32, 'picks_11_32'), (33, 64, 'picks_33_64'), (65, 100, 'picks_65_100'),
+               (101, 150, 'picks_101_150'), (151, UNDRAFTED - 1, 'picks_151_plus')]
+# Value (in rounds) -> continuous pick: round r covers r - 0.5 .. r + 0.5
+_VALUE_KNOTS = np.arange(len(ROUND_LAST_PICK) + 1) + 0.5
+_PICK_KNOTS = np.array((0,) + ROUND_LAST_PICK, dtype=float)
+
+
+def load_prospects(names=None, year=YEAR):
+    """One row per prospect with position, predicted_round and the position model's residual_std."""
+    frames = []
+    for name in names or list(POSITIONS):
+        cfg = POSITIONS[name]
+        try:
+            artifact = load_round_model(name)
+        except (FileNotFoundError, ValueError) as e:
+            print(f'{e.args[0].split(";")[0]}; fitting one in memory')
+            artifact = fit_round_model(name, save=False)
+        path = os.path.join(position_dir(cfg), f'{cfg["drafted_prefix"]}_drafted_{year}.csv')
+        scored = score_frame(artifact, pd.read_csv(path), year=year)
+        frames.append(pd.DataFrame({'position': name, 'Player': scored['Player'], 'School': scored['School'],
+                                    'predicted_round': scored['predicted_round'],
+                                    'residual_std': artifact['residual_std']}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def simulate_picks(mu, sigma, n_sims, rng):
+    """(n_sims x prospects) overall picks for one batch; UNDRAFTED where a prospect goes undrafted."""
+    value = mu + sigma * rng.standard_normal((n_sims, len(mu)))
+    order = np.argsort(value, axis=1)
+    ranked = np.take_along_axis(value, order, axis=1)
+    wanted = np.maximum(np.ceil(np.interp(ranked, _VALUE_KNOTS, _PICK_KNOTS)), 1)
+    # Earliest free pick at or after the wanted one, given everyone ranked ahead
+    offset = np.arange(len(mu))
+    ranked_pick = np.maximum.accumulate(wanted - offset, axis=1) + offset
+    ranked_pick[(ranked >= _VALUE_KNOTS[-1]) | (ranked_pick >= UNDRAFTED)] = UNDRAFTED
+    picks = np.empty_like(ranked_pick, dtype=np.int16)
+    np.put_along_axis(picks, order, ranked_pick.astype(np.int16), axis=1)
+    return picks
+
+
+def _simulate_chunk(task):
+    """Pool task: pick counts (prospects x UNDRAFTED + 1) over n_sims drafts."""
+    mu, sigma, n_sims, seed = task
+    rng = np.random.default_rng(seed)
+    counts = np.zeros((len(mu), UNDRAFTED + 1), dtype=np.int64)
+    rows = np.arange(len(mu))
+    for start in range(0, n_sims, BATCH_SIMS):
+        picks = simulate_picks(mu, sigma, min(BATCH_SIMS, n_sims - start), rng)
+        counts += np.bincount((rows * (UNDRAFTED + 1) + picks).ravel(),
+                              minlength=counts.size).reshape(counts.shape)
+    return counts
+
+
+def simulate(prospects, n_sims=N_SIMS, seed=SEED, jobs=None):
+    """(prospects x pick) counts over n_sims drafts; column p counts pick p, column UNDRAFTED counts undrafted."""
+    mu = prospects['predicted_round'].to_numpy(dtype=float)
+    sigma = prospects['residual_std'].to_numpy(dtype=float)
+    jobs = jobs or os.cpu_count() or 1
+    n_chunks = -(-n_sims // BATCH_SIMS)
+    sizes = np.full(n_chunks, n_sims // n_chunks)
+    sizes[:n_sims % n_chunks] += 1
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    tasks = [(mu, sigma, int(size), s) for size, s in zip(sizes, seeds)]
+    if jobs == 1:
+        return sum(_simulate_chunk(task) for task in tasks)
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    with ctx.Pool(min(jobs, n_chunks)) as pool:
+        return sum(pool.imap_unordered(_simulate_chunk, tasks))
+
+
+def summarize(prospects, counts):
+    """Per-prospect round, undrafted and pick-range probabilities plus median / mean pick (drafted sims only)."""
+    n_sims = counts[0].sum()
+    probs = counts / n_sims
+    out = prospects[['position', 'Player', 'School', 'predicted_round']].copy()
+    first = 1
+    for rnd, last in enumerate(ROUND_LAST_PICK, start=1):
+        out[f'p_round_{rnd}'] = probs[:, first:last + 1].sum(axis=1)
+        first = last + 1
+    out['p_undrafted'] = probs[:, UNDRAFTED]
+    for lo, hi, label in PICK_RANGES:
+        out[f'p_{label}'] = probs[:, lo:hi + 1].sum(axis=1)
+    drafted = counts[:, 1:UNDRAFTED]
+    picks = np.arange(1, UNDRAFTED)
+    n_drafted = drafted.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out['mean_pick'] = (drafted * picks).sum(axis=1) / n_drafted
+    cum = drafted.cumsum(axis=1)
+    median = picks[np.minimum((cum < (n_drafted[:, None] + 1) / 2).sum(axis=1), len(picks) - 1)]
+    out['median_pick'] = np.where(n_drafted > 0, median, np.nan)
+    return out.sort_values('mean_pick', ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Simulate the 2026 draft from the round models and report pick probabilities.')
+    parser.add_argument('positions', nargs='*', help=f'default: all ({", ".join(POSITIONS)})')
+    parser.add_argument('--sims', type=int, default=N_SIMS, help='number of simulated drafts (default: %(default)s)')
+    parser.add_argument('--jobs', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('-o', '--output', help='write the per-prospect probabilities to this CSV')
+    args = parser.parse_args(argv)
+    names = [n.lower() for n in args.positions] or list(POSITIONS)
+    unknown = [n for n in names if n not in POSITIONS]
+    if unknown:
+        print(f'Unknown position(s): {", ".join(unknown)}. Choose from: {", ".join(POSITIONS)}')
+        return 2
+
+    prospects = load_prospects(names)
+    t0 = time.perf_counter()
+    counts = simulate(prospects, args.sims, args.seed, args.jobs)
+    print(f'{args.sims} drafts of {len(prospects)} prospects in {time.perf_counter() - t0:.1f}s')
+    summary = summarize(prospects, counts)
+    with pd.option_context('display.width', 200, 'display.max_columns', 20):
+        print(summary.head(20)[['position', 'Player', 'predicted_round', 'p_round_1', 'p_round_2', 'p_round_3',
+                                'p_undrafted', 'median_pick']].round(3).to_string(index=False))
+    if args.output:
+        summary.to_csv(args.output, index=False)
+        print(f'Wrote {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Attach PFF, RAS and arm length to a combine-style frame (Player, School, Year, ...).
+- PFF: keyed join on normalized Player + School + final college season (draft Year - 1),
+  with the position's nickname, school-override and year-override tables.
+- RAS: keyed join on normalized Player + School + draft Year, with the position's RAS name aliases.
+- Arm length: left merge on Player + Year (MockDraftable scrape).
+- With a PlayerRegistry (registry.py), registered prospects are gathered by the PFF / RAS row number stored
+  for them; only prospects the registry lacks are normalized and go through the nickname / alias matching.
+"""
+import numpy as np
+import pandas as pd
+
+from .normalize import normalize_combine_schools, normalize_player_names, normalize_pff_schools, normalize_ras_schools
+from .pff_join import build_pff_index, keyed_pff_join, row_join
+from .sources import PFF_KEYS
+
+
+def prepare_pff_index(pff_df, cfg):
+    """Normalize a position's PFF frame once and index it for add_pff_data."""
+    pff_n = pff_df.copy()
+    pff_n['School_normalized'] = normalize_pff_schools(pff_n['School'])
+    pff_n['Player_normalized'] = normalize_player_names(pff_n['Player'], cfg['strip_iv'])
+    pff_value_cols = [c for c in pff_df.columns if c not in PFF_KEYS]
+    return build_pff_index(pff_n, pff_value_cols)
+
+
+def pff_search_keys(combine_df, cfg):
+    """
+    (players, schools, pff_year) add_pff_data matches on: normalized names, the school after
+    cfg['pff_school_override'] and the PFF season after cfg['pff_year_override'] (default draft Year - 1).
+    """
+    nicknames = cfg['pff_nicknames']
+    school_override = cfg['pff_school_override']
+    year_override = cfg['pff_year_override']
+
+    players = normalize_player_names(combine_df['Player'], cfg['strip_iv'])
+    schools = normalize_combine_schools(combine_df['School'])
+    to_search = [nicknames.get(p, p) for p in players]
+    school_to_use = [school_override.get((p, s), s) for p, s in zip(to_search, schools)]
+    pff_year = [year_override.get((p, s, int(y)), int(y) - 1)
+                for p, s, y in zip(to_search, school_to_use, combine_df['Year'])]
+    return players.to_numpy(), np.array(school_to_use, dtype=object), np.array(pff_year)
+
+
+def add_pff_data(combine_df, pff_index, cfg, registry=None):
+    """
+    Add PFF columns by matching on Player name + School + Year.
+    PFF Year is the college season, so a player drafted in Year Y matches PFF Y-1 (final season)
+    unless cfg['pff_year_override'] says otherwise; cfg['pff_school_override'] handles transfers.
+    registry: PlayerRegistry whose stored PFF rows are used for the prospects it knows.
+    """
+    combine_df = combine_df.copy()
+    if combine_df.empty:
+        return combine_df
+
+    # Nickname first, then the original name; both with the (overridden) school and season
+    def match(df):
+        return keyed_pff_join(*pff_search_keys(df, cfg), pff_index, cfg['pff_nicknames'])
+
+    if registry is None:
+        pff_cols = match(combine_df)
+    else:
+        rows, known = registry.source_rows(cfg, combine_df, 'pff')
+        pff_cols = row_join(pff_index, rows, known, lambda mask: match(combine_df[mask]))
+    for col in pff_cols.columns:
+        values = pff_cols[col]
+        # Float like the old row-wise lookup, even when every row matched an int column
+        combine_df[col] = values.to_numpy(dtype=float) if pd.api.types.is_numeric_dtype(values) else values.to_numpy()
+    return combine_df
+
+
+def add_coverage_rates(df):
+    """INT_rate, PBU_rate = interceptions / pass_break_ups per coverage snap (after the PFF merge)."""
+    snap = df.get('snap_counts_coverage')
+    interceptions = df.get('interceptions')
+    pbu = df.get('pass_break_ups')
+    df['INT_rate'] = np.nan
+    df['PBU_rate'] = np.nan
+    if snap is not None and interceptions is not None:
+        df['INT_rate'] = np.where(pd.notna(snap) & (snap > 0), pd.to_numeric(interceptions, errors='coerce') / snap, np.nan)
+    if snap is not None and pbu is not None:
+        df['PBU_rate'] = np.where(pd.notna(snap) & (snap > 0), pd.to_numeric(pbu, errors='coerce') / snap, np.nan)
+    return df
+
+
+def prepare_ras_index(ras_subset, cfg):
+    """Normalized RAS rows (Name, College, Year) indexed like PFF for add_ras_data."""
+    ras_n = pd.DataFrame({
+        'Player_normalized': normalize_player_names(ras_subset['Name'], cfg['strip_iv']).to_numpy(),
+        'School_normalized': normalize_ras_schools(ras_subset['College']).to_numpy(),
+        'Year': ras_subset['Year'].astype(int).to_numpy(),
+        'RAS': ras_subset['RAS'].to_numpy(),
+    })
+    return build_pff_index(ras_n, ['RAS'])
+
+
+def ras_search_keys(combine_df, cfg):
+    """(players, schools, years) add_ras_data matches on: normalized Player and School, draft Year."""
+    players = normalize_player_names(combine_df['Player'], cfg['strip_iv']).to_numpy()
+    schools = normalize_combine_schools(combine_df['School']).to_numpy()
+    return players, schools, combine_df['Year'].astype(int).to_numpy()
+
+
+def add_ras_data(combine_df, ras_subset, cfg, registry=None):
+    """
+    Add RAS by matching normalized Player + School + Year (ras_subset: Name, Year, RAS, College).
+    Same keyed join as PFF: cfg['ras_name_alias'] rewrites the player key first, then the original name
+    is tried for rows that had an alias and missed. First RAS row per key wins.
+    registry: PlayerRegistry whose stored RAS rows are used for the prospects it knows.
+    """
+    combine_df = combine_df.copy()
+    if combine_df.empty:
+        combine_df['RAS'] = pd.Series(dtype=float)
+        return combine_df
+    ras_index = prepare_ras_index(ras_subset, cfg)
+
+    def match(df):
+        return keyed_pff_join(*ras_search_keys(df, cfg), ras_index, cfg['ras_name_alias'])
+
+    if registry is None:
+        ras_cols = match(combine_df)
+    else:
+        rows, known = registry.source_rows(cfg, combine_df, 'ras')
+        ras_cols = row_join(ras_index, rows, known, lambda mask: match(combine_df[mask]))
+    combine_df['RAS'] = ras_cols['RAS'].to_numpy()
+    return combine_df
+
+
+def add_arm_length(combine_df, arm_df):
+    """
+    Add arm_length_inches by left merge on Player + Year.
+    """
+    combine_df = combine_df.drop(columns=['arm_length_inches'], errors='ignore')
+    if arm_df.empty or 'arm_length_inches' not in arm_df.columns:
+        combine_df['arm_length_inches'] = np.nan
+        return combine_df
+    return combine_df.merge(
+        arm_df[['Player', 'Year', 'arm_length_inches']],
+        on=['Player', 'Year'],
+        how='left'
+    )
@@ -0,0 +1,157 @@
+"""
+Derived prospect features shared by the round models (and the notebooks they came from).
+- speed_score = Weight * 200 / 40yd^4; explosive_score = z(Vertical) + z(Broad Jump) against the training pool
+  (missing drills count as the pool mean); agility_score = -z(3Cone) - z(Shuttle) likewise (faster is higher);
+  p4_conference from the notebooks' hardcoded conference tables; Height '6-3' -> inches.
+- contains_* flags mark which features a prospect has (contains_explosive_score is always 1,
+  contains_p4_conference means a School is known).
+- FeatureBuilder.fit(training) keeps the pool statistics; transform(df) builds every derived column and flag
+  for any class year in one pass, so scoring a new class is a single call.
+"""
+import numpy as np
+import pandas as pd
+
+# P4 membership as hardcoded in the notebooks (2024 realignment; Pac-12 counts through the 2023 draft)
+SCHOOL_ALIAS = {
+    'Ole Miss': 'Mississippi', 'Miami (FL)': 'Miami', 'Southern California': 'USC',
+    'Central Florida': 'UCF', 'Brigham Young': 'BYU', 'Ohio St.': 'Ohio State',
+    'Florida St.': 'Florida State', 'Kansas St.': 'Kansas State', 'Iowa St.': 'Iowa State',
+    'Oklahoma St.': 'Oklahoma State', 'Penn St.': 'Penn State', 'San Diego St.': 'San Diego State',
+}
+# The LB/CB/S notebooks know three more spellings
+SCHOOL_ALIAS_EXTRA = {'San Jose St.': 'San Jose State', 'Boston Col.': 'Boston College', 'NC State': 'North Carolina State'}
+SEC_SCHOOLS = {'Alabama', 'Arkansas', 'Auburn', 'Florida', 'Georgia', 'Kentucky', 'LSU', 'Mississippi', 'Mississippi State',
+               'Missouri', 'South Carolina', 'Tennessee', 'Texas A&M', 'Vanderbilt', 'Oklahoma', 'Texas'}
+BIG_TEN_SCHOOLS = {'Illinois', 'Indiana', 'Iowa', 'Maryland', 'Michigan', 'Michigan State', 'Minnesota', 'Nebraska', 'Northwestern',
+                   'Ohio State', 'Penn State', 'Purdue', 'Rutgers', 'Wisconsin', 'UCLA', 'USC', 'Oregon', 'Washington'}
+BIG_12_SCHOOLS = {'Baylor', 'Iowa State', 'Kansas', 'Kansas State', 'Oklahoma State', 'TCU', 'Texas Tech', 'West Virginia', 'BYU',
+                  'UCF', 'Cincinnati', 'Houston', 'Arizona', 'Arizona State', 'Colorado', 'Utah'}
+ACC_SCHOOLS = {'Boston College', 'Clemson', 'Duke', 'Florida State', 'Georgia Tech', 'Louisville', 'Miami', 'North Carolina',
+               'North Carolina State', 'NC State', 'Pittsburgh', 'Syracuse', 'Virginia', 'Virginia Tech', 'Wake Forest',
+               'California', 'SMU', 'Stanford'}
+PAC12_SCHOOLS = {'Arizona', 'Arizona State', 'California', 'Colorado', 'Oregon', 'Oregon State', 'Stanford', 'UCLA', 'USC',
+                 'Utah', 'Washington', 'Washington State'}
+P4_SCHOOLS_NO_PAC12 = SEC_SCHOOLS | BIG_TEN_SCHOOLS | BIG_12_SCHOOLS | ACC_SCHOOLS
+P4_SCHOOLS = P4_SCHOOLS_NO_PAC12 | PAC12_SCHOOLS
+
+DERIVED = ['Height', 'speed_score', 'explosive_score', 'agility_score', 'p4_conference']
+# Combine columns whose flag name is lowercased; PFF columns keep their spelling (contains_INT_rate)
+_FLAG_NAMES = {'Broad Jump': 'contains_broad_jump', 'Vertical': 'contains_vertical', '40yd': 'contains_40yd',
+               'Height': 'contains_height', 'Weight': 'contains_weight', 'RAS': 'contains_ras'}
+
+
+def flag_name(feature):
+    return _FLAG_NAMES.get(feature, f'contains_{feature}')
+
+
+def height_inches(values):
+    """'6-3' -> 75; a numeric column passes through; other text is NaN."""
+    s = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(s):
+        return s.astype(float)
+    parts = s.astype(str).str.strip().str.extract(r'^(\d+)-(\d+)')
+    return pd.to_numeric(parts[0], errors='coerce') * 12 + pd.to_numeric(parts[1], errors='coerce')
+
+
+def speed_score(weight, forty):
+    """Weight * 200 / 40yd^4; NaN without a positive 40 time."""
+    weight = pd.to_numeric(weight, errors='coerce')
+    forty = pd.to_numeric(forty, errors='coerce')
+    return np.where(forty.notna() & (forty > 0), weight * 200 / forty ** 4, np.nan)
+
+
+def explosive_stats(df):
+    """Vertical / broad-jump mean and std from the training pool (std of 0 or NaN -> 1)."""
+    stats = {}
+    for key, col in (('v', 'Vertical'), ('b', 'Broad Jump')):
+        std = df[col].std()
+        stats[f'mean_{key}'] = df[col].mean()
+        stats[f'std_{key}'] = 1.0 if std == 0 or np.isnan(std) else std
+    return stats
+
+
+def agility_stats(df):
+    """3-cone / shuttle mean and std from the training pool (std of 0 or NaN -> 1)."""
+    stats = {}
+    for key, col in (('3', '3Cone'), ('sh', 'Shuttle')):
+        values = pd.to_numeric(df[col], errors='coerce') if col in df.columns else pd.Series(np.nan, index=df.index)
+        std = values.std()
+        stats[f'mean_{key}'] = values.mean()
+        stats[f'std_{key}'] = 1.0 if std == 0 or np.isnan(std) else std
+    return stats
+
+
+def explosive_score(vertical, broad, stats):
+    """Sum of the two drills' z-scores against the pool stats; a missing drill contributes 0."""
+    vertical = pd.to_numeric(vertical, errors='coerce')
+    broad = pd.to_numeric(broad, errors='coerce')
+    return (vertical - stats['mean_v']).fillna(0) / stats['std_v'] + (broad - stats['mean_b']).fillna(0) / stats['std_b']
+
+
+def agility_score(three_cone, shuttle, stats):
+    """Negated sum of the two drills' z-scores against the pool stats (faster is higher); a missing drill contributes 0."""
+    three_cone = pd.to_numeric(three_cone, errors='coerce')
+    shuttle = pd.to_numeric(shuttle, errors='coerce')
+    return -(three_cone - stats['mean_3']).fillna(0) / stats['std_3'] - (shuttle - stats['mean_sh']).fillna(0) / stats['std_sh']
+
+
+def p4_conference(df, alias=SCHOOL_ALIAS):
+    """1 when School (after the notebook aliases) is in a P4 conference for that draft year."""
+    school = df['School']
+    known = school.notna() & (school.astype(str) != '')
+    canonical = school.map(lambda s: alias.get(s, s))
+    year = pd.to_numeric(df['Year'], errors='coerce').fillna(2023)
+    in_p4 = np.where(year <= 2023, canonical.isin(P4_SCHOOLS), canonical.isin(P4_SCHOOLS_NO_PAC12))
+    return (known & in_p4).astype(int)
+
+
+class FeatureBuilder:
+    """
+    Derived features and contains_* flags for a model's feature list.
+    fit(training) keeps the pool statistics (stats: mean/std of Vertical, Broad Jump and, when agility_score is a
+    feature, 3Cone and Shuttle); transform applies them.
+    """
+
+    def __init__(self, features, school_alias=None, stats=None):
+        self.features = list(features)
+        self.school_alias = dict(SCHOOL_ALIAS if school_alias is None else school_alias)
+        self.stats = stats
+
+    @property
+    def columns(self):
+        """Features then their contains_* flags (the model's input columns)."""
+        return self.features + [flag_name(f) for f in self.features]
+
+    def fit(self, df):
+        self.stats = explosive_stats(df)
+        if 'agility_score' in self.features:
+            self.stats.update(agility_stats(df))
+        return self
+
+    def transform(self, df, year=None):
+        """A copy of df with the derived columns (Height in inches, speed_score, ...) and every contains_* flag."""
+        if self.stats is None:
+            raise ValueError('FeatureBuilder is not fitted; call fit(training) first')
+        missing = {col: np.nan for col in self.features + ['School', 'Year'] if col not in df.columns}
+        src = df.assign(**missing) if missing else df
+        if year is not None:
+            src = src.assign(Year=year)
+        derived = {
+            'Height': height_inches(src['Height']).to_numpy(),
+            'speed_score': speed_score(src['Weight'], src['40yd']),
+            'explosive_score': explosive_score(src['Vertical'], src['Broad Jump'], self.stats).to_numpy(),
+            'p4_conference': p4_conference(src, self.school_alias).to_numpy(),
+        }
+        if 'agility_score' in self.features:
+            drills = src.reindex(columns=['3Cone', 'Shuttle'])
+            derived['agility_score'] = agility_score(drills['3Cone'], drills['Shuttle'], self.stats).to_numpy()
+        flags = {}
+        for feature in self.features:
+            values = derived[feature] if feature in derived else src[feature]
+            flags[flag_name(feature)] = pd.notna(values).astype(int)
+        flags['contains_explosive_score'] = np.ones(len(src), dtype=int)
+        flags['contains_p4_conference'] = src['School'].notna().to_numpy().astype(int)
+        return src.assign(**derived, **flags)
+
+    def fit_transform(self, df, year=None):
+        return self.fit(df).transform(df, year=year)
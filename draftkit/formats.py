@@ -0,0 +1,101 @@
+"""
+Column-wise parsers for the encodings used by the 2024 draft sheets and the 2025 combine master list.
+- Each takes a whole column (Series or array-like) and returns a NumPy array, using integer arithmetic on
+  the digits instead of slicing a string per row.
+- Values that do not parse (blank, '--', 'DNP', text) come back as NaN; pick_to_round maps them to 8 (undrafted).
+- Results match the per-value helpers draft_classes.py used to call inside iterrows().
+"""
+import numpy as np
+import pandas as pd
+
+_POW10 = 10 ** np.arange(19, dtype=np.int64)
+
+
+def _to_int(values):
+    """Truncated integer value per entry (as float so NaN survives); commas are dropped first."""
+    s = pd.Series(values, dtype=object) if not isinstance(values, pd.Series) else values
+    if not pd.api.types.is_numeric_dtype(s):
+        s = s.astype(str).str.replace(',', '', regex=False).str.strip()
+    num = pd.to_numeric(s, errors='coerce').to_numpy(dtype=float, copy=True)
+    num[~np.isfinite(num)] = np.nan
+    return np.trunc(num)
+
+
+def _n_digits(v):
+    """Decimal digit count of non-negative ints (0 -> 1)."""
+    return np.maximum(np.searchsorted(_POW10, v, side='right'), 1)
+
+
+def _leading(v, keep):
+    """First `keep` digits of each non-negative int, or the whole value when it is shorter (zero-padded on the left)."""
+    extra = np.maximum(_n_digits(v) - keep, 0)
+    return v // _POW10[extra]
+
+
+def _int_or_float(result):
+    """int64 when nothing is missing (as the row-built frames had), float otherwise."""
+    return result.astype(np.int64) if not np.isnan(result).any() else result
+
+
+def ht_to_inches(values):
+    """FIIE height: 5104 = 5'10.5\" -> 70.5 (2024 sheet and 2025 master list)."""
+    num = _to_int(values)
+    ok = num >= 0
+    v = np.where(ok, num, 0).astype(np.int64)
+    top = _leading(v, 4)  # FIIE reads the first four digits
+    inches = (top // 1000) * 12 + (top // 10) % 100 + (top % 10) / 8.0
+    return np.where(ok, inches, np.nan)
+
+
+def broad_to_inches(values):
+    """FFII broad jump: 1002 = 10'02\" -> 122."""
+    num = _to_int(values)
+    ok = num >= 100
+    v = np.where(ok, num, 0).astype(np.int64)
+    return _int_or_float(np.where(ok, (v // 100) * 12 + v % 100, np.nan))
+
+
+def arm_2024_to_inches(values):
+    """2024 format 3068 = 30.68 inches (first two digits are whole inches)."""
+    num = _to_int(values)
+    ok = num >= 1000
+    v = np.where(ok, num, 0).astype(np.int64)
+    scale = _POW10[np.maximum(_n_digits(v) - 2, 0)]
+    return np.where(ok, v // scale + (v % scale) / 100.0, np.nan)
+
+
+def sheet_arm_to_inches(values):
+    """Sheet arm length: decimal inches (CB: 31.625) when plausible, else the 3068 format (S)."""
+    s = pd.Series(values, dtype=object) if not isinstance(values, pd.Series) else values
+    num = pd.to_numeric(s, errors='coerce').to_numpy(dtype=float)
+    plausible = (num >= 20) & (num <= 45)
+    return np.where(plausible, num, arm_2024_to_inches(values))
+
+
+def column(df, *names):
+    """First of the named columns present in df (sheets name the same drill differently), else all-NaN."""
+    for name in names:
+        if name in df.columns:
+            return df[name]
+    return pd.Series(np.nan, index=df.index)
+
+
+def numeric(df, *names):
+    """column(...) as numbers; text such as '--' or 'DNP' becomes NaN."""
+    return pd.to_numeric(column(df, *names), errors='coerce').to_numpy()
+
+
+def pick_to_int(values):
+    """Overall pick number; NaN for UDFA / blank / text."""
+    return _int_or_float(_to_int(values))
+
+
+def pick_to_round(values):
+    """Derive draft round from pick number; UDFA, blank and picks past 257 -> 8."""
+    p = _to_int(values)
+    rounds = np.select(
+        [(p >= 1) & (p <= 32), p <= 64, p <= 96, p <= 128, p <= 160, p <= 192, p <= 257],
+        [1, 2, 3, 4, 5, 6, 7],
+        default=8,
+    )
+    return np.where(np.isnan(p), 8, rounds).astype(np.int64)
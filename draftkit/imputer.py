@@ -0,0 +1,163 @@
+"""
+KNN imputation over a neighbor index built once from the training pool (drop-in for KNNImputer, uniform weights).
+- fit() keeps the pool as arrays prepared for distance queries: values with NaN zeroed, their squares and the
+  present-value mask. A query batch then needs three matrix products for every nan-Euclidean distance
+  (sklearn's definition: squared distance over shared features, scaled by n_features / n_shared).
+- Each receiver row is ranked once: its CANDIDATES * k nearest pool rows are sorted by distance, and each of
+  its missing columns takes the first k candidates that recorded that column. Only rows whose candidates hold
+  fewer than k donors for a column fall back to scanning the whole pool (KNNImputer scans per column always).
+- Same results as KNNImputer(n_neighbors=k) up to floating-point rounding: donors with no shared feature are
+  skipped, receivers with none left get the column mean, and columns empty in the pool are dropped. Donors at
+  exactly the same distance go to the earlier pool row, where KNNImputer's pick among them is arbitrary.
+- kneighbors(X, features=[...]) answers distance queries on any subset of the columns.
+- Rows are processed BATCH_ROWS at a time, so a whole class is a handful of vectorized calls; save/load pickle
+  the index for reuse between runs.
+"""
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+# Receiver rows per distance batch (memory is BATCH_ROWS x pool size floats)
+BATCH_ROWS = 1024
+# Nearest pool rows kept per receiver, as a multiple of n_neighbors
+CANDIDATES = 4
+
+
+class NeighborImputer:
+    """nan-Euclidean KNN imputer; fit() builds the pool index, transform() imputes in batches."""
+
+    def __init__(self, n_neighbors=10, batch_rows=BATCH_ROWS):
+        self.n_neighbors = n_neighbors
+        self.batch_rows = batch_rows
+
+    def fit(self, X, y=None):
+        if isinstance(X, pd.DataFrame):
+            self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        X = np.asarray(X, dtype=float)
+        self.n_features_in_ = X.shape[1]
+        missing = np.isnan(X)
+        self._fit_X = X
+        self._present = ~missing
+        self._zeroed = np.where(missing, 0.0, X)
+        self._squares = self._zeroed ** 2
+        self._weights = self._present.astype(float)
+        self._valid_mask = self._present.any(axis=0)
+        with np.errstate(invalid='ignore'):
+            self._col_means = self._zeroed.sum(axis=0) / self._weights.sum(axis=0)
+        return self
+
+    def __len__(self):
+        return len(self._fit_X)
+
+    def get_feature_names_out(self, input_features=None):
+        names = getattr(self, 'feature_names_in_', None)
+        if names is None:
+            names = np.array([f'x{i}' for i in range(self.n_features_in_)], dtype=object)
+        return names[self._valid_mask]
+
+    def _columns(self, features):
+        if features is None:
+            return np.arange(self.n_features_in_)
+        if getattr(self, 'feature_names_in_', None) is not None and not all(isinstance(f, (int, np.integer)) for f in features):
+            lookup = {name: i for i, name in enumerate(self.feature_names_in_)}
+            return np.array([lookup[f] for f in features])
+        return np.asarray(features, dtype=int)
+
+    def distances(self, X, features=None):
+        """nan-Euclidean distances from each row of X (all columns, or just features) to every pool row."""
+        cols = self._columns(features)
+        X = np.asarray(X, dtype=float)
+        if X.shape[1] != len(cols):
+            X = X[:, cols]
+        present = ~np.isnan(X)
+        zeroed = np.where(present, X, 0.0)
+        weights = present.astype(float)
+        pool_weights = self._weights[:, cols].T
+        sq = (zeroed ** 2) @ pool_weights + weights @ self._squares[:, cols].T - 2 * zeroed @ self._zeroed[:, cols].T
+        np.maximum(sq, 0, out=sq)
+        shared = weights @ pool_weights
+        with np.errstate(invalid='ignore', divide='ignore'):
+            sq *= len(cols) / shared
+        sq[shared == 0] = np.nan
+        return np.sqrt(sq, out=sq)
+
+    def kneighbors(self, X, n_neighbors=None, features=None):
+        """(distances, pool row indices) of the nearest pool rows, nearest first; features limits the columns compared."""
+        k = min(n_neighbors or self.n_neighbors, len(self))
+        X = np.asarray(X, dtype=float)
+        dist_out = np.empty((len(X), k))
+        idx_out = np.empty((len(X), k), dtype=np.int64)
+        for start in range(0, len(X), self.batch_rows):
+            d = self.distances(X[start:start + self.batch_rows], features)
+            idx = _nearest(np.where(np.isnan(d), np.inf, d), k)
+            dist_out[start:start + len(d)] = np.take_along_axis(d, idx, axis=1)
+            idx_out[start:start + len(d)] = idx
+        return dist_out, idx_out
+
+    def transform(self, X):
+        X = np.array(X, dtype=float)
+        missing = np.isnan(X) & self._valid_mask
+        rows = np.flatnonzero(missing.any(axis=1))
+        for start in range(0, len(rows), self.batch_rows):
+            batch = rows[start:start + self.batch_rows]
+            self._impute_batch(X, batch, missing[batch])
+        return X[:, self._valid_mask]
+
+    def fit_transform(self, X, y=None):
+        return self.fit(X).transform(X)
+
+    def _impute_batch(self, X, batch, missing):
+        """Fill X[batch] in place; missing is the batch's mask of cells to impute."""
+        k = self.n_neighbors
+        dist = self.distances(X[batch])
+        dist[np.isnan(dist)] = np.inf
+        cand = _nearest(dist, min(CANDIDATES * k, len(self)))
+        cand_dist = np.take_along_axis(dist, cand, axis=1)
+        for col in np.flatnonzero(missing.any(axis=0)):
+            receivers = np.flatnonzero(missing[:, col])
+            donors = self._present[cand[receivers], col] & np.isfinite(cand_dist[receivers])
+            take = donors & (np.cumsum(donors, axis=1) <= k)
+            n_taken = take.sum(axis=1)
+            values = np.where(take, self._fit_X[cand[receivers], col], 0.0).sum(axis=1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                values /= n_taken
+            # Fewer than k donors among the candidates: rank the column's donors across the whole pool
+            short = np.flatnonzero((n_taken < k) & (cand.shape[1] < len(self)))
+            if len(short):
+                values[short] = self._scan(dist[receivers[short]], col)
+            none = np.isnan(values)
+            values[none] = self._col_means[col]
+            X[batch[receivers], col] = values
+
+    def _scan(self, dist, col):
+        """Mean of the k nearest pool rows that recorded col (NaN when none shares a feature)."""
+        donors = np.flatnonzero(self._present[:, col])
+        d = dist[:, donors]
+        idx = _nearest(d, min(self.n_neighbors, len(donors)))
+        finite = np.isfinite(np.take_along_axis(d, idx, axis=1))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(finite, self._fit_X[donors[idx], col], 0.0).sum(axis=1) / finite.sum(axis=1)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp = f'{path}.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @staticmethod
+    def load(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+
+def _nearest(dist, k):
+    """Column indices of the k smallest entries per row, sorted by (distance, index)."""
+    if k < dist.shape[1]:
+        part = np.argpartition(dist, k - 1, axis=1)[:, :k]
+    else:
+        part = np.broadcast_to(np.arange(dist.shape[1]), dist.shape)
+    order = np.lexsort((part, np.take_along_axis(dist, part, axis=1)))
+    return np.take_along_axis(part, order, axis=1)
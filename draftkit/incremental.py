@@ -0,0 +1,160 @@
+"""
+Incremental rebuild: re-run only the (position, draft year) partitions whose inputs changed.
+- A partition's fingerprint hashes the position config, the rows of the combine, RAS and arm-length sources
+  that belong to it, and the files it reads whole (PFF seasons it matches against, drafted CSVs, draft sheets).
+- Fingerprints from the last build live in data/cache/build_state.json with the hashes of the processed CSVs;
+  a position is rebuilt in full when there is no state yet or a processed CSV is missing or was edited.
+- Changed years go through pipeline.build_position(years=...), which splices them into the existing outputs.
+  e.g. editing cb_drafted_2026.csv rebuilds CB 2026 only; a new PFF 2025 file rebuilds every position's 2026.
+Run from the project root: python -m draftkit --incremental [position ...]
+"""
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from .cache import file_hash, file_stat
+from .normalize import ALIASES_PATH
+from .paths import CACHE_DIR, DATA_PROCESSED, DATA_RAW, PFF_DIR, position_dir
+from .pipeline import build_position
+from .positions import POSITIONS, TESTING_YEARS, TRAINING_YEARS
+from .sources import PFF_TABLES, load_combine, load_ras
+
+STATE_PATH = os.path.join(CACHE_DIR, 'build_state.json')
+# Bump when pipeline code changes what a partition produces from the same inputs
+BUILD_VERSION = 1
+DRAFT_YEARS = list(range(TRAINING_YEARS[0], TRAINING_YEARS[1] + 1)) + list(TESTING_YEARS)
+
+
+class _FileHashes:
+    """sha1 per file, re-hashed only when size or mtime moved since the saved state."""
+
+    def __init__(self, saved):
+        self.files = dict(saved)
+
+    def __call__(self, path):
+        if not os.path.exists(path):
+            return None
+        now = file_stat(path)
+        known = self.files.get(path)
+        if known is None or known['size'] != now['size'] or known['mtime_ns'] != now['mtime_ns']:
+            known = {**now, 'sha1': file_hash(path)}
+            self.files[path] = known
+        return known['sha1']
+
+
+def _frame_hash(df):
+    h = hashlib.sha1(repr(list(df.columns)).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _pff_seasons(cfg, year):
+    """PFF seasons a draft year matches against: the final season plus any per-player year override."""
+    seasons = {year - 1} | {v for (_, _, y), v in cfg['pff_year_override'].items() if y == year}
+    return sorted(seasons)
+
+
+def _whole_file_inputs(cfg, year):
+    """Files a partition reads in full (besides the combine/RAS/arm slices)."""
+    files = []
+    for table in ['pass_rush'] + list(cfg['pff_tables']):
+        spec = PFF_TABLES[table]
+        files += [os.path.join(PFF_DIR, spec['folder'], spec['pattern'].format(s)) for s in _pff_seasons(cfg, year)]
+    folder = position_dir(cfg)
+    if year in TESTING_YEARS:
+        if cfg['testing'] == 'drafted_csvs' or year == 2026:
+            files.append(os.path.join(folder, f'{cfg["drafted_prefix"]}_drafted_{year}.csv'))
+        elif year == 2024:
+            files.append(os.path.join(DATA_RAW, f'2024 Draft - Public - {cfg["sheet_position"]}.csv'))
+        else:
+            files += [os.path.join(DATA_RAW, 'GabrielGTB 2025 NFL Combine - Master List.csv'),
+                      os.path.join(DATA_RAW, '2025_draft_picks.csv'),
+                      os.path.join(folder, f'{cfg["drafted_prefix"]}_drafted_2025.csv')]
+    return files
+
+
+def partition_fingerprints(name, file_hash):
+    """{draft year: fingerprint} for one position."""
+    cfg = POSITIONS[name]
+    combine = load_combine(cfg['combine_positions'])
+    ras = load_ras()
+    ras = ras[ras['Pos'].isin(cfg['ras_positions'])]
+    arm_path = os.path.join(DATA_RAW, f'mockdraftable_{cfg["output_prefix"]}_arm_length.csv')
+    arm = pd.read_csv(arm_path) if os.path.exists(arm_path) else pd.DataFrame(columns=['Year'])
+    shared = repr((BUILD_VERSION, sorted(cfg.items(), key=lambda kv: kv[0]), file_hash(ALIASES_PATH)))
+
+    prints = {}
+    for year in DRAFT_YEARS:
+        h = hashlib.sha1(shared.encode())
+        if year <= TRAINING_YEARS[1]:
+            h.update(_frame_hash(combine[combine['Year'] == year]).encode())
+        h.update(_frame_hash(ras[pd.to_numeric(ras['Year'], errors='coerce') == year]).encode())
+        h.update(_frame_hash(arm[pd.to_numeric(arm['Year'], errors='coerce') == year]).encode())
+        for path in _whole_file_inputs(cfg, year):
+            h.update(f'{path}={file_hash(path)}'.encode())
+        prints[str(year)] = h.hexdigest()
+    return prints
+
+
+def _output_paths(cfg):
+    # <prefix>_drafted_2026.csv is rewritten by the build but also edited by hand; it is an input of 2026 instead
+    prefix = cfg['output_prefix']
+    return [os.path.join(DATA_PROCESSED, f'{prefix}_training.csv'), os.path.join(DATA_PROCESSED, f'{prefix}_testing.csv')]
+
+
+def load_state():
+    try:
+        with open(STATE_PATH) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {'files': {}, 'positions': {}}
+    return state if state.get('build_version') == BUILD_VERSION else {'files': {}, 'positions': {}}
+
+
+def save_state(state):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    state['build_version'] = BUILD_VERSION
+    tmp = f'{STATE_PATH}.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp, STATE_PATH)
+
+
+def stale_years(name, state, file_hash):
+    """Draft years to rebuild for one position; None means a full rebuild."""
+    cfg = POSITIONS[name]
+    saved = state['positions'].get(name)
+    if saved is None:
+        return None
+    for path in _output_paths(cfg):
+        if file_hash(path) is None or file_hash(path) != saved['outputs'].get(path):
+            print(f'{name}: {os.path.basename(path)} missing or edited since the last build; rebuilding all years.')
+            return None
+    prints = partition_fingerprints(name, file_hash)
+    return sorted(int(y) for y, fp in prints.items() if saved['partitions'].get(y) != fp)
+
+
+def build_incremental(names=None):
+    """Rebuild only the changed partitions of each position (default: all); returns {name: years rebuilt or 'all'}."""
+    state = load_state()
+    file_hash = _FileHashes(state['files'])
+    rebuilt = {}
+    for name in names or list(POSITIONS):
+        years = stale_years(name, state, file_hash)
+        if years == []:
+            print(f'{name}: up to date.')
+            rebuilt[name] = []
+            continue
+        build_position(name, years=years)
+        cfg = POSITIONS[name]
+        # Fingerprint after the build: it rewrites some of its own inputs (drafted_2025 for sheets, drafted_2026)
+        state['positions'][name] = {
+            'partitions': partition_fingerprints(name, file_hash),
+            'outputs': {path: file_hash(path) for path in _output_paths(cfg)},
+        }
+        state['files'] = file_hash.files
+        save_state(state)
+        rebuilt[name] = 'all' if years is None else years
+    return rebuilt
@@ -0,0 +1,494 @@
+"""
+MockDraftable arm-length scraper shared by the <Pos>/scrape_mockdraftable_arm_length_for_*.py scripts.
+- Player pages are fetched by a thread pool; a token bucket caps the request rate across all workers.
+- Responses are cached per slug in data/cache/mockdraftable/ (404s too), so a page is fetched once ever.
+- Rows are appended to data/raw/mockdraftable_<prefix>_arm_length.csv.partial as players resolve; the CSV
+  itself is only replaced (temp file + os.replace) once a run completes, so an interrupted run never loses
+  its rows. A rerun keeps rows that already have an arm length (in either file) and re-resolves the rest,
+  which only hits the network for pages that were never fetched (e.g. after a crash or a timeout).
+- --crawl first walks the position's search listing (SEARCH_YEARS, 20 players a page): pages are fetched
+  concurrently under the same token bucket, each page is saved to data/cache/mockdraftable/search/ as it
+  arrives and a rerun skips saved pages. Players are then resolved by their listed slug (deduped by slug)
+  instead of a slug guessed from the name.
+- 429 and 5xx responses are retried after Retry-After (or a doubling backoff) before a request counts as failed.
+- base_url is a parameter so the engine can be pointed at a local stub server.
+Run from the project root: python -m draftkit.mockdraftable [edges dt lb cb s] [--workers N] [--rate R] [--crawl]
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from .paths import CACHE_DIR, DATA_PROCESSED, DATA_RAW, position_dir
+from .positions import POSITIONS
+
+BASE = 'https://www.mockdraftable.com'
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+WORKERS = 4
+RATE = 3.0  # requests per second across all workers (the old scripts slept 0.6s between serial requests)
+PAGE_CACHE_DIR = os.path.join(CACHE_DIR, 'mockdraftable')
+SEARCH_CACHE_DIR = os.path.join(PAGE_CACHE_DIR, 'search')
+SEARCH_YEARS = (2010, 2026)
+SEARCH_PATH = '/search?position={position}&beginYear={begin}&endYear={end}&sort=DESC&page={page}'
+OUTPUT_COLS = ['Player', 'Year', 'School', 'arm_length_inches']
+# Retries for 429 / 5xx; the wait doubles from RETRY_WAIT unless the server sends Retry-After
+RETRIES = 4
+RETRY_WAIT = 2.0
+
+
+def name_to_slug(name):
+    """Convert 'J.T. Tuimoloau' -> 'j-t-tuimoloau'; 'Al-Quadin Muhammad' -> 'al-quadin-muhammad'."""
+    if not name or not isinstance(name, str):
+        return ''
+    # Lowercase, keep letters digits spaces and hyphens; collapse punctuation to nothing
+    s = re.sub(r'[^a-z0-9\s-]', '', name.lower().strip())
+    s = re.sub(r'\s+', '-', s).strip('-')
+    return s
+
+
+def _parse_inches(raw):
+    if not raw:
+        return None
+    raw = (raw.replace('\u215b', '.125').replace('\u00bc', '.25').replace('\u2153', '.333')
+           .replace('\u215c', '.375').replace('\u00bd', '.5').replace('\u215d', '.625')
+           .replace('\u2154', '.667').replace('\u00be', '.75').replace('\u215e', '.875'))
+    raw = re.sub(r'\s+', ' ', raw).strip()
+    m = re.search(r'(\d+)\s*(?:\.(\d+))?\s*(?:\s*(\d+)\s*/\s*(\d+))?\s*["\']?', raw)
+    if not m:
+        return None
+    whole = int(m.group(1))
+    frac = 0.0
+    if m.group(2) is not None:
+        frac = int(m.group(2)) / (10 ** len(m.group(2)))
+    elif m.lastindex >= 4 and m.group(3) and m.group(4):
+        num, den = int(m.group(3)), int(m.group(4))
+        if den:
+            frac = num / den
+    return round(whole + frac, 2)
+
+
+def extract_arm_length_and_year(html):
+    """Return (arm_length, draft_year) or (None, None)."""
+    year = None
+    m = re.search(r'Draft\s*Class\s*:\s*(\d{4})', html, re.I)
+    if m:
+        year = m.group(1)
+    # Arm length: pipe table or HTML table
+    arm_length = None
+    m = re.search(r'Arm\s+Length\s*\|\s*([^|]+?)\s*\|', html, re.I)
+    if m:
+        arm_length = _parse_inches(m.group(1).strip())
+    if arm_length is None:
+        m = re.search(r'<td[^>]*>\s*Arm\s+Length\s*</td>\s*<td[^>]*>\s*([^<]+?)\s*</td>', html, re.I | re.DOTALL)
+        if m:
+            arm_length = _parse_inches(m.group(1).strip())
+    if arm_length is None:
+        m = re.search(r'Arm\s+Length\s*</td>\s*<td[^>]*>([^<]+)</td>', html, re.I)
+        if m:
+            arm_length = _parse_inches(m.group(1).strip())
+    return arm_length, year
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a token is available (rate per second, burst capacity)."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _fetch(url, bucket, timeout, retries=RETRIES, wait=RETRY_WAIT):
+    """GET url as text once the bucket allows; 429 / 5xx are retried, other HTTP errors (404) raise."""
+    for attempt in range(retries + 1):
+        bucket.acquire()
+        req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT})
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as r:
+                return r.read().decode('utf-8', errors='replace')
+        except urllib.error.HTTPError as e:
+            if (e.code != 429 and e.code < 500) or attempt == retries:
+                raise
+            retry_after = e.headers.get('Retry-After') if e.headers else None
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else wait * 2 ** attempt
+        time.sleep(delay)
+
+
+class PageFetcher:
+    """
+    get(slug) -> page html, or None if MockDraftable has no such player (404).
+    Hits and 404s are cached on disk by slug; other errors (timeouts, 5xx) raise and are not cached.
+    """
+
+    def __init__(self, position, base_url=BASE, rate=RATE, cache_dir=PAGE_CACHE_DIR, timeout=12):
+        self.position = position
+        self.base_url = base_url.rstrip('/')
+        self.bucket = TokenBucket(rate)
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.fetched = 0
+        self._count_lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _cache_path(self, slug, ext):
+        return os.path.join(self.cache_dir, f'{slug}.{ext}')
+
+    def _store(self, path, text):
+        tmp = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def get(self, slug):
+        html_path = self._cache_path(slug, 'html')
+        if os.path.exists(html_path):
+            with open(html_path, encoding='utf-8') as f:
+                return f.read()
+        missing_path = self._cache_path(slug, 'missing')
+        if os.path.exists(missing_path):
+            return None
+
+        try:
+            html = _fetch(f'{self.base_url}/player/{slug}?position={self.position}', self.bucket, self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                raise
+            self._store(missing_path, '')
+            return None
+        finally:
+            with self._count_lock:
+                self.fetched += 1
+        self._store(html_path, html)
+        return html
+
+
+_PLAYER_LINK = re.compile(r'<a[^>]+href="/player/([a-z0-9-]+)[^"]*"[^>]*>(.*?)</a>', re.I | re.DOTALL)
+_PAGE_LINK = re.compile(r'[?&]page=(\d+)')
+_YEAR = re.compile(r'\b(19[89]\d|20[0-4]\d)\b')
+
+
+def parse_search_page(html):
+    """[(slug, name, draft year or None)] for the players on one search results page, in page order."""
+    links = list(_PLAYER_LINK.finditer(html))
+    rows = {}
+    for i, m in enumerate(links):
+        slug = m.group(1)
+        name = re.sub(r'<[^>]+>', ' ', m.group(2))
+        name = re.sub(r'\s+', ' ', name).strip()
+        # A row's year sits between its link and the next player's
+        tail = html[m.end():links[i + 1].start() if i + 1 < len(links) else len(html)]
+        year = _YEAR.search(re.sub(r'<[^>]+>', ' ', tail))
+        slug_name, slug_year = rows.get(slug, ('', None))
+        rows[slug] = (slug_name or name, slug_year or (int(year.group(1)) if year else None))
+    return [(slug, name, year) for slug, (name, year) in rows.items()]
+
+
+def last_page(html):
+    """Highest page number the pager links to (1 when there is no pager)."""
+    return max([int(n) for n in _PAGE_LINK.findall(html)] + [1])
+
+
+class SearchCrawler:
+    """
+    A position's MockDraftable search listing, page_size players a page, fetched concurrently.
+    Each page is saved to cache_dir as it arrives ([[slug, name, year], ...]); saved pages are not refetched,
+    so an interrupted crawl resumes where it stopped. crawl() returns the listing deduped by slug.
+    """
+
+    def __init__(self, position, years=SEARCH_YEARS, base_url=BASE, rate=RATE, workers=WORKERS,
+                 cache_dir=SEARCH_CACHE_DIR, timeout=12):
+        self.position = position
+        self.years = years
+        self.base_url = base_url.rstrip('/')
+        self.bucket = TokenBucket(rate)
+        self.workers = workers
+        self.dir = os.path.join(cache_dir, f'{position}_{years[0]}-{years[1]}')
+        self.timeout = timeout
+        self.fetched = 0
+        self._count_lock = threading.Lock()
+        os.makedirs(self.dir, exist_ok=True)
+
+    def _page_path(self, page):
+        return os.path.join(self.dir, f'page_{page:04d}.json')
+
+    def _meta_path(self):
+        return os.path.join(self.dir, 'meta.json')
+
+    def url(self, page):
+        return self.base_url + SEARCH_PATH.format(position=self.position, begin=self.years[0], end=self.years[1],
+                                                  page=page)
+
+    def page(self, page):
+        """(rows, last page seen in its pager) for one page; read from disk when already saved."""
+        path = self._page_path(page)
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                saved = json.load(f)
+            return [tuple(r) for r in saved['rows']], saved['last_page']
+        try:
+            html = _fetch(self.url(page), self.bucket, self.timeout)
+        finally:
+            with self._count_lock:
+                self.fetched += 1
+        rows, last = parse_search_page(html), last_page(html)
+        tmp = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'page': page, 'last_page': last, 'rows': rows}, f)
+        os.replace(tmp, path)
+        return rows, last
+
+    def crawl(self):
+        """DataFrame (slug, Player, Year, page) of every listed player, first page wins per slug."""
+        rows, last = self.page(1)
+        pages = {1: rows}
+        size = len(rows)
+        end = None if size else 1
+        if os.path.exists(self._meta_path()):
+            with open(self._meta_path()) as f:
+                end = json.load(f)['end']
+        next_page = 2
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # Pages past the pager's last link are fetched a wave at a time until one comes back short
+            while next_page <= (end if end is not None else next_page):
+                stop = end if end is not None else max(last, next_page + self.workers - 1)
+                wave = range(next_page, stop + 1)
+                for page, (rows, page_last) in zip(wave, pool.map(self.page, wave)):
+                    pages[page] = rows
+                    last = max(last, page_last)
+                    if end is None and len(rows) < size:
+                        end = page
+                next_page = stop + 1
+        # Saved only once the listing is complete; a crawl interrupted before this resumes from the saved pages
+        with open(self._meta_path(), 'w') as f:
+            json.dump({'end': end}, f)
+        listing = [(slug, name, year, page) for page in sorted(pages) if page <= end for slug, name, year in pages[page]]
+        df = pd.DataFrame(listing, columns=['slug', 'Player', 'Year', 'page'])
+        return df.drop_duplicates('slug', keep='first').reset_index(drop=True)
+
+    def clear(self):
+        """Forget the saved pages (for a refresh that should see newly listed players)."""
+        for f in os.listdir(self.dir):
+            os.remove(os.path.join(self.dir, f))
+
+
+def listing_slugs(listing):
+    """{(name slug, year): listed slug} from a crawl(); names listed once are also keyed with year None."""
+    out = {}
+    for slug, player, year in listing[['slug', 'Player', 'Year']].itertuples(index=False, name=None):
+        key = name_to_slug(player)
+        if pd.notna(year):
+            out.setdefault((key, int(year)), slug)
+    counts = listing['Player'].map(name_to_slug).value_counts()
+    for slug, player in listing[['slug', 'Player']].itertuples(index=False, name=None):
+        if counts.get(name_to_slug(player)) == 1:
+            out.setdefault((name_to_slug(player), None), slug)
+    return out
+
+
+def resolve_arm_length(fetcher, player_name, year, slug=None):
+    """
+    Arm length for one player, or None. Raises on network errors so the caller can leave the player unresolved.
+    slug: the player's page from the search listing (default: derived from the name).
+    If the slug's page is another player's (draft year differs), the '<slug>-<year>' page is tried.
+    """
+    slug = slug or name_to_slug(player_name)
+    if not slug:
+        return None
+    html = fetcher.get(slug)
+    if html is None:
+        return None
+    arm_length, page_year = extract_arm_length_and_year(html)
+    # Confirm it's the right player (draft year should match)
+    if page_year and str(int(year)) != str(page_year):
+        # Wrong player (same slug, different year) - try with year suffix; keep the first page's value if that fails
+        try:
+            html2 = fetcher.get(f'{slug}-{int(year)}')
+        except Exception:
+            html2 = None
+        if html2 is not None:
+            arm_length, page_year = extract_arm_length_and_year(html2)
+    return arm_length
+
+
+def players_to_scrape(cfg):
+    """Unique (Player, Year, School) from <prefix>_training.csv, <prefix>_testing.csv and <prefix>_drafted_2026.csv."""
+    prefix = cfg['output_prefix']
+    frames = []
+    for path in (os.path.join(DATA_PROCESSED, f'{prefix}_training.csv'),
+                 os.path.join(DATA_PROCESSED, f'{prefix}_testing.csv'),
+                 os.path.join(position_dir(cfg), f'{cfg["drafted_prefix"]}_drafted_2026.csv')):
+        if not os.path.exists(path):
+            continue
+        df = pd.read_csv(path)
+        if 'Player' not in df.columns:
+            continue
+        df = df.copy()
+        if 'Year' not in df.columns:
+            df['Year'] = 2026
+        if 'School' not in df.columns:
+            df['School'] = ''
+        frames.append(df[['Player', 'Year', 'School']])
+    if not frames:
+        return []
+    combined = pd.concat(frames, ignore_index=True).drop_duplicates()
+    combined = combined[combined['Player'].notna() & combined['Year'].notna()]
+    return list(combined.itertuples(index=False, name=None))
+
+
+def _row(player_name, year, school, arm_length):
+    return {
+        'Player': player_name,
+        'Year': int(year),
+        'School': school if pd.notna(school) else '',
+        'arm_length_inches': arm_length if arm_length is not None else '',
+    }
+
+
+def _load_checkpoint(path):
+    """Rows of an earlier (possibly interrupted) run that already have an arm length, keyed by (Player, Year)."""
+    if not os.path.exists(path):
+        return {}
+    done = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for r in csv.DictReader(f):
+            if r.get('arm_length_inches') in ('', None):
+                continue
+            try:
+                done[(r['Player'], int(float(r['Year'])))] = r
+            except (KeyError, ValueError):
+                continue
+    return done
+
+
+def scrape_arm_lengths(name, base_url=BASE, workers=WORKERS, rate=RATE, players=None, output_path=None,
+                       cache_dir=PAGE_CACHE_DIR, listing=None):
+    """
+    Scrape arm length for a position's players into data/raw/mockdraftable_<prefix>_arm_length.csv.
+    players: optional list of (Player, Year, School); default is players_to_scrape(POSITIONS[name]).
+    listing: optional SearchCrawler.crawl() frame; listed players are fetched by their listed slug.
+    Returns the rows written, in player order.
+    """
+    cfg = POSITIONS[name]
+    prefix = cfg['output_prefix']
+    if players is None:
+        players = players_to_scrape(cfg)
+    if output_path is None:
+        output_path = os.path.join(DATA_RAW, f'mockdraftable_{prefix}_arm_length.csv')
+    print(f'Loaded {len(players)} unique players for {name}.')
+
+    partial_path = f'{output_path}.partial'
+    done = _load_checkpoint(output_path)
+    done.update(_load_checkpoint(partial_path))
+    results = {}
+    todo = []
+    for player_name, year, school in players:
+        key = (player_name, int(year))
+        if key in done:
+            results[key] = _row(player_name, year, school, done[key]['arm_length_inches'])
+        elif key not in results:
+            todo.append((player_name, year, school))
+    print(f'  {len(results)} already resolved in {os.path.basename(output_path)}; {len(todo)} to resolve.')
+
+    fetcher = PageFetcher(cfg['mockdraftable_position'], base_url=base_url, rate=rate, cache_dir=cache_dir)
+    slugs = listing_slugs(listing) if listing is not None else {}
+
+    def listed_slug(player_name, year):
+        key = name_to_slug(player_name)
+        return slugs.get((key, int(year))) or slugs.get((key, None))
+
+    failed = 0
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    # Checkpoint: each new row is appended to the .partial file as soon as it resolves
+    with open(partial_path, 'a', newline='', encoding='utf-8') as f:
+        w = csv.DictWriter(f, fieldnames=OUTPUT_COLS)
+        if f.tell() == 0:
+            w.writeheader()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(resolve_arm_length, fetcher, p, y, listed_slug(p, y)): (p, y, s) for p, y, s in todo}
+            for i, fut in enumerate(as_completed(futures)):
+                player_name, year, school = futures[fut]
+                try:
+                    arm_length = fut.result()
+                except Exception:
+                    failed += 1
+                    arm_length = None
+                row = _row(player_name, year, school, arm_length)
+                results[(player_name, int(year))] = row
+                w.writerow(row)
+                f.flush()
+                if (i + 1) % 50 == 0:
+                    print(f'  {i + 1}/{len(todo)} ...', flush=True)
+
+    # Final file in player order (duplicates from the checkpoint pass collapse here)
+    rows = [results[(p, int(y))] for p, y, _ in players if (p, int(y)) in results]
+    rows = list({(r['Player'], r['Year']): r for r in rows}.values())
+    tmp = f'{output_path}.tmp'
+    with open(tmp, 'w', newline='', encoding='utf-8') as f:
+        w = csv.DictWriter(f, fieldnames=OUTPUT_COLS)
+        w.writeheader()
+        w.writerows(rows)
+    os.replace(tmp, output_path)
+    os.remove(partial_path)
+
+    with_arm = sum(1 for r in rows if r.get('arm_length_inches') not in ('', None))
+    print(f'Saved {len(rows)} rows to {output_path}')
+    print(f'Arm length found for {with_arm} players ({fetcher.fetched} pages fetched, {failed} failed; rerun to retry).')
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Scrape MockDraftable arm length for one or more positions.')
+    parser.add_argument('positions', nargs='*', help=f'default: all ({", ".join(POSITIONS)})')
+    parser.add_argument('--workers', type=int, default=WORKERS)
+    parser.add_argument('--rate', type=float, default=RATE, help='max requests per second')
+    parser.add_argument('--base-url', default=BASE)
+    parser.add_argument('--crawl', action='store_true', help='walk the search listing first and fetch players by listed slug')
+    parser.add_argument('--refresh', action='store_true', help='with --crawl: drop saved search pages and crawl again')
+    parser.add_argument('--years', type=int, nargs=2, default=SEARCH_YEARS, metavar=('BEGIN', 'END'),
+                        help='draft years the search listing covers')
+    args = parser.parse_args(argv)
+    names = [n.lower() for n in args.positions] or list(POSITIONS)
+    unknown = [n for n in names if n not in POSITIONS]
+    if unknown:
+        print(f'Unknown position(s): {", ".join(unknown)}. Choose from: {", ".join(POSITIONS)}')
+        return 2
+    for name in names:
+        listing = None
+        if args.crawl:
+            crawler = SearchCrawler(POSITIONS[name]['mockdraftable_position'], tuple(args.years), base_url=args.base_url,
+                                    rate=args.rate, workers=args.workers)
+            if args.refresh:
+                crawler.clear()
+            t0 = time.perf_counter()
+            listing = crawler.crawl()
+            print(f'{name}: {len(listing)} players listed {args.years[0]}-{args.years[1]} '
+                  f'({crawler.fetched} search pages fetched in {time.perf_counter() - t0:.1f}s)')
+        scrape_arm_lengths(name, base_url=args.base_url, workers=args.workers, rate=args.rate, listing=listing)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Player and school name normalization shared by every position.
+- normalize_player_name: uppercase, drop a generational suffix, strip punctuation, collapse spaces.
+- Three school tables map each source's spelling onto one canonical name:
+  PFF (uppercase abbreviations, e.g. 'OHIO ST'), combine ('Ohio St.'), RAS ('Texas Christian').
+  They live in school_aliases.csv (source, alias, canonical) and are read once at import.
+- Scalar functions are memoized (the same few thousand names recur across seasons and positions);
+  the *_names / *_schools variants normalize a whole column, touching each distinct value once.
+"""
+import csv
+import functools
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+ALIASES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'school_aliases.csv')
+
+_SUFFIX = re.compile(r'\s+(III|II|JR|SR|JR\.|SR\.)$')
+_SUFFIX_IV = re.compile(r'\s+(IV|III|II|JR|SR|JR\.|SR\.)$')
+# Periods, commas, hyphens, apostrophes, etc. (spaces are kept)
+_PUNCT = re.compile(r'[.\',\-]')
+_SPACES = re.compile(r'\s+')
+
+
+def _load_school_tables(path=ALIASES_PATH):
+    tables = {'pff': {}, 'combine': {}, 'ras': {}}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            tables[row['source']][row['alias']] = row['canonical']
+    return tables
+
+
+_TABLES = _load_school_tables()
+# PFF team_name (uppercased) -> canonical; anything not listed is title-cased
+PFF_SCHOOL_MAP = _TABLES['pff']
+# Combine / draft-sheet school -> canonical
+COMBINE_SCHOOL_ALIAS = _TABLES['combine']
+# RAS College -> canonical (falls back to COMBINE_SCHOOL_ALIAS; RAS mostly spells schools like the combine)
+RAS_SCHOOL_MAP = _TABLES['ras']
+
+
+@functools.lru_cache(maxsize=65536)
+def normalize_player_name(name, strip_iv=False):
+    """Normalize player name by removing punctuation and suffixes for matching."""
+    s = str(name).strip().upper()
+    s = (_SUFFIX_IV if strip_iv else _SUFFIX).sub('', s)
+    s = _PUNCT.sub('', s)
+    s = _SPACES.sub(' ', s).strip()
+    return s
+
+
+@functools.lru_cache(maxsize=8192)
+def _pff_school(name):
+    name = str(name).strip().upper()
+    # Spellings only the combine table knows (e.g. 'LOUISIANA-LAFAYETTE') still reach the canonical name
+    return PFF_SCHOOL_MAP.get(name, COMBINE_SCHOOL_ALIAS.get(name.title(), name.title()))
+
+
+@functools.lru_cache(maxsize=8192)
+def _combine_school(name):
+    name = str(name).strip()
+    # Fall back to the PFF table so e.g. 'Southern Miss' lands where PFF's 'SOUTHERN MISS' does
+    return COMBINE_SCHOOL_ALIAS.get(name, PFF_SCHOOL_MAP.get(name.upper(), name))
+
+
+@functools.lru_cache(maxsize=8192)
+def _ras_school(name):
+    name = str(name).strip()
+    return RAS_SCHOOL_MAP.get(name, _combine_school(name))
+
+
+def normalize_pff_school(name):
+    if pd.isna(name):
+        return name
+    return _pff_school(name)
+
+
+def normalize_combine_school(name):
+    if pd.isna(name):
+        return name
+    return _combine_school(name)
+
+
+def normalize_ras_school(name):
+    if pd.isna(name):
+        return name
+    return _ras_school(name)
+
+
+def _map_distinct(values, func):
+    """func applied once per distinct non-missing value; missing values pass through. Returns a Series aligned to values."""
+    s = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    codes, uniques = pd.factorize(s)
+    mapped = np.empty(len(uniques) + 1, dtype=object)
+    mapped[:-1] = [func(u) for u in uniques]
+    mapped[-1] = np.nan  # code -1 = missing
+    return pd.Series(mapped[codes], index=s.index)
+
+
+def normalize_player_names(names, strip_iv=False):
+    """normalize_player_name over a whole column (Series.str on the distinct names); same values as the scalar path."""
+    s = names if isinstance(names, pd.Series) else pd.Series(names, dtype=object)
+    # str(NaN) is 'nan' -> 'NAN' in the scalar path, so stringify before factorizing
+    codes, uniques = pd.factorize(s.astype(str))
+    u = pd.Series(uniques, dtype=object).str.strip().str.upper()
+    u = u.str.replace(_SUFFIX_IV if strip_iv else _SUFFIX, '', regex=True)
+    u = u.str.replace(_PUNCT, '', regex=True)
+    u = u.str.replace(_SPACES, ' ', regex=True).str.strip()
+    return pd.Series(u.to_numpy(dtype=object)[codes], index=s.index)
+
+
+def normalize_pff_schools(schools):
+    return _map_distinct(schools, _pff_school)
+
+
+def normalize_combine_schools(schools):
+    return _map_distinct(schools, _combine_school)
+
+
+def normalize_ras_schools(schools):
+    return _map_distinct(schools, _ras_school)
@@ -0,0 +1,14 @@
+"""Project paths used by draftkit (absolute, so the pipeline runs from any working directory)."""
+import os
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(PACKAGE_DIR)
+DATA_RAW = os.path.join(PROJECT_ROOT, 'data', 'raw')
+DATA_PROCESSED = os.path.join(PROJECT_ROOT, 'data', 'processed')
+PFF_DIR = os.path.join(DATA_RAW, 'pff')
+CACHE_DIR = os.path.join(PROJECT_ROOT, 'data', 'cache')
+
+
+def position_dir(cfg):
+    """Position folder (Edges/, DT/, ...) holding the <prefix>_drafted_*.csv files."""
+    return os.path.join(PROJECT_ROOT, cfg['dir'])
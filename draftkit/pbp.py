@@ -0,0 +1,176 @@
+"""
+Play-by-play ingestion for NFL defensive production (rookie outcomes for drafted prospects).
+- Season files are the nflverse play_by_play_<season>.csv.gz releases (what nflreadpy loads), downloaded
+  to data/cache/pbp/. Completed seasons are downloaded once; the season in progress is downloaded again
+  once its copy is older than CURRENT_SEASON_MAX_AGE (or always with --refresh). Any local file with the
+  same columns works (path=...).
+- Files are streamed in chunks of CHUNK_ROWS plays, reading only the game/season columns and the defender
+  id/name columns below; per-player counts are summed chunk by chunk, so a season is never held whole.
+- The per-season aggregate (one row per defender: sacks, QB hits, tackles, TFL, INT, PD, FF and
+  games_with_event, the games where the defender was credited with one of these events - not games played,
+  which play-by-play does not record) is disk-cached against the season file (cache.py); a rerun reads it
+  back without touching play-by-play.
+Run from the project root: python -m draftkit.pbp 2023 2024 2025 [--chunksize N] [--refresh]
+"""
+import argparse
+import datetime
+import os
+import sys
+import time
+import urllib.request
+
+import pandas as pd
+
+from .cache import cached_frame
+from .paths import CACHE_DIR
+
+PBP_URL = 'https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_{season}.csv.gz'
+PBP_DIR = os.path.join(CACHE_DIR, 'pbp')
+CHUNK_ROWS = 20000
+SEASON_TYPE = 'REG'
+# Re-download the season in progress once its local copy is this old (nflverse rebuilds it nightly)
+CURRENT_SEASON_MAX_AGE = 24 * 3600
+# Bump when the stats or their weights change so cached aggregates are rebuilt
+PBP_CACHE_VERSION = 2
+
+# stat -> [(player id column prefix, weight)]; each prefix has _player_id and _player_name columns
+DEFENSE_EVENTS = {
+    'sacks': [('sack', 1.0), ('half_sack_1', 0.5), ('half_sack_2', 0.5)],
+    'qb_hits': [('qb_hit_1', 1), ('qb_hit_2', 1)],
+    'solo_tackles': [('solo_tackle_1', 1), ('solo_tackle_2', 1)],
+    'assist_tackles': [('assist_tackle_1', 1), ('assist_tackle_2', 1), ('assist_tackle_3', 1), ('assist_tackle_4', 1),
+                       ('tackle_with_assist_1', 1), ('tackle_with_assist_2', 1)],
+    'tackles_for_loss': [('tackle_for_loss_1', 1), ('tackle_for_loss_2', 1)],
+    'interceptions': [('interception', 1)],
+    'pass_defended': [('pass_defense_1', 1), ('pass_defense_2', 1)],
+    'forced_fumbles': [('forced_fumble_player_1', 1), ('forced_fumble_player_2', 1)],
+}
+STATS = list(DEFENSE_EVENTS)
+BASE_COLS = ['game_id', 'season', 'season_type']
+PBP_COLUMNS = BASE_COLS + [f'{prefix}_player_{part}' for events in DEFENSE_EVENTS.values()
+                           for prefix, _ in events for part in ('id', 'name')]
+OUTPUT_COLS = ['season', 'player_id', 'player_name', 'games_with_event'] + STATS
+
+
+def current_season(today=None):
+    """The NFL season in progress (or last played): a season starts in September and ends in February."""
+    today = today or datetime.date.today()
+    return today.year if today.month >= 9 else today.year - 1
+
+
+def season_file(season, url=PBP_URL, cache_dir=PBP_DIR, refresh=False, max_age=CURRENT_SEASON_MAX_AGE):
+    """
+    Local copy of a season's play-by-play file, downloaded on first use.
+    The current season's copy is downloaded again once it is older than max_age seconds; refresh=True always
+    downloads again. Completed seasons no longer change, so their copy is kept.
+    """
+    path = os.path.join(cache_dir, os.path.basename(url.format(season=season)))
+    stale = (os.path.exists(path) and season >= current_season()
+             and time.time() - os.path.getmtime(path) > max_age)
+    if refresh or stale or not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        print(f'Downloading {url.format(season=season)}')
+        tmp = f'{path}.part'
+        urllib.request.urlretrieve(url.format(season=season), tmp)
+        os.replace(tmp, path)
+    return path
+
+
+def iter_chunks(path, chunksize=CHUNK_ROWS):
+    """Regular-season plays from a pbp CSV, chunksize rows at a time, projected to PBP_COLUMNS (missing ones skipped)."""
+    wanted = set(PBP_COLUMNS)
+    reader = pd.read_csv(path, usecols=lambda c: c in wanted, chunksize=chunksize, dtype=str, low_memory=False)
+    with reader:
+        for chunk in reader:
+            if 'season_type' in chunk.columns:
+                chunk = chunk[chunk['season_type'] == SEASON_TYPE]
+            yield chunk
+
+
+def _events(chunk):
+    """One row per (player, stat) credit in the chunk: game_id, player_id, player_name, stat, value."""
+    parts = []
+    for stat, events in DEFENSE_EVENTS.items():
+        for prefix, weight in events:
+            id_col, name_col = f'{prefix}_player_id', f'{prefix}_player_name'
+            if id_col not in chunk.columns:
+                continue
+            hit = chunk[chunk[id_col].notna()]
+            if hit.empty:
+                continue
+            parts.append(pd.DataFrame({
+                'game_id': hit['game_id'].to_numpy(),
+                'player_id': hit[id_col].to_numpy(),
+                'player_name': hit[name_col].to_numpy() if name_col in hit.columns else None,
+                'stat': stat,
+                'value': weight,
+            }))
+    if not parts:
+        return pd.DataFrame(columns=['game_id', 'player_id', 'player_name', 'stat', 'value'])
+    return pd.concat(parts, ignore_index=True)
+
+
+def aggregate_defense(chunks):
+    """Per-player season totals from an iterable of pbp chunks; only running totals are kept between chunks."""
+    totals = None
+    games = None
+    names = {}
+    season = None
+    for chunk in chunks:
+        if season is None and 'season' in chunk.columns and chunk['season'].notna().any():
+            season = int(chunk['season'].dropna().iloc[0])
+        ev = _events(chunk)
+        if ev.empty:
+            continue
+        part = ev.pivot_table(index='player_id', columns='stat', values='value', aggfunc='sum', fill_value=0)
+        totals = part if totals is None else totals.add(part, fill_value=0)
+        pairs = ev[['player_id', 'game_id']].drop_duplicates()
+        games = pairs if games is None else pd.concat([games, pairs]).drop_duplicates()
+        # Latest spelling wins (pbp abbreviates, e.g. 'T.Watt')
+        names.update(ev.dropna(subset=['player_name']).drop_duplicates('player_id', keep='last')
+                     .set_index('player_id')['player_name'].to_dict())
+    if totals is None:
+        return pd.DataFrame(columns=OUTPUT_COLS)
+    out = totals.reindex(columns=STATS, fill_value=0).fillna(0)
+    out['games_with_event'] = games.groupby('player_id').size().reindex(out.index, fill_value=0)
+    out = out.rename_axis(index='player_id', columns=None).reset_index()
+    out['player_name'] = out['player_id'].map(names)
+    out['season'] = season
+    for col in STATS:
+        if col != 'sacks':
+            out[col] = out[col].astype(int)
+    return out[OUTPUT_COLS].sort_values(['season', 'player_id'], ignore_index=True)
+
+
+def load_defense_season(season, path=None, chunksize=CHUNK_ROWS, refresh=False):
+    """Aggregated defensive production for one season (from path, default: the nflverse file), disk-cached."""
+    path = path or season_file(season, refresh=refresh)
+
+    def build():
+        df = aggregate_defense(iter_chunks(path, chunksize))
+        df['season'] = season
+        return df
+
+    return cached_frame(f'pbp_defense_{season}', [path], build, repr((PBP_CACHE_VERSION, DEFENSE_EVENTS, SEASON_TYPE)))
+
+
+def load_defense(seasons, chunksize=CHUNK_ROWS, refresh=False):
+    """load_defense_season for several seasons, stacked."""
+    frames = [load_defense_season(s, chunksize=chunksize, refresh=refresh) for s in seasons]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=OUTPUT_COLS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Aggregate NFL defensive production from play-by-play, one season at a time.')
+    parser.add_argument('seasons', nargs='+', type=int)
+    parser.add_argument('--chunksize', type=int, default=CHUNK_ROWS, help='plays per chunk')
+    parser.add_argument('--refresh', action='store_true', help='download the season files again')
+    args = parser.parse_args(argv)
+    for season in args.seasons:
+        df = load_defense_season(season, chunksize=args.chunksize, refresh=args.refresh)
+        print(f'{season}: {len(df)} defenders, {df["sacks"].sum():.1f} sacks, {df["interceptions"].sum()} interceptions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Keyed PFF join used by draftkit.enrich.add_pff_data (and add_ras_data, with RAS rows as the index).
+- Replaces the row-wise lookup (one boolean mask over the whole PFF frame per prospect)
+  with a hash join on (Player_normalized, School_normalized, Year).
+- Nickname fallback is a second keyed pass over the rows that missed on the nickname.
+- First PFF row per key wins, same as .iloc[0] on the old mask.
+- resolve_keys reports which index key each prospect matched (for the player registry, registry.py);
+  row_join gathers the registered prospects by their stored index row and only matches the rest.
+"""
+import numpy as np
+import pandas as pd
+
+KEY_COLS = ['Player_normalized', 'School_normalized', 'Year']
+
+
+def build_pff_index(pff_df, value_cols):
+    """Index normalized PFF rows by KEY_COLS (first occurrence per key kept)."""
+    # NaN never equals NaN in the old masks, so rows with a missing key can never match
+    pff_keyed = pff_df.dropna(subset=KEY_COLS)
+    pff_keyed = pff_keyed.drop_duplicates(subset=KEY_COLS, keep='first')
+    return pff_keyed.set_index(KEY_COLS)[value_cols]
+
+
+def _probe(pff_index, players, schools, years):
+    """Return (values frame, hit mask) for one keyed pass; rows with a missing key never hit."""
+    keys = pd.MultiIndex.from_arrays([players, schools, years], names=KEY_COLS)
+    valid = pd.notna(players) & pd.notna(schools)
+    hit = keys.isin(pff_index.index) & valid
+    values = pff_index.reindex(keys)
+    values.index = range(len(values))
+    return values, hit
+
+
+def keyed_pff_join(player_normalized, school_normalized, pff_year, pff_index, nickname_map=None):
+    """
+    Look up PFF values for each prospect.
+    player_normalized / school_normalized / pff_year are aligned array-likes (one per prospect).
+    Tries nickname_map[player] first, then the original name for rows that had a nickname and missed.
+    Returns a DataFrame (RangeIndex, one row per prospect) with pff_index's columns; NaN where unmatched.
+    """
+    nickname_map = nickname_map or {}
+    players = pd.Series(player_normalized, dtype=object).reset_index(drop=True)
+    schools = pd.Series(school_normalized, dtype=object).reset_index(drop=True)
+    years = pd.Series(pff_year).reset_index(drop=True)
+
+    to_search = players.map(lambda p: nickname_map.get(p, p))
+    values, hit = _probe(pff_index, to_search.to_numpy(), schools.to_numpy(), years.to_numpy())
+
+    retry = ~hit & (to_search != players).to_numpy()
+    if retry.any():
+        fallback, _ = _probe(pff_index, players[retry].to_numpy(), schools[retry].to_numpy(), years[retry].to_numpy())
+        values.loc[retry, :] = fallback.to_numpy()
+    return values
+
+
+def resolve_keys(player_normalized, school_normalized, pff_year, pff_index, nickname_map=None):
+    """
+    The index key keyed_pff_join matches for each prospect, as a frame with KEY_COLS (RangeIndex);
+    all NaN where nothing matched.
+    """
+    nickname_map = nickname_map or {}
+    players = pd.Series(player_normalized, dtype=object).reset_index(drop=True)
+    schools = pd.Series(school_normalized, dtype=object).reset_index(drop=True)
+    years = pd.Series(pff_year).reset_index(drop=True)
+    to_search = players.map(lambda p: nickname_map.get(p, p))
+    _, hit = _probe(pff_index, to_search.to_numpy(), schools.to_numpy(), years.to_numpy())
+    retry = ~hit & (to_search != players).to_numpy()
+    if retry.any():
+        _, retry_hit = _probe(pff_index, players[retry].to_numpy(), schools[retry].to_numpy(), years[retry].to_numpy())
+        retry[retry] = retry_hit
+    matched = hit | retry
+    return pd.DataFrame({
+        'Player_normalized': np.where(hit, to_search, np.where(retry, players, None)),
+        'School_normalized': np.where(matched, schools, None),
+        'Year': np.where(matched, years.to_numpy(dtype=float), np.nan),
+    })
+
+
+def row_join(pff_index, rows, known, match_rest):
+    """
+    keyed_pff_join for prospects whose index row is already known (the player registry's stored row numbers).
+    rows: pff_index row per prospect, -1 where the prospect is known to match nothing; known: prospects rows covers.
+    Known rows are gathered by row number; match_rest(mask) -> keyed_pff_join result for the prospects in mask
+    (the rest), so only those are normalized and matched.
+    """
+    known = known & (rows < len(pff_index))
+    values = pff_index.reset_index(drop=True).reindex(np.where(known, rows, -1))
+    values.index = range(len(values))
+    rest = ~known
+    if rest.any():
+        values.loc[rest, :] = match_rest(rest).to_numpy()
+    return values
@@ -0,0 +1,198 @@
+"""
+Position pipeline: training (combine 2015-2023), testing (2024-2026 drafted) and 2026 prospects
+with PFF, RAS and arm length attached.
+- build_position('cb') writes data/processed/cb_training.csv, cb_testing.csv and CB/cb_drafted_2026.csv.
+- run_all() builds every position in one process, so combine/RAS/PFF files are parsed once (see sources.py).
+- run_parallel() loads those sources once in the parent, then builds the positions in a forked process pool
+  (children share the parsed frames copy-on-write) and reports each position's time.
+- Prospects in data/processed/player_registry.csv (generated by python -m draftkit.registry) are gathered by
+  their stored PFF/RAS rows instead of being matched again (registry.py).
+- years=... rebuilds only those draft years and splices them into the existing outputs (incremental.py decides which).
+"""
+import contextlib
+import io
+import multiprocessing
+import os
+import time
+
+import pandas as pd
+
+from .draft_classes import load_2026_prospects, load_sheet_testing
+from .enrich import add_arm_length, add_coverage_rates, add_pff_data, add_ras_data, prepare_pff_index
+from .paths import DATA_PROCESSED, position_dir
+from .positions import POSITIONS, TESTING_YEARS, TRAINING_YEARS, drafted_2026_cols, training_cols
+from .sources import build_pff, load_arm_length, load_combine, preload, ras_for_positions
+
+
+def _load_drafted_csvs(cfg):
+    """Testing = <prefix>_drafted_2024/2025/2026.csv (all drafted); 2026 also returned on its own."""
+    folder = position_dir(cfg)
+    drafted = {year: pd.read_csv(os.path.join(folder, f'{cfg["drafted_prefix"]}_drafted_{year}.csv'))
+               for year in TESTING_YEARS}
+    testing = pd.concat(list(drafted.values()), ignore_index=True)
+    testing['Year'] = testing['Year'].astype(int)
+    testing['Drafted'] = True
+    # Drop old stats columns and calculated fields that will be recalculated
+    testing = testing.drop(columns=cfg['cols_drop'], errors='ignore')
+
+    prospects_2026 = drafted[2026].copy()
+    prospects_2026['Year'] = prospects_2026['Year'].astype(int)
+    prospects_2026['Drafted'] = True
+    prospects_2026 = prospects_2026.drop(columns=cfg['cols_drop'], errors='ignore')
+    return testing, prospects_2026
+
+
+def load_prospects(cfg, write=True):
+    """
+    (training, testing, prospects_2026) before enrichment: combine training years, then the drafted classes.
+    write=False leaves <prefix>_drafted_2025.csv alone (the sheet positions otherwise refresh it).
+    """
+    training = load_combine(cfg['combine_positions'], TRAINING_YEARS).copy()
+    if cfg['testing'] == 'sheets':
+        testing = load_sheet_testing(cfg, write=write)
+        prospects_2026 = load_2026_prospects(cfg)
+    else:
+        testing, prospects_2026 = _load_drafted_csvs(cfg)
+    return training, testing, prospects_2026
+
+
+def _enrich(df, cfg, pff_index, ras_subset, arm_df, registry=None):
+    if df.empty:
+        return df
+    df = add_pff_data(df, pff_index, cfg, registry)
+    if 'coverage' in cfg['pff_tables']:
+        df = add_coverage_rates(df)
+    df = add_ras_data(df, ras_subset, cfg, registry)
+    return add_arm_length(df, arm_df)
+
+
+def _splice(path, new, years):
+    """Existing output at path with the rows for years replaced by new (rows stay grouped by Year, in order)."""
+    # round_trip: the kept rows must be written back digit-for-digit
+    old = pd.read_csv(path, float_precision='round_trip')
+    kept = old[~old['Year'].isin(years)]
+    cols = list(new.columns) if not new.empty else list(old.columns)
+    out = pd.concat([kept, new], ignore_index=True)[cols]
+    return out.sort_values('Year', kind='mergesort').reset_index(drop=True)
+
+
+def build_position(name, write=True, years=None):
+    """
+    Build one position; returns (training, testing, drafted_2026) frames in output column order.
+    years: draft years to rebuild; the other years are kept from the existing output files (default: rebuild all).
+    """
+    cfg = POSITIONS[name]
+    prefix = cfg['output_prefix']
+    training_path = os.path.join(DATA_PROCESSED, f'{prefix}_training.csv')
+    testing_path = os.path.join(DATA_PROCESSED, f'{prefix}_testing.csv')
+    drafted_2026_path = os.path.join(position_dir(cfg), f'{cfg["drafted_prefix"]}_drafted_2026.csv')
+    if years is not None:
+        years = set(years)
+        print(f'{name}: rebuilding draft years {sorted(years)}')
+    build_2026 = years is None or 2026 in years
+
+    training, testing, prospects_2026 = load_prospects(cfg, write=write)
+    print(f'{name}: {len(training)} combine rows {TRAINING_YEARS[0]}-{TRAINING_YEARS[1]} (Pos in {cfg["combine_positions"]})')
+    if years is not None:
+        training = training[training['Year'].isin(years)]
+        if 'Year' in testing.columns:
+            # add_arm_length's merge renumbers rows; keep labels aligned for the 2025 arm backup below
+            testing = testing[testing['Year'].isin(years)].reset_index(drop=True)
+
+    pff_index = prepare_pff_index(build_pff(cfg), cfg)
+    ras_subset = ras_for_positions(cfg['ras_positions'])
+    print(f'RAS {name} records: {len(ras_subset)}')
+    arm_df = load_arm_length(prefix)
+    from .registry import load_registry  # not at module level: python -m draftkit.registry
+    registry = load_registry()
+
+    # Sheet classes carry 2025 arm length from the combine list; keep it where MockDraftable has none
+    arm_backup_2025 = pd.Series(dtype=float)
+    if cfg['testing'] == 'sheets' and not testing.empty and 'arm_length_inches' in testing.columns:
+        arm_backup_2025 = testing.loc[testing['Year'] == 2025, 'arm_length_inches'].copy()
+
+    training = _enrich(training, cfg, pff_index, ras_subset, arm_df, registry)
+    testing = _enrich(testing, cfg, pff_index, ras_subset, arm_df, registry)
+    if build_2026:
+        prospects_2026 = _enrich(prospects_2026, cfg, pff_index, ras_subset, arm_df, registry)
+
+    if not arm_backup_2025.empty and (testing['Year'] == 2025).any():
+        idx_2025 = testing['Year'] == 2025
+        testing.loc[idx_2025, 'arm_length_inches'] = testing.loc[idx_2025, 'arm_length_inches'].fillna(arm_backup_2025)
+
+    training = training.drop(columns=cfg['cols_drop'], errors='ignore')
+    testing = testing.drop(columns=cfg['cols_drop'], errors='ignore')
+    out_cols = training_cols(cfg)
+    training = training[[c for c in out_cols if c in training.columns]]
+    testing = testing[[c for c in out_cols if c in testing.columns]]
+    cols_2026 = drafted_2026_cols(cfg)
+    prospects_2026 = prospects_2026[[c for c in cols_2026 if c in prospects_2026.columns]]
+    if years is not None:
+        training = _splice(training_path, training, years)
+        testing = _splice(testing_path, testing, years)
+        if not build_2026:
+            prospects_2026 = pd.read_csv(drafted_2026_path)
+
+    if write:
+        training.to_csv(training_path, index=False)
+        testing.to_csv(testing_path, index=False)
+        if build_2026:
+            prospects_2026.to_csv(drafted_2026_path, index=False)
+    _print_coverage(name, training, testing, prospects_2026)
+    return training, testing, prospects_2026
+
+
+def _print_coverage(name, training, testing, prospects_2026):
+    print(f'\n{name}: training {len(training)}, testing {len(testing)}, 2026 {len(prospects_2026)}')
+    for label, df in (('Training', training), ('Testing', testing), ('2026', prospects_2026)):
+        parts = [f'{col} {df[col].notna().sum()}/{len(df)}'
+                 for col in ('RAS', 'arm_length_inches', 'pass_rush_win_rate', 'stop_percent', 'snap_counts_coverage')
+                 if col in df.columns]
+        print(f'  {label}: {", ".join(parts)}')
+
+
+def run_all(names=None, write=True):
+    """Build several positions (default: all) in this process; raw sources are loaded once and shared."""
+    return {name: build_position(name, write=write) for name in (names or list(POSITIONS))}
+
+
+def _timed_build(name):
+    """Pool task: build one position with its output captured; returns (name, seconds, row counts, log)."""
+    log = io.StringIO()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        training, testing, prospects_2026 = build_position(name)
+    rows = {'training': len(training), 'testing': len(testing), '2026': len(prospects_2026)}
+    return name, time.perf_counter() - t0, rows, log.getvalue()
+
+
+def run_parallel(names=None, jobs=None):
+    """
+    Build several positions (default: all) in a process pool; returns {name: seconds}.
+    Sources are preloaded here first; with the fork start method workers inherit them instead of re-reading.
+    Each position's log is printed as it finishes. jobs defaults to one per position (capped at the CPU count).
+    """
+    names = names or list(POSITIONS)
+    jobs = jobs or min(len(names), os.cpu_count() or 1)
+    t0 = time.perf_counter()
+    if jobs == 1:
+        timings = {}
+        for name in names:
+            name, seconds, _, log = _timed_build(name)
+            print(log, end='')
+            timings[name] = seconds
+            print(f'{name} done in {seconds:.1f}s\n')
+        return timings
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    if ctx.get_start_method() == 'fork':
+        preload([POSITIONS[n] for n in names])
+        print(f'Sources loaded in {time.perf_counter() - t0:.1f}s; building {len(names)} positions with {jobs} workers')
+    timings = {}
+    with ctx.Pool(jobs) as pool:
+        for name, seconds, rows, log in pool.imap_unordered(_timed_build, names):
+            print(log, end='')
+            print(f'{name} done in {seconds:.1f}s ({rows["training"]} training, {rows["testing"]} testing, {rows["2026"]} 2026)\n')
+            timings[name] = seconds
+    print(f'All positions in {time.perf_counter() - t0:.1f}s (slowest: {max(timings, key=timings.get)} {max(timings.values()):.1f}s)')
+    return timings
@@ -0,0 +1,255 @@
+"""
+Per-position configuration for the shared pipeline.
+- One dict per position; everything the old <Pos>/data_cleaning.py scripts hard-coded lives here
+  (combine/RAS positions, PFF dedupe priority, PFF tables and join mode, name/school overrides, output columns).
+- 'testing': 'drafted_csvs' reads <prefix>_drafted_2024/2025/2026.csv from the position folder;
+  'sheets' builds 2024/2025 from the public draft sheet + 2025 combine master list (CB, S).
+- 'master_list_positions': this position's rows in the shared 2025 master list, which is parsed once for
+  all positions (sources.py).
+- 'strip_iv': CB/S also drop an 'IV' suffix when normalizing names; Edges/DT/LB keep it
+  (their PFF nickname maps point at names like 'EARNEST BROWN IV').
+"""
+
+TRAINING_YEARS = (2015, 2023)
+TESTING_YEARS = (2024, 2025, 2026)
+
+PASS_RUSH_COLS = ['true_pass_set_pass_rush_win_rate', 'pass_rush_win_rate', 'snap_counts_pass_rush']
+RUN_DEFENSE_COLS = ['stop_percent', 'missed_tackle_rate', 'avg_depth_of_tackle', 'snap_counts_run', 'forced_fumbles']
+LB_COVERAGE_COLS = ['yards_per_coverage_snap', 'forced_incompletion_rate', 'snap_counts_coverage', 'coverage_percent',
+                    'interceptions', 'pass_break_ups', 'coverage_snaps_per_target']
+DB_COVERAGE_COLS = LB_COVERAGE_COLS + ['qb_rating_against', 'catch_rate', 'avg_depth_of_target']
+RATE_COLS = ['INT_rate', 'PBU_rate']
+
+TRAINING_BASE_COLS = ['Year', 'Player', 'Pos', 'School', 'Height', 'Weight', '40yd', 'Vertical',
+                      'Bench', 'Broad Jump', '3Cone', 'Shuttle', 'Drafted', 'Round', 'Pick',
+                      'RAS', 'arm_length_inches']
+DRAFTED_2026_BASE_COLS = ['Round', 'Pick', 'Player', 'Pos', 'School', 'Year', 'Height', 'Weight',
+                          '40yd', 'Vertical', 'Bench', 'Broad Jump', '3Cone', 'Shuttle',
+                          'RAS', 'arm_length_inches']
+
+COLLEGE_STATS_COLS = ['Sacks_cumulative', 'TFL_cumulative', 'QB_Hurry_cumulative',
+                      'Sacks_final_season', 'TFL_final_season', 'QB_Hurry_final_season']
+SCORE_COLS = ['speed_score', 'explosive_score', 'agility_score']
+
+POSITIONS = {
+    'edges': {
+        'dir': 'Edges',
+        'drafted_prefix': 'edges',   # Edges/edges_drafted_2024.csv ...
+        'output_prefix': 'edge',     # data/processed/edge_training.csv, mockdraftable_edge_arm_length.csv
+        'mockdraftable_position': 'EDGE',  # ?position= on MockDraftable player pages
+        'combine_positions': ['DE', 'EDGE'],
+        'ras_positions': ['DE', 'EDGE'],
+        'master_list_positions': ['EDGE'],  # Position in the 2025 combine master list
+        'pff_priority': {'ED': 0, 'DE': 1, 'LB': 2},  # others 99 (edge designation wins)
+        'pff_join': 'left',
+        'pff_tables': {'run_defense': ['stop_percent']},
+        'pff_nicknames': {
+            'DEMEIOUN ROBINSON': 'CHOP ROBINSON',  # Also known as Chop Robinson
+            'ALVIN DUPREE': 'BUD DUPREE',  # Alvin "Bud" Dupree
+            'JAYSON OWEH': 'ODAFE OWEH',  # Odafe "Jayson" Oweh
+            'OWAMAGBE ODIGHIZUWA': 'OWA ODIGHIZUWA',  # Owamagbe "Owa" Odighizuwa
+            'OGBONNIA OKORONKWO': 'OGBO OKORONKWO',  # Ogbonnia "Ogbo" Okoronkwo
+            'JOHNNY NEWTON': 'JERZHAN NEWTON',  # Jer'Zhan "Johnny" Newton (DT, Illinois)
+            'DAVON GAUDCHAUX': 'DAVON GODCHAUX',  # common misspelling: Gaudchaux -> Godchaux (LSU DT)
+            'EARNEST BROWN': 'EARNEST BROWN IV',  # PFF uses "Earnest Brown IV" (Northwestern)
+            'ZACHARY CARTER': 'ZACH CARTER',  # PFF uses "Zach Carter" (Florida)
+            'JOSHUA PASCHAL': 'JOSH PASCHAL',  # PFF uses "Josh Paschal" (Kentucky)
+            'AMARÉ BARNO': 'AMARE BARNO',  # PFF uses "Amare Barno" (Virginia Tech)
+            'TAKKARIST MCKINLEY': 'TAKK MCKINLEY',  # PFF uses "Takk McKinley" (UCLA)
+            'JOE TRYON': 'JOE TRYONSHOYINKA',  # PFF uses "Joe Tryon-Shoyinka" (Washington)
+        },
+        'pff_school_override': {},
+        'pff_year_override': {},
+        'ras_name_alias': {
+            'DEMEIOUN ROBINSON': 'CHOP ROBINSON',
+            'ALVIN DUPREE': 'BUD DUPREE',
+            'JAYSON OWEH': 'ODAFE OWEH',
+            'OWAMAGBE ODIGHIZUWA': 'OWA ODIGHIZUWA',
+            'OGBONNIA OKORONKWO': 'OGBO OKORONKWO',
+            'OLA ADENIYI': 'OLASUNKANMI ADENIYI',      # Ola is short for Olasunkanmi
+            'OLUBUNMI ROTIMI': 'BUNMI ROTIMI',         # Bunmi is short for Olubunmi
+            'AMARÉ BARNO': 'AMARE BARNO',              # accent spelling in RAS
+            'JOSHUA PASCHAL': 'JOSH PASCHAL',          # Joshua -> Josh in RAS
+        },
+        'strip_iv': False,
+        'testing': 'drafted_csvs',
+        'cols_drop': COLLEGE_STATS_COLS + SCORE_COLS,
+        'output_pff_cols': PASS_RUSH_COLS + ['stop_percent'],
+    },
+    'dt': {
+        'dir': 'DT',
+        'drafted_prefix': 'dt',
+        'output_prefix': 'dt',
+        'mockdraftable_position': 'DT',
+        'combine_positions': ['DT'],
+        'ras_positions': ['DT'],
+        'master_list_positions': ['DL'],
+        'pff_priority': {'DI': 0},  # interior first; others 99
+        'pff_join': 'left',
+        'pff_tables': {'run_defense': ['stop_percent']},
+        'pff_nicknames': {
+            'JOHNNY NEWTON': 'JERZHAN NEWTON',   # Jer'Zhan "Johnny" Newton (Illinois)
+            'DAVON GAUDCHAUX': 'DAVON GODCHAUX', # common misspelling: Gaudchaux -> Godchaux (LSU)
+            'JOSHUA FRAZIER': 'JOSH FRAZIER',    # PFF uses "Josh Frazier" (Alabama)
+            'THOMAS BOOKER': 'THOMAS BOOKER IV',  # PFF uses "Thomas Booker IV" (Stanford)
+        },
+        # (player_normalized, combine_school_normalized) -> PFF school to use (final season elsewhere)
+        'pff_school_override': {
+            ('DJ JONES', 'Akron'): 'Mississippi',       # Ole Miss for final season (2016)
+            ('TAYLOR UPSHAW', 'Michigan'): 'Arizona',  # transferred to Arizona for 2023
+        },
+        # (player_normalized, school_normalized, draft_year) -> PFF year to use (e.g. opt-out: use prior year)
+        'pff_year_override': {
+            ('TYLER SHELVIN', 'LSU', 2021): 2019,  # opted out 2020; use 2019
+            ('CALEB BANKS', 'Florida', 2026): 2024,  # injury in 2025; use 2024 (healthy season)
+        },
+        'ras_name_alias': {
+            'DAVON GAUDCHAUX': 'DAVON GODCHAUX',
+            'FOLEY FATUKASI': 'FOLORUNSO FATUKASI',   # Foley is nickname for Folorunso
+            'CHRISTOPHER HINTON': 'CHRIS HINTON',    # Christopher -> Chris in RAS
+        },
+        'strip_iv': False,
+        'testing': 'drafted_csvs',
+        'cols_drop': COLLEGE_STATS_COLS + SCORE_COLS,
+        'output_pff_cols': PASS_RUSH_COLS + ['stop_percent'],
+    },
+    'lb': {
+        'dir': 'LB',
+        'drafted_prefix': 'lb',
+        'output_prefix': 'lb',
+        'mockdraftable_position': 'LB',
+        'combine_positions': ['ILB', 'LB', 'OLB'],
+        'ras_positions': ['ILB', 'LB', 'OLB'],
+        'master_list_positions': ['LB'],
+        'pff_priority': {'LB': 0, 'ILB': 1, 'OLB': 2},  # others 99
+        'pff_join': 'left',
+        'pff_tables': {'run_defense': RUN_DEFENSE_COLS, 'coverage': LB_COVERAGE_COLS},
+        # Combine normalized name -> PFF normalized name (no punctuation; spelling/nickname variants)
+        'pff_nicknames': {
+            'YANNICK CUDJOEVIRGIL': 'YANNIK CUDJOEVIRGIL',
+            'LORENZO MAULDIN': 'LORENZO MAULDIN IV',
+            'CAMERON BROWN': 'CAM BROWN',
+            'JOSH UCHE': 'JOSHUA UCHE',
+            'WILLIAM BRADLEYKING': 'WILL BRADLEYKING',
+            'TAKKARIST MCKINLEY': 'TAKK MCKINLEY',
+            'JOE TRYON': 'JOE TRYONSHOYINKA',
+            'SCOOTA HARRIS': 'DEJON HARRIS',
+        },
+        'pff_school_override': {},
+        # (player_norm, school_norm, draft_year) -> PFF year to use (e.g. opt-out or injury)
+        'pff_year_override': {
+            ('JACK CICHY', 'Wisconsin', 2018): 2016,   # injured 2017; use 2016
+            ('MICAH PARSONS', 'Penn State', 2021): 2019,  # opted out 2020; use 2019
+            ('JOE TRYONSHOYINKA', 'Washington', 2021): 2019,  # 2020 season limited; use 2019
+            ('SHAQ SMITH', 'Maryland', 2021): 2019,  # use 2019 PFF data
+        },
+        # Combine normalized name -> RAS normalized name (spelling variants / nicknames)
+        'ras_name_alias': {
+            'JOSHUA MCMILLON': 'JOSHUA MCMILLAN',
+            'HENRY TOOTOO': 'HENRY TOO TOO',  # To'oTo'o (combine) -> To'o To'o (RAS) normalized
+            'SCOOTA HARRIS': 'DEJON HARRIS',  # Scoota is De'Jon Harris's nickname
+        },
+        'strip_iv': False,
+        'testing': 'drafted_csvs',
+        'cols_drop': ['Sacks_cumulative', 'TFL_cumulative', 'QB_Hurry_cumulative', 'PD_cumulative', 'SOLO_cumulative',
+                      'TOT_cumulative', 'Sacks_final_season', 'TFL_final_season', 'QB_Hurry_final_season',
+                      'PD_final_season', 'SOLO_final_season', 'TOT_final_season'] + SCORE_COLS,
+        'output_pff_cols': PASS_RUSH_COLS + RUN_DEFENSE_COLS + LB_COVERAGE_COLS + RATE_COLS,
+    },
+    'cb': {
+        'dir': 'CB',
+        'drafted_prefix': 'cb',
+        'output_prefix': 'cb',
+        'mockdraftable_position': 'CB',
+        'combine_positions': ['CB'],
+        'ras_positions': ['CB', 'DB'],  # ras.football uses CB, DB
+        'master_list_positions': ['CB'],
+        'pff_priority': {'CB': 0, 'DB': 1},
+        'pff_join': 'union',  # coverage-only / run-only players get rows too
+        'pff_tables': {'run_defense': RUN_DEFENSE_COLS, 'coverage': DB_COVERAGE_COLS},
+        'pff_nicknames': {},
+        # 2026 CB prospects: draft CSV school -> PFF 2025 school (transfers or PFF listing)
+        'pff_school_override': {
+            ('MANSOOR DELANE', 'Virginia Tech'): 'LSU',
+            ('DOMANI JACKSON', 'USC'): 'Alabama',
+            ('DAVISON IGBINOSUN', 'Mississippi'): 'Ohio State',
+            ('JOSH MOTEN', 'Texas A&M'): 'Southern Mississippi',
+            ('THADDEUS DIXON', 'Washington'): 'North Carolina',
+            ('TACARIO DAVIS', 'Arizona'): 'Washington',
+            ('HEZEKIAH MASSES', 'Florida International'): 'California',
+            ('DANGELO PONDS', 'James Madison'): 'Indiana',
+            ('COLTON HOOD', 'Auburn'): 'Tennessee',
+            ('BRANDON CISSE', 'North Carolina State'): 'South Carolina',
+            ('JULIAN NEAL', 'Fresno State'): 'Arkansas',
+            ('KEIONTE SCOTT', 'Auburn'): 'Miami',
+            ('JERMOD MCCOY', 'Oregon State'): 'Tennessee',  # 2024 at Tennessee, then transferred back to OSU; injured 2025
+        },
+        # (player_normalized, school_to_use, draft_year) -> PFF year to use (e.g. injury/opt-out)
+        'pff_year_override': {
+            ('SHAVON REVEL JR', 'East Carolina', 2025): 2023,  # injured senior year; use season before
+            ('JERMOD MCCOY', 'Tennessee', 2026): 2024,  # injured 2025 at OSU; use 2024 (Tennessee)
+        },
+        'ras_name_alias': {},
+        'strip_iv': True,
+        'testing': 'sheets',
+        'sheet_position': 'CB',  # '2024 Draft - Public - CB.csv' and Position == 'CB' in the 2025 master list
+        'draft_pick_positions': ['CB', 'DB'],  # 2025_draft_picks.csv Pos values
+        'cols_drop': SCORE_COLS,
+        'output_pff_cols': PASS_RUSH_COLS + RUN_DEFENSE_COLS + LB_COVERAGE_COLS + RATE_COLS
+                           + ['qb_rating_against', 'catch_rate', 'avg_depth_of_target'],
+    },
+    's': {
+        'dir': 'S',
+        'drafted_prefix': 's',
+        'output_prefix': 's',
+        'mockdraftable_position': 'S',
+        'combine_positions': ['S'],
+        'ras_positions': ['S', 'FS', 'SS'],  # ras.football uses S, FS, SS
+        'master_list_positions': ['S'],
+        'pff_priority': {'S': 0, 'FS': 1, 'SS': 2},
+        'pff_join': 'union',
+        'pff_tables': {'run_defense': RUN_DEFENSE_COLS, 'coverage': DB_COVERAGE_COLS},
+        # Training/testing: PFF may list under different name (e.g. Mike vs Michael, C.J. vs Chauncey).
+        'pff_nicknames': {
+            'MICHAEL TYSON': 'MIKE TYSON',  # Cincinnati S 2017 draft
+            'CHAUNCEY GARDNERJOHNSON': 'CJ GARDNERJOHNSON',  # Florida S 2019 draft (PFF: C.J. Gardner-Johnson)
+            'NATE GERRY': 'NATHAN GERRY',  # Nebraska S 2017 draft (PFF: Nathan Gerry)
+            'TREY WALKER': 'TRACY WALKER',  # Louisiana-Lafayette S 2018 draft (PFF: Tracy Walker III)
+            'DAXTON HILL': 'DAX HILL',  # Michigan S 2022 draft (PFF: Dax Hill)
+        },
+        # 2026 prospects: draft CSV school vs 2025 PFF school (transfers). Keys: (Player_normalized, School_normalized).
+        'pff_school_override': {
+            ('CALEB DOWNS', 'Alabama'): 'Ohio State',
+            ('DILLON THIENEMAN', 'Purdue'): 'Oregon',
+            ('AJ HAULCY', 'New Mexico'): 'LSU',
+            ('KAMARI RAMSEY', 'UCLA'): 'USC',
+            ('BISHOP FITZGERALD', 'North Carolina State'): 'USC',
+            ('JALEN STROMAN', 'Virginia Tech'): 'Notre Dame',
+            ('JAKOBE THOMAS', 'Middle Tennessee'): 'Miami',
+            ('JALEN CATALON', 'Arkansas'): 'Missouri',
+        },
+        # (Player_normalized, School_normalized, draft_year) -> PFF year to use (opt-out or injury)
+        'pff_year_override': {
+            ('ALIJAH CLARK', 'Syracuse', 2025): 2023,
+            ('JEVON HOLLAND', 'Oregon', 2021): 2019,  # opted out of 2020
+            ('MARCELL HARRIS', 'Florida', 2018): 2016,  # missed 2017
+            ('BRADY BREEZE', 'Oregon', 2021): 2019,  # use 2019 (2020 COVID-shortened)
+        },
+        'ras_name_alias': {},
+        'strip_iv': True,
+        'testing': 'sheets',
+        'sheet_position': 'S',
+        'draft_pick_positions': ['SAF', 'FS', 'S', 'SS', 'DB'],
+        'cols_drop': SCORE_COLS,
+        'output_pff_cols': PASS_RUSH_COLS + RUN_DEFENSE_COLS + LB_COVERAGE_COLS + RATE_COLS
+                           + ['qb_rating_against', 'catch_rate', 'avg_depth_of_target'],
+    },
+}
+
+
+def training_cols(cfg):
+    return TRAINING_BASE_COLS + cfg['output_pff_cols']
+
+
+def drafted_2026_cols(cfg):
+    return DRAFTED_2026_BASE_COLS + cfg['output_pff_cols']
@@ -0,0 +1,260 @@
+"""
+Player registry: one stable id per prospect and the key each source knows them by.
+- A prospect is identified by normalized Player + normalized combine School + draft Year; ids are kept
+  from the existing registry file and new prospects get the next free id, so ids never move between runs.
+- Each (position, Player, School, Year) row stores the resolved source keys: the PFF key
+  (normalized name, school, season, after nicknames and overrides), the RAS key (normalized name, college,
+  year, after aliases), the MockDraftable slug of the arm-length page and the PFR id (2025_draft_picks.csv).
+  pff_row / ras_row are the integer rows those keys sit at in the position's PFF / RAS index.
+- add_pff_data / add_ras_data look registered prospects up once on the raw Player, School, Year columns and
+  gather their PFF / RAS values by stored row (no normalization, no key probe, no nickname fallback); only the
+  prospects the registry lacks are normalized and matched.
+- Stored rows are only valid for the inputs they were resolved against, so each row carries a sources hash
+  (override tables, school alias file, the position's PFF season files and ras.csv, REGISTRY_VERSION). A
+  position's rows are ignored once any of them changes, until the registry is rebuilt.
+- Saved to data/processed/player_registry.csv, which is generated and not committed: run
+  python -m draftkit.registry after a checkout, after adding classes or source files, or after changing the
+  override tables. Without it the pipeline matches every prospect and builds the same outputs.
+Run from the project root: python -m draftkit.registry [edges ...]
+"""
+import argparse
+import hashlib
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .cache import file_hash, file_stat
+from .draft_classes import norm_name, norm_school
+from .enrich import pff_search_keys, prepare_pff_index, prepare_ras_index, ras_search_keys
+from .normalize import ALIASES_PATH, normalize_combine_schools, normalize_player_names
+from .paths import DATA_PROCESSED
+from .pff_join import KEY_COLS, resolve_keys
+from .pipeline import load_prospects
+from .positions import POSITIONS
+from .sources import RAS_PATH, build_pff, load_arm_length, load_draft_picks_2025, pff_season_paths, ras_for_positions
+
+REGISTRY_PATH = os.path.join(DATA_PROCESSED, 'player_registry.csv')
+# Bump when the registry columns or the PFF / RAS index construction change (stored rows would point elsewhere)
+REGISTRY_VERSION = 2
+ROW_KEYS = ['position', 'Player', 'School', 'Year']
+# Stored key columns per source, in pff_join.KEY_COLS order, and the index row column
+SOURCE_KEYS = {
+    'pff': ['pff_player', 'pff_school', 'pff_season'],
+    'ras': ['ras_name', 'ras_college', 'ras_year'],
+}
+SOURCE_ROWS = {'pff': 'pff_row', 'ras': 'ras_row'}
+REGISTRY_COLS = (['player_id'] + ROW_KEYS + SOURCE_KEYS['pff'] + [SOURCE_ROWS['pff']] + SOURCE_KEYS['ras']
+                 + [SOURCE_ROWS['ras'], 'mockdraftable_slug', 'pfr_id', 'sources'])
+
+# path -> (size, mtime_ns, sha1), so a process hashes each unchanged source file once
+_hashes = {}
+
+
+def _hash_file(path):
+    if not os.path.exists(path):
+        return None
+    st = file_stat(path)
+    seen = _hashes.get(path)
+    if seen is None or seen[:2] != (st['size'], st['mtime_ns']):
+        seen = _hashes[path] = (st['size'], st['mtime_ns'], file_hash(path))
+    return seen[2]
+
+
+def sources_hash(cfg):
+    """
+    Hash of everything a position's stored keys and rows depend on: the override and alias tables, the school
+    alias file, the PFF season files it reads, ras.csv and REGISTRY_VERSION.
+    """
+    files = [path for table in ['pass_rush'] + list(cfg['pff_tables']) for path, _ in pff_season_paths(table)]
+    files += [RAS_PATH, ALIASES_PATH]
+    rules = [REGISTRY_VERSION, cfg['strip_iv'], cfg['pff_nicknames'], cfg['pff_school_override'],
+             cfg['pff_year_override'], cfg['ras_name_alias'], cfg['pff_tables'], cfg['pff_join'], cfg['pff_priority'],
+             cfg['ras_positions'], [(os.path.basename(path), _hash_file(path)) for path in files]]
+    return hashlib.sha1(repr(rules).encode()).hexdigest()[:12]
+
+
+def _identity(df):
+    """MultiIndex of (normalized Player, normalized School, Year) per row."""
+    return pd.MultiIndex.from_arrays([normalize_player_names(df['Player']).to_numpy(),
+                                      normalize_combine_schools(df['School']).to_numpy(),
+                                      df['Year'].astype(int).to_numpy()])
+
+
+def _row_index(df):
+    return pd.MultiIndex.from_arrays([df['Player'].astype(object).to_numpy(),
+                                      df['School'].astype(object).to_numpy(),
+                                      df['Year'].astype(int).to_numpy()])
+
+
+class PlayerRegistry:
+    """The registry table plus a per-position (Player, School, Year) -> row lookup."""
+
+    def __init__(self, frame=None):
+        frame = pd.DataFrame(columns=REGISTRY_COLS) if frame is None else frame
+        self.frame = frame[REGISTRY_COLS].reset_index(drop=True)
+        self._rows = {}
+
+    @classmethod
+    def load(cls, path=REGISTRY_PATH):
+        if not os.path.exists(path):
+            return cls()
+        frame = pd.read_csv(path, dtype={'Player': object, 'School': object, 'pfr_id': object,
+                                         'pff_season': 'Int64', 'ras_year': 'Int64',
+                                         'pff_row': 'Int64', 'ras_row': 'Int64'})
+        # A registry written before stored rows existed has nothing to gather by
+        return cls(frame) if set(REGISTRY_COLS) <= set(frame.columns) else cls()
+
+    def save(self, path=REGISTRY_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        out = self.frame.sort_values(['position', 'Year', 'player_id'], kind='mergesort')
+        out.to_csv(path, index=False)
+
+    def __len__(self):
+        return len(self.frame)
+
+    def _position_rows(self, cfg):
+        """(Player, School, Year) index over the position's current rows -> registry row (built once)."""
+        prefix = cfg['output_prefix']
+        if prefix not in self._rows:
+            rows = np.flatnonzero((self.frame['position'] == prefix).to_numpy()
+                                  & (self.frame['sources'] == sources_hash(cfg)).to_numpy())
+            self._rows[prefix] = (_row_index(self.frame.iloc[rows]), rows)
+        return self._rows[prefix]
+
+    def rows(self, cfg, df):
+        """Registry row per df row for this position (-1 where unknown or registered against other inputs)."""
+        if self.frame.empty or df.empty:
+            return np.full(len(df), -1)
+        index, rows = self._position_rows(cfg)
+        pos = index.get_indexer(_row_index(df))
+        return np.where(pos >= 0, rows[np.maximum(pos, 0)], -1)
+
+    def source_rows(self, cfg, df, source):
+        """
+        (rows, known) for one source, per df row: rows is the stored PFF / RAS index row (-1 where the prospect
+        matched nothing), known marks the prospects the registry holds.
+        """
+        rows = self.rows(cfg, df)
+        known = rows >= 0
+        stored = self.frame[SOURCE_ROWS[source]].to_numpy(dtype=float, na_value=np.nan)[rows[known]]
+        out = np.full(len(rows), -1, dtype=np.int64)
+        out[known] = np.where(np.isnan(stored), -1, stored).astype(np.int64)
+        return out, known
+
+    def ids(self, cfg, df):
+        """Player id per df row (-1 where the prospect is not registered)."""
+        rows = self.rows(cfg, df)
+        ids = np.full(len(rows), -1, dtype=np.int64)
+        ids[rows >= 0] = self.frame['player_id'].to_numpy()[rows[rows >= 0]]
+        return ids
+
+    def update(self, name, prospects, pff_index, ras_index, arm_df, picks=None):
+        """Resolve every prospect of one position and replace that position's rows (ids are kept)."""
+        cfg = POSITIONS[name]
+        prospects = prospects.drop_duplicates(['Player', 'School', 'Year']).reset_index(drop=True)
+        identity = _identity(prospects)
+        ids = np.full(len(prospects), -1, dtype=np.int64)
+        if len(self.frame):
+            known = self.frame.drop_duplicates('player_id')
+            id_of = pd.Series(known['player_id'].to_numpy(), index=_identity(known))
+            id_of = id_of[~id_of.index.duplicated()]
+            pos = id_of.index.get_indexer(identity)
+            ids[pos >= 0] = id_of.to_numpy()[pos[pos >= 0]]
+        # New prospects: next free ids, one per distinct identity
+        new_codes, _ = pd.factorize(identity[ids < 0])
+        next_id = int(self.frame['player_id'].max()) + 1 if len(self.frame) else 1
+        ids[ids < 0] = next_id + new_codes
+
+        out = pd.DataFrame({'player_id': ids.astype(np.int64), 'position': cfg['output_prefix'],
+                            'Player': prospects['Player'].to_numpy(), 'School': prospects['School'].to_numpy(),
+                            'Year': prospects['Year'].astype(int).to_numpy()})
+        pff = resolve_keys(*pff_search_keys(prospects, cfg), pff_index, cfg['pff_nicknames'])
+        ras = resolve_keys(*ras_search_keys(prospects, cfg), ras_index, cfg['ras_name_alias'])
+        for source, resolved, index in (('pff', pff, pff_index), ('ras', ras, ras_index)):
+            for col, key in zip(SOURCE_KEYS[source], KEY_COLS):
+                out[col] = resolved[key].to_numpy()
+            out[SOURCE_KEYS[source][2]] = out[SOURCE_KEYS[source][2]].astype('Int64')
+            matched = resolved[KEY_COLS].notna().all(axis=1).to_numpy()
+            rows = np.full(len(resolved), -1, dtype=np.int64)
+            rows[matched] = index.index.get_indexer(pd.MultiIndex.from_frame(resolved[matched]))
+            out[SOURCE_ROWS[source]] = pd.array(np.where(rows >= 0, rows, None), dtype='Int64')
+        out['mockdraftable_slug'] = _mockdraftable_slugs(prospects, arm_df)
+        out['pfr_id'] = _pfr_ids(prospects, picks)
+        out['sources'] = sources_hash(cfg)
+        kept = self.frame[self.frame['position'] != cfg['output_prefix']]
+        self.frame = pd.concat([kept, out], ignore_index=True)[REGISTRY_COLS] if len(kept) else out[REGISTRY_COLS]
+        self._rows = {}
+        return out
+
+
+def _mockdraftable_slugs(prospects, arm_df):
+    """Slug of the MockDraftable page an arm length came from ('<slug>-<year>' when that page was fetched)."""
+    from .mockdraftable import PAGE_CACHE_DIR, name_to_slug  # not at module level: python -m draftkit.mockdraftable
+    if arm_df.empty or 'arm_length_inches' not in arm_df.columns:
+        return np.full(len(prospects), None, dtype=object)
+    measured = arm_df[arm_df['arm_length_inches'].notna()]
+    has_arm = pd.MultiIndex.from_arrays([prospects['Player'], prospects['Year'].astype(int)]).isin(
+        pd.MultiIndex.from_arrays([measured['Player'], measured['Year'].astype(int)]))
+    slugs = []
+    for player, year, hit in zip(prospects['Player'], prospects['Year'].astype(int), has_arm):
+        slug = name_to_slug(player) if hit else ''
+        if slug and os.path.exists(os.path.join(PAGE_CACHE_DIR, f'{slug}-{year}.html')):
+            slug = f'{slug}-{year}'
+        slugs.append(slug or None)
+    return np.array(slugs, dtype=object)
+
+
+def _pfr_ids(prospects, picks):
+    """PFR player id for 2025 picks, matched the way draft_classes merges Round/Pick (name + school)."""
+    if picks is None or 'pfr_id' not in picks.columns:
+        return np.full(len(prospects), None, dtype=object)
+    keys = pd.MultiIndex.from_arrays([picks['Player'].astype(str).map(norm_name),
+                                      picks['School'].astype(str).map(norm_school)])
+    by_key = pd.Series(picks['pfr_id'].to_numpy(dtype=object), index=keys)
+    by_key = by_key[~by_key.index.duplicated()]
+    probe = pd.MultiIndex.from_arrays([prospects['Player'].astype(str).map(norm_name),
+                                       prospects['School'].astype(str).map(norm_school)])
+    pos = by_key.index.get_indexer(probe)
+    ids = np.where(pos >= 0, by_key.to_numpy()[np.maximum(pos, 0)], None)
+    return np.where(prospects['Year'].astype(int).to_numpy() == 2025, ids, None)
+
+
+def load_registry(path=REGISTRY_PATH):
+    """The saved registry, or None when there is none yet."""
+    return PlayerRegistry.load(path) if os.path.exists(path) else None
+
+
+def build_registry(names=None, path=REGISTRY_PATH):
+    """Resolve the prospects of each position (default: all) into the registry at path and save it."""
+    registry = PlayerRegistry.load(path)
+    picks = load_draft_picks_2025()
+    for name in names or list(POSITIONS):
+        cfg = POSITIONS[name]
+        prospects = pd.concat([df for df in load_prospects(cfg, write=False) if not df.empty], ignore_index=True)
+        pff_index = prepare_pff_index(build_pff(cfg), cfg)
+        ras_index = prepare_ras_index(ras_for_positions(cfg['ras_positions']), cfg)
+        out = registry.update(name, prospects, pff_index, ras_index, load_arm_length(cfg['output_prefix']), picks)
+        print(f'{name}: {len(out)} prospects, PFF {out["pff_player"].notna().sum()}, RAS {out["ras_name"].notna().sum()}, '
+              f'MockDraftable {out["mockdraftable_slug"].notna().sum()}, PFR {out["pfr_id"].notna().sum()}')
+    registry.save(path)
+    print(f'Wrote {path} ({len(registry)} rows, {registry.frame["player_id"].nunique()} players)')
+    return registry
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Assign stable player ids and store each source key per prospect.')
+    parser.add_argument('positions', nargs='*', help=f'default: all ({", ".join(POSITIONS)})')
+    args = parser.parse_args(argv)
+    names = [n.lower() for n in args.positions] or list(POSITIONS)
+    unknown = [n for n in names if n not in POSITIONS]
+    if unknown:
+        print(f'Unknown position(s): {", ".join(unknown)}. Choose from: {", ".join(POSITIONS)}')
+        return 2
+    build_registry(names)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""
+Round regression from the <Pos>/<prefix>_round_regression.ipynb notebooks, fitted once and saved to disk.
+- fit_round_model fits the notebooks' KNN imputation (imputer.NeighborImputer, k=10) -> StandardScaler -> Ridge
+  on <prefix>_training.csv (2015-2023) and pickles the three steps, the fitted FeatureBuilder (features.py; holds
+  the explosive-score pool stats), the training residual spread and a hash of the feature schema and the
+  training CSV's contents to data/models/<prefix>_round_model.pkl.
+- load_round_model reads the artifact back (a few ms) and refuses one whose schema hash no longer matches
+  the features below or the training CSV it was fitted on; refit after changing either.
+- score_frame / score_csv build the notebook features for any drafted_<year>-style frame in one
+  FeatureBuilder.transform call and add predicted_round (clipped to 1-8), tier_label and interpretation
+  (pred_round_to_tier).
+Run from the project root:
+  python -m draftkit.round_model fit [edges dt lb cb s]
+  python -m draftkit.round_model score cb [CB/cb_drafted_2026.csv ...] [-o out.csv]
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .cache import file_hash
+from .features import P4_SCHOOLS, P4_SCHOOLS_NO_PAC12, SCHOOL_ALIAS, SCHOOL_ALIAS_EXTRA, FeatureBuilder
+from .imputer import NeighborImputer
+from .paths import DATA_PROCESSED, PROJECT_ROOT, position_dir
+from .positions import POSITIONS, TRAINING_YEARS
+
+MODELS_DIR = os.path.join(PROJECT_ROOT, 'data', 'models')
+# Bump when feature building changes in a way the schema below does not capture
+MODEL_VERSION = 4
+# The notebooks' hand-picked settings (python -m draftkit.round_search cross-validates others)
+N_NEIGHBORS = 10
+RIDGE_ALPHA = 1.0
+
+# Combine, RAS and arm length features every position's model starts with (also used by comps and the classifiers)
+COMBINE_FEATURES = ['Broad Jump', 'Vertical', '40yd', 'Height', 'Weight', 'speed_score', 'explosive_score', 'RAS',
+                    'arm_length_inches']
+_PASS_RUSH = ['true_pass_set_pass_rush_win_rate', 'pass_rush_win_rate', 'snap_counts_pass_rush', 'stop_percent']
+_RUN = ['missed_tackle_rate', 'avg_depth_of_tackle', 'snap_counts_run', 'forced_fumbles']
+_COVERAGE = ['yards_per_coverage_snap', 'forced_incompletion_rate', 'snap_counts_coverage', 'coverage_percent']
+_RATES = ['coverage_snaps_per_target', 'INT_rate', 'PBU_rate']
+_TARGETED = ['qb_rating_against', 'catch_rate', 'avg_depth_of_target']
+
+# FEATURES_WITH_COLLEGE per notebook (each gets a contains_* flag, appended after the features)
+ROUND_FEATURES = {
+    'edges': COMBINE_FEATURES + _PASS_RUSH + ['p4_conference'],
+    'dt': COMBINE_FEATURES + _PASS_RUSH + ['p4_conference'],
+    'lb': COMBINE_FEATURES + _PASS_RUSH + _RUN + _COVERAGE + ['interceptions', 'pass_break_ups'] + _RATES + ['p4_conference'],
+    'cb': COMBINE_FEATURES + ['missed_tackle_rate', 'forced_fumbles'] + _COVERAGE + _RATES + _TARGETED + ['p4_conference'],
+    's': COMBINE_FEATURES + _PASS_RUSH + _RUN + _COVERAGE + _RATES + _TARGETED + ['p4_conference'],
+}
+# School spellings FeatureBuilder folds together before the contains_* flags, per position
+SCHOOL_ALIAS_BY_POSITION = {
+    'edges': SCHOOL_ALIAS, 'dt': SCHOOL_ALIAS,
+    'lb': {**SCHOOL_ALIAS, **SCHOOL_ALIAS_EXTRA}, 'cb': {**SCHOOL_ALIAS, **SCHOOL_ALIAS_EXTRA}, 's': {**SCHOOL_ALIAS, **SCHOOL_ALIAS_EXTRA},
+}
+
+
+def college_features(name):
+    """The position's PFF college production features: ROUND_FEATURES less COMBINE_FEATURES and p4_conference."""
+    return [f for f in ROUND_FEATURES[name] if f not in COMBINE_FEATURES and f != 'p4_conference']
+
+# (upper bound on predicted round, tier label, interpretation); anything later is Round 7 / UDFA
+TIERS = [
+    (1.75, 'Round 1 Tier', 'True 1st-round grade'),
+    (2.75, 'Round 2 Tier', 'Early Day 2'),
+    (3.75, 'Round 3 Tier', 'Late Day 2'),
+    (4.75, 'Round 4 Tier', 'Early Day 3'),
+    (5.75, 'Round 5 Tier', 'Mid Day 3'),
+    (6.75, 'Round 6 Tier', 'Late Day 3'),
+]
+LAST_TIER = ('Round 7 / UDFA Tier', 'Fringe draftable')
+
+
+def feature_builder(name):
+    """Unfitted FeatureBuilder for a position's features and school aliases."""
+    return FeatureBuilder(ROUND_FEATURES[name], SCHOOL_ALIAS_BY_POSITION[name])
+
+
+def model_columns(name):
+    """Features then their contains_* flags, in the notebooks' FEATURES_WITH_COLLEGE_ALL order."""
+    return feature_builder(name).columns
+
+
+def schema_hash(name, training_path=None):
+    """Hash of everything that decides the model's input columns and how they are built, and of the training CSV."""
+    training_path = training_path or training_path_for(name)
+    schema = {
+        'version': MODEL_VERSION,
+        'columns': model_columns(name),
+        'alias': sorted(SCHOOL_ALIAS_BY_POSITION[name].items()),
+        'p4': sorted(P4_SCHOOLS),
+        'p4_no_pac12': sorted(P4_SCHOOLS_NO_PAC12),
+        'training_sha1': file_hash(training_path) if os.path.exists(training_path) else None,
+    }
+    return hashlib.sha1(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+def model_path(name):
+    return os.path.join(MODELS_DIR, f'{POSITIONS[name]["output_prefix"]}_round_model.pkl')
+
+
+def round_target(df):
+    """Round 1-7 if drafted, 8 if undrafted."""
+    return np.where(df['Drafted'].astype(bool), np.clip(df['Round'].fillna(1).astype(int), 1, 7), 8)
+
+
+def training_path_for(name):
+    return os.path.join(DATA_PROCESSED, f'{POSITIONS[name]["output_prefix"]}_training.csv')
+
+
+def load_training(name, training_path=None):
+    """The position's training rows (TRAINING_YEARS) from its training CSV."""
+    df = pd.read_csv(training_path or training_path_for(name))
+    return df[df['Year'].between(*TRAINING_YEARS)].copy()
+
+
+def fit_round_model(name, training_path=None, save=True, n_neighbors=N_NEIGHBORS, alpha=RIDGE_ALPHA):
+    """Fit the position's imputer / scaler / ridge on its training CSV; returns the artifact dict (and writes it)."""
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import StandardScaler
+
+    training_path = training_path or training_path_for(name)
+    builder = feature_builder(name)
+    df = builder.fit_transform(load_training(name, training_path))
+    columns = builder.columns
+
+    imputer = NeighborImputer(n_neighbors=n_neighbors)
+    scaler = StandardScaler()
+    model = Ridge(alpha=alpha, random_state=42)
+    X = scaler.fit_transform(imputer.fit_transform(df[columns]))
+    y = round_target(df)
+    model.fit(X, y)
+    artifact = {
+        'position': name,
+        'schema_hash': schema_hash(name, training_path),
+        'columns': columns,
+        'features': builder,
+        'imputer': imputer,
+        'scaler': scaler,
+        'model': model,
+        # Spread of training rounds around the clipped prediction (draft_sim.py draws from it)
+        'residual_std': float(np.std(y - np.clip(model.predict(X), 1, 8))),
+        'training_rows': len(df),
+        'training_path': os.path.relpath(training_path, PROJECT_ROOT),
+    }
+    if save:
+        os.makedirs(MODELS_DIR, exist_ok=True)
+        tmp = f'{model_path(name)}.tmp'
+        with open(tmp, 'wb') as f:
+            pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, model_path(name))
+        print(f'Saved {os.path.relpath(model_path(name), PROJECT_ROOT)} ({len(df)} training rows)')
+    return artifact
+
+
+def load_round_model(name):
+    """Saved artifact for a position; raises if it is missing or its feature schema or training CSV has changed."""
+    path = model_path(name)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f'No round model for {name}; run: python -m draftkit.round_model fit {name}')
+    with open(path, 'rb') as f:
+        artifact = pickle.load(f)
+    training_path = artifact.get('training_path')
+    if artifact.get('schema_hash') != schema_hash(name, training_path and os.path.join(PROJECT_ROOT, training_path)):
+        raise ValueError(f'{os.path.basename(path)} was fitted with a different feature schema or training CSV; '
+                         f'run: python -m draftkit.round_model fit {name}')
+    return artifact
+
+
+def pred_round_to_tier(p):
+    for bound, label, interpretation in TIERS:
+        if p < bound:
+            return label, interpretation
+    return LAST_TIER
+
+
+def tier_labels(pred):
+    """pred_round_to_tier over an array: (tier labels, interpretations)."""
+    bounds = np.array([b for b, _, _ in TIERS])
+    idx = np.searchsorted(bounds, np.asarray(pred, dtype=float), side='right')
+    labels = np.array([t[1] for t in TIERS] + [LAST_TIER[0]], dtype=object)
+    notes = np.array([t[2] for t in TIERS] + [LAST_TIER[1]], dtype=object)
+    return labels[idx], notes[idx]
+
+
+def score_frame(artifact, df, year=None):
+    """df with predicted_round, tier_label and interpretation appended (year overrides the Year column)."""
+    features = artifact['features'].transform(df, year=year)
+    X = artifact['scaler'].transform(artifact['imputer'].transform(features[artifact['columns']]))
+    pred = np.clip(artifact['model'].predict(X), 1, 8)
+    out = df.copy()
+    out['predicted_round'] = pred
+    out['tier_label'], out['interpretation'] = tier_labels(pred)
+    return out
+
+
+def score_csv(name, path=None, output_path=None, year=None, artifact=None):
+    """Score a drafted_<year>-style CSV (default: the position's drafted_2026.csv) and write <stem>_predictions.csv."""
+    cfg = POSITIONS[name]
+    path = path or os.path.join(position_dir(cfg), f'{cfg["drafted_prefix"]}_drafted_2026.csv')
+    artifact = artifact or load_round_model(name)
+    scored = score_frame(artifact, pd.read_csv(path), year=year)
+    output_path = output_path or f'{os.path.splitext(path)[0]}_predictions.csv'
+    scored.to_csv(output_path, index=False)
+    print(f'Scored {len(scored)} {name} rows -> {os.path.relpath(output_path, PROJECT_ROOT)}')
+    return scored
+
+
+def _check_names(names):
+    unknown = [n for n in names if n not in POSITIONS]
+    if unknown:
+        print(f'Unknown position(s): {", ".join(unknown)}. Choose from: {", ".join(POSITIONS)}')
+    return not unknown
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fit and apply the saved round-regression models.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    fit = sub.add_parser('fit', help='fit and save the model for each position')
+    fit.add_argument('positions', nargs='*', help=f'default: all ({", ".join(POSITIONS)})')
+    fit.add_argument('--neighbors', type=int, default=N_NEIGHBORS, help='imputer k (default: %(default)s)')
+    fit.add_argument('--alpha', type=float, default=RIDGE_ALPHA, help='Ridge alpha (default: %(default)s)')
+    score = sub.add_parser('score', help='score drafted_<year>-style CSVs with a saved model')
+    score.add_argument('position')
+    score.add_argument('csvs', nargs='*', help='default: <Pos>/<prefix>_drafted_2026.csv')
+    score.add_argument('-o', '--output', help='output path (one input CSV only); default <stem>_predictions.csv')
+    score.add_argument('--year', type=int, help='draft year for every row (default: the Year column)')
+    score.add_argument('--refit', action='store_true', help='refit from the training CSV before scoring')
+    args = parser.parse_args(argv)
+
+    if args.command == 'fit':
+        names = [n.lower() for n in args.positions] or list(POSITIONS)
+        if not _check_names(names):
+            return 2
+        for name in names:
+            fit_round_model(name, n_neighbors=args.neighbors, alpha=args.alpha)
+        return 0
+
+    name = args.position.lower()
+    if not _check_names([name]):
+        return 2
+    if args.output and len(args.csvs) > 1:
+        print('--output needs exactly one input CSV')
+        return 2
+    t0 = time.perf_counter()
+    artifact = fit_round_model(name) if args.refit else load_round_model(name)
+    print(f'Loaded {name} model in {time.perf_counter() - t0:.2f}s')
+    for path in args.csvs or [None]:
+        score_csv(name, path, output_path=args.output, year=args.year, artifact=artifact)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
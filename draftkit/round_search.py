@@ -0,0 +1,174 @@
+"""
+Cross-validated search over the round-regression settings the notebooks fix by hand.
+- Grid: imputer k (NEIGHBORS) x Ridge alpha (ALPHAS) x feature set (FEATURE_SETS: the notebook's
+  FEATURES_WITH_COLLEGE, or the combine columns alone), scored by mean absolute error in rounds over
+  N_FOLDS shuffled folds of each position's training rows.
+- One pool task per (position, feature set, k, fold): features, imputer and scaler are fitted on the fold's
+  training rows only, then every alpha is fitted on the same matrices. The imputed, scaled fold is disk-cached
+  (cache.py, keyed by the training CSV), so a rerun with new alphas skips the KNN imputation entirely.
+- Tasks run in a forked process pool (training frames are loaded first and inherited, as in run_parallel).
+- Reports the best configuration per position next to the notebook setting (k=10, alpha=1, with college);
+  apply one with: python -m draftkit.round_model fit cb --neighbors K --alpha A
+Run from the project root: python -m draftkit.round_search [edges ...] [--jobs N] [-o results.csv]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .cache import cached_frame
+from .features import FeatureBuilder
+from .imputer import NeighborImputer
+from .positions import POSITIONS
+from .round_model import (COMBINE_FEATURES, MODEL_VERSION, N_NEIGHBORS, RIDGE_ALPHA, ROUND_FEATURES,
+                          SCHOOL_ALIAS_BY_POSITION, load_training, round_target, training_path_for)
+
+NEIGHBORS = (3, 5, 10, 15, 25)
+ALPHAS = (0.1, 0.3, 1.0, 3.0, 10.0, 30.0, 100.0)
+N_FOLDS = 5
+SEED = 42
+FEATURE_SETS = {
+    'with_college': lambda name: ROUND_FEATURES[name],
+    'combine_only': lambda name: COMBINE_FEATURES,
+}
+BASELINE = ('with_college', N_NEIGHBORS, RIDGE_ALPHA)
+
+# Training rows per position, loaded in the parent before forking
+_TRAINING = {}
+
+
+def fold_ids(n, n_folds=N_FOLDS, seed=SEED):
+    """Fold number per row (shuffled, sizes differ by at most one)."""
+    from sklearn.model_selection import KFold
+
+    ids = np.empty(n, dtype=int)
+    for fold, (_, val) in enumerate(KFold(n_folds, shuffle=True, random_state=seed).split(np.arange(n))):
+        ids[val] = fold
+    return ids
+
+
+def _training(name):
+    if name not in _TRAINING:
+        _TRAINING[name] = load_training(name)
+    return _TRAINING[name]
+
+
+def imputed_fold(name, feature_set, k, fold, n_folds=N_FOLDS):
+    """
+    Scaled model matrix for one fold: the builder, NeighborImputer(k) and scaler are fitted on the other folds.
+    Returns a frame of the model columns plus 'target' and 'validation' (True for the held-out rows).
+    """
+    features = FEATURE_SETS[feature_set](name)
+
+    def build():
+        from sklearn.preprocessing import StandardScaler
+
+        df = _training(name).reset_index(drop=True)
+        val = fold_ids(len(df), n_folds) == fold
+        builder = FeatureBuilder(features, SCHOOL_ALIAS_BY_POSITION[name]).fit(df[~val])
+        X = builder.transform(df)[builder.columns]
+        imputer = NeighborImputer(n_neighbors=k).fit(X[~val])
+        scaler = StandardScaler().fit(imputer.transform(X[~val]))
+        # The imputer drops columns that are empty in the fold (as in fit_round_model)
+        out = pd.DataFrame(scaler.transform(imputer.transform(X)), columns=imputer.get_feature_names_out())
+        out['target'] = round_target(df)
+        out['validation'] = val
+        return out
+
+    version = repr((MODEL_VERSION, features, sorted(SCHOOL_ALIAS_BY_POSITION[name].items()), k, fold, n_folds, SEED))
+    prefix = POSITIONS[name]['output_prefix']
+    return cached_frame(f'round_fold_{prefix}_{feature_set}_k{k}_{fold}of{n_folds}', [training_path_for(name)],
+                        build, version)
+
+
+def _score_fold(task):
+    """Pool task: every alpha on one cached fold; returns [(name, feature_set, k, alpha, fold, mae, rmse)]."""
+    from sklearn.linear_model import Ridge
+
+    name, feature_set, k, fold, alphas, n_folds = task
+    frame = imputed_fold(name, feature_set, k, fold, n_folds)
+    val = frame.pop('validation').to_numpy(dtype=bool)
+    y = frame.pop('target').to_numpy()
+    X = frame.to_numpy()
+    rows = []
+    for alpha in alphas:
+        pred = np.clip(Ridge(alpha=alpha, random_state=SEED).fit(X[~val], y[~val]).predict(X[val]), 1, 8)
+        err = pred - y[val]
+        rows.append((name, feature_set, k, alpha, fold, np.abs(err).mean(), np.sqrt((err ** 2).mean())))
+    return rows
+
+
+def search(names=None, neighbors=NEIGHBORS, alphas=ALPHAS, feature_sets=None, n_folds=N_FOLDS, jobs=None):
+    """Cross-validate the grid for each position (default: all); one row per configuration, best first."""
+    names = names or list(POSITIONS)
+    feature_sets = feature_sets or list(FEATURE_SETS)
+    alphas = tuple(alphas)
+    tasks = [(name, fs, k, fold, alphas, n_folds)
+             for name in names for fs in feature_sets for k in neighbors for fold in range(n_folds)]
+    jobs = jobs or os.cpu_count() or 1
+    for name in names:
+        _training(name)
+    rows = []
+    if jobs == 1:
+        for task in tasks:
+            rows.extend(_score_fold(task))
+    else:
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        with ctx.Pool(jobs) as pool:
+            for result in pool.imap_unordered(_score_fold, tasks):
+                rows.extend(result)
+    folds = pd.DataFrame(rows, columns=['position', 'features', 'k', 'alpha', 'fold', 'mae', 'rmse'])
+    results = (folds.groupby(['position', 'features', 'k', 'alpha'], sort=False)
+               .agg(mae=('mae', 'mean'), mae_std=('mae', 'std'), rmse=('rmse', 'mean'))
+               .reset_index())
+    results['position'] = pd.Categorical(results['position'], categories=names, ordered=True)
+    results = results.sort_values(['position', 'mae', 'features', 'k', 'alpha'], ignore_index=True)
+    results['position'] = results['position'].astype(str)
+    return results
+
+
+def best_configs(results):
+    """Lowest-MAE row per position, with the notebook setting's MAE alongside (NaN when it was not in the grid)."""
+    best = results.groupby('position', sort=False).head(1).set_index('position')
+    baseline = results[(results['features'] == BASELINE[0]) & (results['k'] == BASELINE[1])
+                       & (results['alpha'] == BASELINE[2])].set_index('position')['mae']
+    best['baseline_mae'] = baseline.reindex(best.index)
+    return best.reset_index()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Cross-validate imputer k, ridge alpha and feature set for the round models.')
+    parser.add_argument('positions', nargs='*', help=f'default: all ({", ".join(POSITIONS)})')
+    parser.add_argument('--neighbors', type=int, nargs='+', default=list(NEIGHBORS), help='imputer k values')
+    parser.add_argument('--alphas', type=float, nargs='+', default=list(ALPHAS), help='Ridge alpha values')
+    parser.add_argument('--features', nargs='+', choices=list(FEATURE_SETS), help='feature sets (default: all)')
+    parser.add_argument('--folds', type=int, default=N_FOLDS)
+    parser.add_argument('--jobs', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument('-o', '--output', help='write every configuration\'s scores to this CSV')
+    args = parser.parse_args(argv)
+    names = [n.lower() for n in args.positions] or list(POSITIONS)
+    unknown = [n for n in names if n not in POSITIONS]
+    if unknown:
+        print(f'Unknown position(s): {", ".join(unknown)}. Choose from: {", ".join(POSITIONS)}')
+        return 2
+
+    t0 = time.perf_counter()
+    results = search(names, args.neighbors, args.alphas, args.features, args.folds, args.jobs)
+    n_configs = len(results) // len(names)
+    print(f'{n_configs} configurations x {args.folds} folds per position in {time.perf_counter() - t0:.1f}s')
+    for row in best_configs(results).itertuples(index=False):
+        print(f'{row.position}: {row.features}, k={row.k}, alpha={row.alpha:g}: MAE {row.mae:.3f} '
+              f'(+/- {row.mae_std:.3f}, RMSE {row.rmse:.3f}); notebook setting MAE {row.baseline_mae:.3f}')
+    if args.output:
+        results.to_csv(args.output, index=False)
+        print(f'Wrote {args.output}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
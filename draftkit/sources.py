@@ -0,0 +1,309 @@
+"""
+Raw sources, read once per process and shared by every position.
+- Combine, ras.csv, the PFF season summaries and the MockDraftable arm-length files are loaded on first use
+  and cached; building all five positions parses each file once instead of five times.
+- The combine is kept typed (categorical Pos/School, int16 Year) and grouped by Pos, on disk like the PFF
+  seasons; load_combine(positions, years) slices a position's block instead of filtering the whole file.
+- PFF tables are cached with every PFF position and a 'position' column; each position dedupes its own copy
+  by its priority (build_pff). Parsed seasons also persist across runs in data/cache/ (cache.py).
+- The 2025 combine master list is read and parsed once for every position, then partitioned by its
+  Position column; each position takes the partitions its config lists.
+- Cached frames are shared: callers copy before mutating.
+"""
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
+from .cache import cached_frame
+from .formats import broad_to_inches, column, ht_to_inches, numeric
+from .paths import DATA_RAW, PFF_DIR
+
+COMBINE_FILE = 'nfl_combine_2010_to_2023.csv'
+RAS_PATH = os.path.join(DATA_RAW, 'ras.csv')
+# Columns read from the combine file and their dtypes; measured values stay float64 so outputs keep their digits
+COMBINE_DTYPES = {
+    'Year': 'int16', 'Player': 'str', 'Pos': 'category', 'School': 'category', 'Height': 'str',
+    'Weight': 'float64', '40yd': 'float64', 'Vertical': 'float64', 'Bench': 'float64', 'Broad Jump': 'float64',
+    '3Cone': 'float64', 'Shuttle': 'float64', 'Drafted': 'bool', 'Round': 'float32', 'Pick': 'float32',
+}
+# Bump when _parse_combine changes
+COMBINE_CACHE_VERSION = 1
+PFF_YEARS = range(2014, 2026)
+PFF_KEYS = ['Player', 'School', 'Year']
+# Bump when _parse_pff_season changes so cached seasons are rebuilt
+PFF_CACHE_VERSION = 1
+MASTER_LIST_2025 = 'GabrielGTB 2025 NFL Combine - Master List.csv'
+# Bump when _parse_master_list changes
+SHEETS_CACHE_VERSION = 1
+
+# table -> folder, file pattern, columns kept (all positions need a subset), numeric columns, columns a file must have
+PFF_TABLES = {
+    'pass_rush': {
+        'folder': 'Pass_Rush',
+        'pattern': '{}_pass_rush_summary.csv',
+        'cols': ['true_pass_set_pass_rush_win_rate', 'pass_rush_win_rate', 'snap_counts_pass_rush'],
+        'numeric': [],
+        'required': ['player', 'true_pass_set_pass_rush_win_rate'],
+    },
+    'run_defense': {
+        'folder': 'Run_Defense',
+        'pattern': '{}_run_defense_summary.csv',
+        'cols': ['stop_percent', 'missed_tackle_rate', 'avg_depth_of_tackle', 'snap_counts_run', 'forced_fumbles'],
+        'numeric': ['stop_percent', 'missed_tackle_rate', 'avg_depth_of_tackle', 'snap_counts_run', 'forced_fumbles'],
+        'required': ['stop_percent'],
+    },
+    'coverage': {
+        'folder': 'Pass_Coverage',
+        'pattern': '{}_defense_coverage_summary.csv',
+        'cols': ['yards_per_coverage_snap', 'forced_incompletion_rate', 'snap_counts_coverage', 'coverage_percent',
+                 'interceptions', 'pass_break_ups', 'coverage_snaps_per_target', 'qb_rating_against', 'catch_rate',
+                 'avg_depth_of_target'],
+        'numeric': ['yards_per_coverage_snap', 'forced_incompletion_rate', 'snap_counts_coverage', 'coverage_percent',
+                    'interceptions', 'pass_break_ups', 'coverage_snaps_per_target', 'qb_rating_against', 'catch_rate',
+                    'avg_depth_of_target'],
+        'required': ['snap_counts_coverage'],
+    },
+}
+
+
+def _parse_combine(path):
+    """The combine CSV with compact dtypes, grouped by Pos (then Year) and carrying its file row number in _row."""
+    df = pd.read_csv(path, usecols=list(COMBINE_DTYPES), dtype=COMBINE_DTYPES)
+    df['_row'] = np.arange(len(df), dtype=np.int32)
+    return df.sort_values(['Pos', 'Year'], kind='stable', ignore_index=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _combine_blocks():
+    """(combine frame indexed by file row, {Pos: (start, stop) of its contiguous block})."""
+    path = os.path.join(DATA_RAW, COMBINE_FILE)
+    df = cached_frame('combine', [path], lambda: _parse_combine(path), repr((COMBINE_CACHE_VERSION, COMBINE_DTYPES)))
+    df = df.set_index('_row').rename_axis(None)
+    codes = df['Pos'].cat.codes.to_numpy()
+    bounds = np.flatnonzero(np.diff(codes)) + 1
+    starts, stops = np.r_[0, bounds], np.r_[bounds, len(codes)]
+    categories = df['Pos'].cat.categories
+    blocks = {categories[codes[a]]: (a, b) for a, b in zip(starts, stops) if b > a and codes[a] >= 0}
+    return df, blocks
+
+
+def load_combine(positions=None, years=None):
+    """
+    Combine rows for the given Pos values and (first, last) draft years, in file order with the file's row labels.
+    A single Pos comes back as a slice of the cached frame (no copy); callers copy before mutating.
+    """
+    df, blocks = _combine_blocks()
+    if positions is None:
+        parts = [df]
+    else:
+        parts = [df.iloc[blocks[p][0]:blocks[p][1]] for p in positions if p in blocks] or [df.iloc[:0]]
+    if years is not None:
+        first, last = years
+        # Year is sorted within a Pos block, so the year range is a slice too
+        parts = [p.iloc[p['Year'].searchsorted(first, 'left'):p['Year'].searchsorted(last, 'right')]
+                 if p['Year'].is_monotonic_increasing else p[p['Year'].between(first, last)] for p in parts]
+    out = parts[0] if len(parts) == 1 else pd.concat(parts)
+    return out if out.index.is_monotonic_increasing else out.sort_index()
+
+
+@functools.lru_cache(maxsize=None)
+def load_ras():
+    return pd.read_csv(RAS_PATH)
+
+
+def _parse_pff_season(table, path, year):
+    """One season file as Player, School, position, Year + the table's columns (typed); empty if it lacks required columns."""
+    spec = PFF_TABLES[table]
+    df = pd.read_csv(path)
+    cols = ['player', 'team_name', 'position'] + spec['cols']
+    sub = df[[c for c in cols if c in df.columns]].copy()
+    if any(c not in sub.columns for c in spec['required']):
+        return pd.DataFrame()
+    if 'position' not in sub.columns:
+        sub['position'] = None
+    sub['Year'] = year
+    sub = sub.rename(columns={'player': 'Player', 'team_name': 'School'})
+    for c in spec['numeric']:
+        if c in sub.columns:
+            sub[c] = pd.to_numeric(sub[c], errors='coerce')
+    return sub
+
+
+@functools.lru_cache(maxsize=None)
+def pff_season_paths(table):
+    """[(path, season), ...] for the PFF season files of one table that exist."""
+    spec = PFF_TABLES[table]
+    paths = [(os.path.join(PFF_DIR, spec['folder'], spec['pattern'].format(year)), year) for year in PFF_YEARS]
+    return [(path, year) for path, year in paths if os.path.exists(path)]
+
+
+def load_pff_table(table):
+    """
+    All seasons of one PFF table (all positions, not deduped); None if no season file exists.
+    Parsed seasons are cached in data/cache/ (cache.py), so only new or edited season files are re-read.
+    """
+    spec = PFF_TABLES[table]
+    version = repr((PFF_CACHE_VERSION, spec))
+    files = []
+    for path, year in pff_season_paths(table):
+        sub = cached_frame(f'pff_{table}_{year}', [path], lambda: _parse_pff_season(table, path, year), version)
+        if 'Player' not in sub.columns:
+            continue
+        files.append(sub)
+        print(f'Loaded PFF {table} {year}: {len(sub)} players')
+    if not files:
+        return None
+    return pd.concat(files, ignore_index=True)
+
+
+def dedupe_by_priority(df, priority):
+    """One row per Player/School/Year; when PFF lists a player under several positions, lowest priority wins."""
+    df = df.copy()
+    df['_pos_order'] = df['position'].map(priority).fillna(99)
+    df = df.sort_values('_pos_order').drop_duplicates(subset=PFF_KEYS, keep='first')
+    return df.drop(columns=['_pos_order', 'position'], errors='ignore')
+
+
+def build_pff(cfg, load_table=load_pff_table):
+    """
+    Position PFF frame: pass rush plus cfg['pff_tables'] (table -> columns), deduped by cfg['pff_priority'].
+    'left' join keeps pass-rush rows only (Edges, DT, LB); 'union' keeps every key seen in any table (CB, S).
+    load_table(table) returns the undeduped table or None (the benchmark passes synthetic tables).
+    """
+    priority = cfg['pff_priority']
+    pass_rush = load_table('pass_rush')
+    if pass_rush is None:
+        pass_rush = pd.DataFrame(columns=PFF_KEYS + PFF_TABLES['pass_rush']['cols'])
+        print('No PFF pass rush files found.')
+    else:
+        pass_rush = dedupe_by_priority(pass_rush, priority)
+        print(f'PFF pass rush records (after dedup): {len(pass_rush)}')
+
+    extra = {}
+    for table in cfg['pff_tables']:
+        data = load_table(table)
+        extra[table] = dedupe_by_priority(data, priority) if data is not None else None
+
+    if cfg['pff_join'] == 'union':
+        all_keys = pass_rush[PFF_KEYS].drop_duplicates()
+        for data in extra.values():
+            if data is not None:
+                all_keys = pd.concat([all_keys, data[PFF_KEYS]], ignore_index=True).drop_duplicates()
+        pff_data = all_keys.merge(pass_rush, on=PFF_KEYS, how='left')
+    else:
+        pff_data = pass_rush
+
+    for table, cols in cfg['pff_tables'].items():
+        data = extra[table]
+        if data is None:
+            for c in cols:
+                pff_data[c] = None
+            print(f'No PFF {table} files found.')
+            continue
+        merge_cols = PFF_KEYS + [c for c in cols if c in data.columns]
+        pff_data = pff_data.merge(data[merge_cols], on=PFF_KEYS, how='left')
+    print(f'PFF records ({cfg["pff_join"]} of pass rush + {", ".join(cfg["pff_tables"])}): {len(pff_data)}')
+    return pff_data
+
+
+def ras_for_positions(positions, ras_df=None):
+    """RAS rows for the given ras.csv positions: Name, Year, RAS, College (one per Name/Year); ras_df defaults to ras.csv."""
+    ras_df = load_ras() if ras_df is None else ras_df
+    ras_df = ras_df[ras_df['Pos'].isin(positions)].copy()
+    ras_df['RAS'] = pd.to_numeric(ras_df['RAS'], errors='coerce')
+    ras_df['Year'] = ras_df['Year'].astype(int)
+    return ras_df[['Name', 'Year', 'RAS', 'College']].drop_duplicates(subset=['Name', 'Year'])
+
+
+@functools.lru_cache(maxsize=None)
+def load_arm_length(prefix):
+    """data/raw/mockdraftable_<prefix>_arm_length.csv as Player, Year, arm_length_inches (empty if not scraped yet)."""
+    path = os.path.join(DATA_RAW, f'mockdraftable_{prefix}_arm_length.csv')
+    if not os.path.exists(path):
+        print(f'No {os.path.basename(path)}; arm_length_inches will be empty.')
+        return pd.DataFrame(columns=['Player', 'Year', 'arm_length_inches'])
+    arm_df = pd.read_csv(path)
+    arm_df['Year'] = arm_df['Year'].astype(int)
+    # Keep one row per (Player, Year) - take first if duplicates
+    arm_df = arm_df.drop_duplicates(subset=['Player', 'Year'], keep='first')
+    arm_df = arm_df[['Player', 'Year', 'arm_length_inches']].copy()
+    arm_df['arm_length_inches'] = pd.to_numeric(arm_df['arm_length_inches'], errors='coerce')
+    print(f'Arm length {prefix}: {len(arm_df)} records ({arm_df["arm_length_inches"].notna().sum()} with values)')
+    return arm_df
+
+
+def _parse_master_list(path):
+    """Every row of the 2025 master list, typed: Pos is the sheet's Position (stripped, uppercased)."""
+    c25 = pd.read_csv(path)
+    school = c25['School'].where(c25['School'].isna(),
+                                 c25['School'].astype(str).str.replace('Syracruse', 'Syracuse').str.strip())
+    return pd.DataFrame({
+        'Year': 2025,
+        'Player': c25['Name'].to_numpy(),
+        'Pos': c25['Position'].astype(str).str.strip().str.upper().to_numpy(),
+        'School': school.to_numpy(),
+        'Height': ht_to_inches(column(c25, 'Height (FIIE)')),
+        'Weight': numeric(c25, 'Weight (lbs.)'),
+        '40yd': numeric(c25, '40-yard Dash (seconds)'),
+        'Vertical': numeric(c25, 'Vertical Jump (inches)'),
+        'Bench': numeric(c25, 'Bench Press (reps)'),
+        'Broad Jump': broad_to_inches(column(c25, 'Broad Jump (FFII)')),
+        '3Cone': numeric(c25, 'Three-cone Drill (seconds)'),
+        'Shuttle': numeric(c25, '20-yard Shuttle (seconds)'),
+        'Drafted': True,
+        'Round': np.nan,
+        'Pick': np.nan,
+        'RAS': numeric(c25, 'RAS'),
+        'arm_length_inches': numeric(c25, 'Arm Length (inches)'),
+    }, index=range(len(c25)))
+
+
+def _partitioned_sheet(name, filename, parse):
+    """{sheet Position: rows} for a raw sheet parsed once (disk-cached like the PFF seasons); None if the file is missing."""
+    path = os.path.join(DATA_RAW, filename)
+    if not os.path.exists(path):
+        return None
+    df = cached_frame(name, [path], lambda: parse(path), repr((SHEETS_CACHE_VERSION, parse.__name__)))
+    parts = {pos: part.reset_index(drop=True) for pos, part in df.groupby('Pos', sort=False)}
+    print(f'Loaded {filename}: {len(df)} rows, {len(parts)} positions')
+    return parts
+
+
+@functools.lru_cache(maxsize=None)
+def load_master_list_2025():
+    return _partitioned_sheet('master_list_2025', MASTER_LIST_2025, _parse_master_list)
+
+
+def sheet_class(partitions, positions):
+    """Copy of the rows for the given sheet positions, in sheet order; None if the sheet is missing."""
+    if partitions is None:
+        return None
+    parts = [partitions[p] for p in positions if p in partitions]
+    if not parts:
+        # Column layout of the sheet, no rows
+        return next(iter(partitions.values())).iloc[:0].copy() if partitions else pd.DataFrame()
+    return pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0].copy()
+
+
+@functools.lru_cache(maxsize=None)
+def load_draft_picks_2025():
+    """data/raw/2025_draft_picks.csv (PFR: Rnd, Pick, Tm, Player, Pos, School, pfr_id); None if missing."""
+    path = os.path.join(DATA_RAW, '2025_draft_picks.csv')
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path)
+
+
+def preload(cfgs):
+    """Load every shared source the given position configs read, so forked workers inherit them already parsed."""
+    load_combine()
+    load_ras()
+    for table in {'pass_rush'} | {t for cfg in cfgs for t in cfg['pff_tables']}:
+        load_pff_table(table)
+    for cfg in cfgs:
+        load_arm_length(cfg['output_prefix'])
+    if any(cfg['testing'] == 'sheets' for cfg in cfgs):
+        load_master_list_2025()
+        load_draft_picks_2025()
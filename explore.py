@@ -1,6 +1,6 @@
-import nflreadpy as nfl
-import pandas as pd
+from draftkit.pbp import load_defense
 
-df = nfl.import_pbp_data([2025], ['reg'], downcast=True)
+# Per-defender regular-season totals, streamed from play-by-play and cached per season (draftkit/pbp.py)
+df = load_defense([2025])
 
-df.head()
\ No newline at end of file
+df.head()
@@ -0,0 +1,52 @@
+"""Cache entries are reused while their sources are unchanged and are never left half-written."""
+import os
+
+import pandas as pd
+import pytest
+
+from draftkit import cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv('DRAFTKIT_NO_CACHE', raising=False)
+    monkeypatch.setattr(cache, 'CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(cache, 'FORMAT', 'pickle')
+    source = tmp_path / 'source.csv'
+    source.write_text('a\n1\n2\n')
+    return tmp_path / 'cache', str(source)
+
+
+def test_entry_is_reused_until_the_source_changes(cache_dir):
+    _, source = cache_dir
+    builds = []
+
+    def build():
+        builds.append(1)
+        return pd.read_csv(source)
+
+    cache.cached_frame('t', [source], build)
+    cache.cached_frame('t', [source], build)
+    assert len(builds) == 1
+    with open(source, 'a') as f:
+        f.write('3\n')
+    assert cache.cached_frame('t', [source], build)['a'].tolist() == [1, 2, 3]
+    assert len(builds) == 2
+
+
+def test_failed_write_keeps_the_previous_entry(cache_dir, monkeypatch):
+    directory, source = cache_dir
+    cache.cached_frame('t', [source], lambda: pd.read_csv(source))
+    with open(source, 'a') as f:
+        f.write('3\n')
+
+    def torn(self, path, *args, **kwargs):
+        with open(path, 'wb') as f:
+            f.write(b'partial')
+        raise OSError('disk full')
+
+    monkeypatch.setattr(pd.DataFrame, 'to_pickle', torn)
+    with pytest.raises(OSError):
+        cache.cached_frame('t', [source], lambda: pd.read_csv(source))
+    assert sorted(os.listdir(directory)) == ['t.json', 't.pickle']
+    assert cache._read(str(directory / 't.pickle'))['a'].tolist() == [1, 2]
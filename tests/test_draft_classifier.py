@@ -0,0 +1,24 @@
+"""A saved draft classifier is rejected once the training CSV it was fitted on changes."""
+import shutil
+
+import pytest
+
+from draftkit import draft_classifier
+from draftkit.round_model import training_path_for
+
+pytest.importorskip('sklearn')
+
+
+def test_changed_training_file_invalidates_the_artifact(tmp_path, monkeypatch):
+    monkeypatch.setattr(draft_classifier, 'MODELS_DIR', str(tmp_path / 'models'))
+    training = str(tmp_path / 'dt_training.csv')
+    shutil.copy(training_path_for('dt'), training)
+    draft_classifier.fit_classifiers('dt', training_path=training, jobs=1)
+    assert draft_classifier.load_classifiers('dt')['training_rows'] > 0
+
+    with open(training) as f:
+        lines = f.readlines()
+    with open(training, 'w') as f:
+        f.writelines(lines[:-1])
+    with pytest.raises(ValueError, match='training CSV'):
+        draft_classifier.load_classifiers('dt')
@@ -0,0 +1,14 @@
+"""Simulated pick counts depend on the seed, not on how many worker processes draw them."""
+import numpy as np
+import pandas as pd
+
+from draftkit import draft_sim
+
+
+def test_counts_do_not_depend_on_jobs(monkeypatch):
+    monkeypatch.setattr(draft_sim, 'BATCH_SIMS', 100)
+    rng = np.random.default_rng(0)
+    prospects = pd.DataFrame({'predicted_round': rng.uniform(1, 8, 40), 'residual_std': rng.uniform(0.5, 1.5, 40)})
+    serial = draft_sim.simulate(prospects, n_sims=2050, seed=7, jobs=1)
+    assert serial.sum() == 2050 * len(prospects)
+    np.testing.assert_array_equal(draft_sim.simulate(prospects, n_sims=2050, seed=7, jobs=2), serial)
@@ -0,0 +1,165 @@
+"""MockDraftable scraper against a stub http.server on localhost: rate limiting, retries, parsing, checkpoints."""
+import csv
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from draftkit.mockdraftable import PageFetcher, SearchCrawler, resolve_arm_length, scrape_arm_lengths
+
+# slug -> (arm length cell, draft class)
+PAGES = {
+    'jaycee-horn': ('33"', 2021),
+    'derek-stingley-jr': ('30 7/8"', 2022),
+    'sauce-gardner': ('33⅓"', 2022),
+    'jalen-ramsey': ('33 3/8"', 2016),
+    'jalen-ramsey-2020': ('31 1/2"', 2020),
+    'no-arms': (None, 2019),
+}
+# 45 listed players, 20 a page; the pager only links to page 2
+LISTING = [(f'player-{i}', f'Player {i}', 2010 + i % 15) for i in range(45)]
+PAGE_SIZE = 20
+
+
+def player_html(arm, year):
+    arm_row = f'<tr><td>Arm Length</td><td>{arm}</td></tr>' if arm else ''
+    return f'<html><p>Draft Class: {year}</p><table><tr><td>Height</td><td>6\' 1"</td></tr>{arm_row}</table></html>'
+
+
+def search_html(page):
+    rows = LISTING[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+    body = ''.join(f'<div><a href="/player/{slug}?position=CB">{name}</a><span>{year}</span></div>'
+                   for slug, name, year in rows)
+    return f'<html>{body}<nav><a href="?page=1">1</a><a href="?page=2">2</a></nav></html>'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send(self, code, body='', headers=()):
+        data = body.encode('utf-8')
+        self.send_response(code)
+        for k, v in headers:
+            self.send_header(k, v)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        server = self.server
+        with server.lock:
+            server.hits.append((url.path, time.monotonic()))
+            failures = server.failures.get(url.path)
+            code = failures.pop(0) if failures else None
+        if code is not None:
+            return self._send(code, 'busy', [('Retry-After', '0')])
+        if url.path == '/search':
+            return self._send(200, search_html(int(parse_qs(url.query)['page'][0])))
+        slug = url.path.rsplit('/', 1)[-1]
+        if url.path.startswith('/player/') and slug in PAGES:
+            return self._send(200, player_html(*PAGES[slug]))
+        return self._send(404, 'not found')
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.lock = threading.Lock()
+    server.hits = []
+    server.failures = {}
+    thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+    thread.start()
+    server.base_url = f'http://127.0.0.1:{server.server_address[1]}'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_rate_limit_caps_requests_across_workers(stub, tmp_path):
+    fetcher = PageFetcher('CB', base_url=stub.base_url, rate=10, cache_dir=str(tmp_path))
+    slugs = [f'missing-{i}' for i in range(8)]
+    threads = [threading.Thread(target=fetcher.get, args=(s,)) for s in slugs]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    times = sorted(t for _, t in stub.hits)
+    assert len(times) == 8 and fetcher.fetched == 8
+    # One token up front, then one every 1/rate seconds
+    assert times[-1] - times[0] >= 0.7 - 0.05
+
+
+def test_429_and_5xx_are_retried(stub, tmp_path):
+    stub.failures['/player/jaycee-horn'] = [429, 503]
+    fetcher = PageFetcher('CB', base_url=stub.base_url, rate=100, cache_dir=str(tmp_path))
+    assert resolve_arm_length(fetcher, 'Jaycee Horn', 2021) == 33.0
+    assert [p for p, _ in stub.hits] == ['/player/jaycee-horn'] * 3
+    assert fetcher.fetched == 1
+
+
+def test_persistent_errors_raise_and_are_not_cached(stub, tmp_path):
+    stub.failures['/player/jaycee-horn'] = [500] * 10
+    fetcher = PageFetcher('CB', base_url=stub.base_url, rate=100, cache_dir=str(tmp_path))
+    with pytest.raises(Exception):
+        fetcher.get('jaycee-horn')
+    assert not list(tmp_path.iterdir())
+
+
+def test_pages_and_404s_are_cached(stub, tmp_path):
+    fetcher = PageFetcher('CB', base_url=stub.base_url, rate=100, cache_dir=str(tmp_path))
+    assert fetcher.get('sauce-gardner') is not None
+    assert fetcher.get('nobody') is None
+    hits = len(stub.hits)
+    again = PageFetcher('CB', base_url=stub.base_url, rate=100, cache_dir=str(tmp_path))
+    assert again.get('sauce-gardner') is not None and again.get('nobody') is None
+    assert len(stub.hits) == hits and again.fetched == 0
+
+
+@pytest.mark.parametrize('name, year, expected', [
+    ('Jaycee Horn', 2021, 33.0),
+    ('Derek Stingley Jr.', 2022, 30.88),
+    ('Sauce Gardner', 2022, 33.33),
+    ('Jalen Ramsey', 2020, 31.5),  # the slug is a 2016 player's; the -2020 page is the right one
+    ('No Arms', 2019, None),
+    ('Not Listed', 2023, None),
+])
+def test_arm_length_parsing(stub, tmp_path, name, year, expected):
+    fetcher = PageFetcher('CB', base_url=stub.base_url, rate=100, cache_dir=str(tmp_path))
+    assert resolve_arm_length(fetcher, name, year) == expected
+
+
+def test_search_crawl_follows_pages_past_the_pager_and_resumes(stub, tmp_path):
+    crawler = SearchCrawler('CB', base_url=stub.base_url, rate=100, workers=2, cache_dir=str(tmp_path))
+    listing = crawler.crawl()
+    assert list(listing['slug']) == [slug for slug, _, _ in LISTING]
+    assert list(listing['Year']) == [year for _, _, year in LISTING]
+    assert crawler.fetched == 3
+    again = SearchCrawler('CB', base_url=stub.base_url, rate=100, workers=2, cache_dir=str(tmp_path))
+    assert len(again.crawl()) == len(LISTING) and again.fetched == 0
+
+
+def read_rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return {(r['Player'], int(r['Year'])): r['arm_length_inches'] for r in csv.DictReader(f)}
+
+
+def test_scrape_resumes_from_checkpoint_and_keeps_rows(stub, tmp_path):
+    output = tmp_path / 'arm.csv'
+    partial = tmp_path / 'arm.csv.partial'
+    output.write_text('Player,Year,School,arm_length_inches\nSauce Gardner,2022,Cincinnati,33.5\n', encoding='utf-8')
+    # Left behind by an interrupted run: Horn resolved before it stopped
+    partial.write_text('Player,Year,School,arm_length_inches\nJaycee Horn,2021,South Carolina,32.0\n', encoding='utf-8')
+    players = [('Sauce Gardner', 2022, 'Cincinnati'), ('Jaycee Horn', 2021, 'South Carolina'),
+               ('Derek Stingley Jr.', 2022, 'LSU'), ('Not Listed', 2023, 'Nowhere')]
+    rows = scrape_arm_lengths('cb', base_url=stub.base_url, rate=100, players=players, output_path=str(output),
+                              cache_dir=str(tmp_path / 'pages'))
+    assert len(rows) == 4
+    assert read_rows(output) == {('Sauce Gardner', 2022): '33.5', ('Jaycee Horn', 2021): '32.0',
+                                 ('Derek Stingley Jr.', 2022): '30.88', ('Not Listed', 2023): ''}
+    assert not partial.exists()
+    # Only the two unresolved players hit the server
+    assert sorted(p for p, _ in stub.hits) == ['/player/derek-stingley-jr', '/player/not-listed']
@@ -0,0 +1,82 @@
+"""Play-by-play defensive aggregation against a small nflverse-layout fixture, and season file refreshes."""
+import datetime
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from draftkit import pbp
+
+FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'play_by_play_2023_sample.csv')
+# Regular-season totals in the fixture (the POST game must not count)
+EXPECTED = {
+    '00-0033040': dict(player_name='T.Watt', games_with_event=2, sacks=1.5, qb_hits=1, solo_tackles=2,
+                       assist_tackles=1, tackles_for_loss=1),
+    '00-0027911': dict(player_name='C.Heyward', games_with_event=2, sacks=0.5, assist_tackles=1),
+    '00-0034815': dict(player_name='N.Bosa', games_with_event=1, qb_hits=1, solo_tackles=1, tackles_for_loss=1),
+    '00-0034385': dict(player_name='M.Fitzpatrick', games_with_event=1, interceptions=1, pass_defended=1),
+    '00-0033869': dict(player_name='M.Garrett', games_with_event=1, sacks=1.0, forced_fumbles=1),
+    '00-0034980': dict(player_name='D.Ward', games_with_event=1, pass_defended=1),
+}
+
+
+def expected_frame():
+    rows = [{'season': 2023, 'player_id': pid, **{s: 0 for s in pbp.STATS}, **stats} for pid, stats in EXPECTED.items()]
+    df = pd.DataFrame(rows)[pbp.OUTPUT_COLS].sort_values('player_id', ignore_index=True)
+    return df.astype({'sacks': float})
+
+
+@pytest.mark.parametrize('chunksize', [1, 3, 1000])
+def test_aggregate_defense_matches_fixture_totals(chunksize):
+    df = pbp.aggregate_defense(pbp.iter_chunks(FIXTURE, chunksize))
+    pd.testing.assert_frame_equal(df, expected_frame(), check_dtype=False)
+
+
+def test_postseason_plays_are_skipped():
+    seasons = pd.concat(pbp.iter_chunks(FIXTURE, 4))['season_type']
+    assert set(seasons) == {pbp.SEASON_TYPE}
+    assert len(seasons) == len(pd.read_csv(FIXTURE).query('season_type == "REG"'))
+
+
+def test_load_defense_season_from_a_local_file(monkeypatch):
+    monkeypatch.setenv('DRAFTKIT_NO_CACHE', '1')
+    df = pbp.load_defense_season(2023, path=FIXTURE, chunksize=2)
+    pd.testing.assert_frame_equal(df, expected_frame(), check_dtype=False)
+
+
+@pytest.fixture
+def remote(tmp_path):
+    """A file:// season URL template; the remote file holds the text 'v1' until the test changes it."""
+    (tmp_path / 'remote').mkdir()
+    source = tmp_path / 'remote' / 'play_by_play_2025.csv'
+    source.write_text('v1')
+    return source, f'file://{tmp_path}/remote/play_by_play_{{season}}.csv', str(tmp_path / 'cache')
+
+
+def test_completed_season_is_downloaded_once(remote, monkeypatch):
+    source, url, cache_dir = remote
+    monkeypatch.setattr(pbp, 'current_season', lambda today=None: 2026)
+    path = pbp.season_file(2025, url=url, cache_dir=cache_dir)
+    source.write_text('v2')
+    old = time.time() - 30 * 24 * 3600
+    os.utime(path, (old, old))
+    assert open(pbp.season_file(2025, url=url, cache_dir=cache_dir)).read() == 'v1'
+    assert open(pbp.season_file(2025, url=url, cache_dir=cache_dir, refresh=True)).read() == 'v2'
+
+
+def test_current_season_is_downloaded_again_when_stale(remote, monkeypatch):
+    source, url, cache_dir = remote
+    monkeypatch.setattr(pbp, 'current_season', lambda today=None: 2025)
+    path = pbp.season_file(2025, url=url, cache_dir=cache_dir)
+    source.write_text('v2')
+    assert open(pbp.season_file(2025, url=url, cache_dir=cache_dir)).read() == 'v1'
+    old = time.time() - pbp.CURRENT_SEASON_MAX_AGE - 60
+    os.utime(path, (old, old))
+    assert open(pbp.season_file(2025, url=url, cache_dir=cache_dir)).read() == 'v2'
+    assert not os.path.exists(f'{path}.part')
+
+
+def test_current_season_rolls_over_in_september():
+    assert pbp.current_season(datetime.date(2026, 2, 10)) == 2025
+    assert pbp.current_season(datetime.date(2026, 9, 1)) == 2026
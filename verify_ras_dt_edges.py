@@ -2,14 +2,20 @@
 One-off RAS triple-check for DT and Edges.
 - Load processed CSVs + 2026 drafted; find missing RAS.
 - For each missing: look in ras.csv (DT or DE/EDGE) for same Year + same normalized school.
-- If exactly one RAS row at that school+year, or one with matching last name -> safe alias.
+- If exactly one RAS row at that school+year, or one with matching last name -> safe alias
+  (candidates come from draftkit/candidates.py; several last-name matches -> the best-scoring one).
+- Aliases are listed most confident first.
 Run from project root: python verify_ras_dt_edges.py
 """
 import os
 import re
+import sys
 import pandas as pd
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, PROJECT_ROOT)
+
+from draftkit.candidates import CandidateIndex, last_name
 DATA_RAW = os.path.join(PROJECT_ROOT, 'data', 'raw')
 DATA_PROCESSED = os.path.join(PROJECT_ROOT, 'data', 'processed')
 
@@ -159,33 +165,28 @@ def find_confirmed_aliases(missing_df, ras_n, normalize_combine_school_fn, ras_s
     """For each missing row, if RAS has same school+year with exactly one candidate or last-name match, return (combine_name_n, ras_name_n) or school fix."""
     ras_n = ras_n.copy()
     ras_n['College_n'] = ras_n['College'].apply(lambda x: ras_school_dict.get(str(x).strip(), str(x).strip()) if pd.notna(x) else x)
+    index = CandidateIndex(ras_n, ras_n['Name_n'], ras_n['College_n'], ras_n['Year'])
     name_aliases = []
-    school_additions = []
-    for _, row in missing_df.iterrows():
-        player_n = normalize_player_name(row['Player'])
-        school_n = normalize_combine_school_fn(row['School'])
-        year = int(row['Year'])
-        m = (ras_n['College_n'] == school_n) & (ras_n['Year'] == year)
-        cand = ras_n.loc[m]
-        if cand.empty:
+    for row in missing_df.itertuples(index=False):
+        player_n = normalize_player_name(row.Player)
+        school_n = normalize_combine_school_fn(row.School)
+        year = int(row.Year)
+        at_school = index.school_rows(school_n, year) if pd.notna(school_n) else []
+        if not at_school:
             continue
-        combine_last = player_n.split()[-1] if player_n else ''
-        match = None
-        if len(cand) == 1:
-            match = cand.iloc[0]
+        if len(at_school) == 1:
+            match = index.frame.iloc[at_school[0]]
+            score = index.score(at_school[0], player_n, school_n, last_name(player_n))[0]
         else:
-            for _, c in cand.iterrows():
-                if combine_last and combine_last in c['Name_n']:
-                    match = c
-                    break
-        if match is not None:
-            ras_name_n = match['Name_n']
-            if ras_name_n != player_n:
-                name_aliases.append((row['Player'], row['School'], year, match['Name'], player_n, ras_name_n))
-            # Check if combine school needed (e.g. Montana St. -> Montana State)
-            ras_college_raw = match.get('College', '')
-            if str(ras_college_raw).strip() and normalize_combine_school_fn(row['School']) != ras_n.loc[m].iloc[0]['College_n']:
-                pass  # school already matches after our normalize
+            # Best-ranked same-school candidate containing the last name (not just the first one listed)
+            ranked = [c for c in index.suggest(player_n, school_n, year, limit=len(at_school), require_last_name=True) if c[1]]
+            if not ranked:
+                continue
+            score, match = ranked[0][0], ranked[0][3]
+        if match['Name_n'] != player_n:
+            name_aliases.append((row.Player, row.School, year, match['Name'], player_n, match['Name_n'], round(score, 3)))
+    # Most confident first
+    name_aliases.sort(key=lambda t: -t[6])
     return name_aliases
 
 
@@ -207,7 +208,7 @@ def main():
     print(f"DT missing RAS: {len(missing_dt)}")
     print(f"DT confirmed name aliases (add to ras_name_alias): {len(dt_confirmed)}")
     for t in dt_confirmed:
-        print(f"  # {t[0]} ({t[2]}): RAS '{t[3]}' -> alias '{t[4]}': '{t[5]}'")
+        print(f"  # {t[0]} ({t[2]}): RAS '{t[3]}' -> alias '{t[4]}': '{t[5]}' (score {t[6]:.2f})")
 
     # ----- Edges -----
     print("\n=== Edges ===")
@@ -221,7 +222,7 @@ def main():
     print(f"Edges missing RAS: {len(missing_edge)}")
     print(f"Edges confirmed name aliases (add to player_nickname_map or ras alias): {len(edge_confirmed)}")
     for t in edge_confirmed[:40]:
-        print(f"  # {t[0]} ({t[2]}): RAS '{t[3]}' -> alias '{t[4]}': '{t[5]}'")
+        print(f"  # {t[0]} ({t[2]}): RAS '{t[3]}' -> alias '{t[4]}': '{t[5]}' (score {t[6]:.2f})")
     if len(edge_confirmed) > 40:
         print(f"  ... and {len(edge_confirmed) - 40} more")
 